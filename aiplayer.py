@@ -0,0 +1,160 @@
+"""
+Computer opponents that play the same board as the people at the window.
+
+An AIPlayer keeps its own headless game of the board and plays it by
+clicking cells through BoggleGame.doOneClick, just as a person does, so
+its words are checked and scored by the same code.  It never blocks the
+game loop: each call of step() searches for a few milliseconds with an
+AnytimeSolver and, when its pacing says so, plays the best word it knows.
+
+    python3 aiplayer.py [classic|big|super] [seed] [skill]
+
+plays one simulated three minute round and prints what the computer found.
+"""
+
+import sys
+import time
+
+from brandom import RandomStream
+from bogglecubes import getDiceSet
+from bogglesolver import AnytimeSolver, findPath
+from bogglegameEC import BoggleGame
+from scoring import CLASSIC, getRules
+from headlessboard import HeadlessBoggleBoard
+
+class AIPlayer:
+    """
+    A computer opponent.  skill, from 0 to 1, is the chance it knows any
+    given word on the board; it always plays the highest scoring word it
+    knows and has not played yet, under the ScoringRules rules.  pace is
+    the average number of seconds between its words.
+
+    >>> from lexicon import Lexicon
+    >>> board = HeadlessBoggleBoard(2, 2)
+    >>> board.setCode(bytes([3, 1, 20, 19]))
+    >>> player = AIPlayer(board, Lexicon(["cat", "cats", "act", "scat"]), skill=1.0, pace=1.0, seed=1)
+    >>> player.newRound(now=0.0)
+    >>> [player.step(now=t) for t in (0.5, 2.0, 4.0, 6.0, 8.0, 10.0)]
+    [None, 'CATS', 'SCAT', 'ACT', 'CAT', None]
+    >>> player.getScore()
+    4
+
+    Under Big Boggle rules, three letter words are not played:
+
+    >>> from scoring import getRules
+    >>> player = AIPlayer(board, Lexicon(["cat", "cats", "act", "scat"]), skill=1.0, pace=1.0,
+    ...                   seed=1, rules=getRules("big"))
+    >>> player.newRound(now=0.0)
+    >>> [player.step(now=t) for t in (2.0, 4.0, 6.0)]
+    ['CATS', 'SCAT', None]
+    """
+
+    __slots__ = ["_board", "_lexicon", "_game", "_skill", "_pace", "_random",
+                 "_solver", "_knows", "_nextAt", "_rules"]
+
+    def __init__(self, board, lexicon, skill=0.5, pace=5.0, seed=None,
+                 rules=CLASSIC):
+        """
+        board is the board the people play on, whose letters this player
+        copies at each newRound(); lexicon is the Lexicon to search.
+        """
+        self._board = board
+        self._lexicon = lexicon
+        self._skill = skill
+        self._pace = pace
+        self._random = RandomStream(seed)
+        self._rules = rules
+        self._game = BoggleGame(None, board=HeadlessBoggleBoard(board.getRows(), board.getCols()),
+                                lexicon=lexicon, rules=rules)
+        self._solver = None
+        self._knows = {}
+        self._nextAt = None
+
+    def getGame(self):
+        """Returns this player's own (headless) game."""
+        return self._game
+
+    def getFoundWords(self):
+        return self._game.getFoundWords()
+
+    def getScore(self):
+        return self._game.getScore()
+
+    def newRound(self, now=None):
+        """
+        Starts a new round on the letters now showing on the people's board.
+        now is the current time.perf_counter() value.
+        """
+        if now is None:
+            now = time.perf_counter()
+        self._game.reset()
+        board = self._game.getBoard()
+        board.setCode(self._board.getCode())
+        # only words the rules accept, so every word it plays is found
+        self._solver = AnytimeSolver(board.getLetters(), board.getRows(), board.getCols(),
+                                     self._lexicon, minLength=self._rules.getMinLength())
+        self._knows = {}
+        self._nextAt = now + self.__wait()
+
+    def __wait(self):
+        # somewhere between half and one and a half times the pace
+        return self._pace * (0.5 + self._random.random())
+
+    def step(self, now=None, budget=0.002):
+        """
+        Searches for up to budget seconds and, if it is time, plays a word.
+        Returns the word played, or None.  Call it from the game loop.
+        """
+        if self._solver is None:
+            return None
+        if now is None:
+            now = time.perf_counter()
+        if not self._solver.isDone():
+            self._solver.run(deadline=time.perf_counter() + budget)
+        if now < self._nextAt:
+            return None
+        self._nextAt = now + self.__wait()
+        word = self.__choose()
+        if word is not None:
+            self.__play(word)
+        return word
+
+    def __choose(self):
+        """Returns the best word this player knows and has not played, or None."""
+        played = self._game.getFoundWords()
+        minLength = self._rules.getMinLength()
+        for word in self._solver.getBest(score=self._rules.score):
+            if len(word) < minLength:
+                continue
+            if word not in self._knows:
+                self._knows[word] = self._random.random() < self._skill
+            if self._knows[word] and word not in played:
+                return word
+        return None
+
+    def __play(self, word):
+        """Spells word by clicking its cells, then clicks the last one again."""
+        board = self._game.getBoard()
+        cols = board.getCols()
+        path = findPath(word, board.getLetters(), board.getRows(), cols)
+        for cell in path + path[-1:]:
+            self._game.doOneClick(board.getCellCenter(cell % cols, cell // cols))
+
+
+if __name__ == "__main__":
+    from lexiconregistry import LEXICONS
+
+    variant = sys.argv[1] if len(sys.argv) > 1 else "classic"
+    rows, cols, cubes = getDiceSet(variant)
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    skill = float(sys.argv[3]) if len(sys.argv) > 3 else 0.5
+    board = HeadlessBoggleBoard(rows, cols, cubes, seed)
+    player = AIPlayer(board, LEXICONS.get("bogwords.txt"), skill=skill, seed=seed,
+                      rules=getRules(variant))
+    print(board)
+    # a three minute round, stepped as a 60 frames per second loop would
+    player.newRound(now=0.0)
+    for frame in range(180 * 60):
+        player.step(now=frame / 60.0)
+    print(" ".join(player.getFoundWords()))
+    print("score", player.getScore())
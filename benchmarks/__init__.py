@@ -0,0 +1,108 @@
+"""
+Benchmarks for the Boggle game: lexicon loading and queries, solving,
+click handling and board resets.  Run them from the top of the repository
+with "python3 -m benchmarks" (see __main__.py for the options).
+
+Every case is built from fixed seeds, so two runs measure the same work.
+Results are saved as JSON and can be compared against an earlier run to
+flag regressions.
+"""
+
+import json
+import platform
+import time
+
+# name -> setup function, in registration order
+_CASES = {}
+
+def benchmark(name):
+    """
+    Registers a benchmark case.  The decorated function does any setup and
+    returns a run function (or a (run, extras) pair, where extras is a dict
+    of extra metrics to report).  Each call of run does the timed work and
+    returns how many operations it did.
+    """
+    def register(setup):
+        _CASES[name] = setup
+        return setup
+    return register
+
+def getCaseNames():
+    return list(_CASES)
+
+def runCase(name, repeat=5):
+    """
+    Runs one case repeat times and returns its result dict: best and
+    median seconds per run, operations per run and operations per second.
+    """
+    made = _CASES[name]()
+    if made is None:
+        return {"skipped": True}
+    extras = {}
+    if isinstance(made, tuple):
+        run, extras = made
+    else:
+        run = made
+    times = []
+    ops = 0
+    for i in range(repeat):
+        start = time.perf_counter()
+        ops = run()
+        times.append(time.perf_counter() - start)
+    times.sort()
+    median = times[len(times) // 2]
+    result = {"best": times[0], "median": median, "ops": ops,
+              "opsPerSec": ops / median if median > 0 else 0.0}
+    result.update(extras)
+    return result
+
+def runAll(names=None, repeat=5, report=None):
+    """
+    Runs every case (or just those in names) and returns the results as a
+    dict ready to save.  report, if given, is called with (name, result)
+    after each case.
+    """
+    try:
+        import numpy
+        hasNumpy = True
+    except ImportError:
+        hasNumpy = False
+    results = {"python": platform.python_version(), "numpy": hasNumpy,
+               "time": time.strftime("%Y-%m-%dT%H:%M:%S"), "repeat": repeat, "cases": {}}
+    for name in _CASES:
+        if names is not None and name not in names:
+            continue
+        result = runCase(name, repeat)
+        results["cases"][name] = result
+        if report is not None:
+            report(name, result)
+    return results
+
+def save(results, path):
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+
+def load(path):
+    with open(path) as f:
+        return json.load(f)
+
+def compare(old, new, threshold=0.10):
+    """
+    Returns a list of messages, one for each case whose median time in the
+    results new is more than threshold (a fraction) slower than in old.
+
+    >>> old = {"cases": {"a": {"median": 1.0}, "b": {"median": 1.0}}}
+    >>> new = {"cases": {"a": {"median": 1.5}, "b": {"median": 1.05}}}
+    >>> compare(old, new)
+    ['a: 1.000000 s -> 1.500000 s (+50.0%)']
+    """
+    regressions = []
+    for name, result in new["cases"].items():
+        before = old["cases"].get(name)
+        if before is None or "median" not in before or "median" not in result:
+            continue
+        if before["median"] > 0 and result["median"] > before["median"] * (1 + threshold):
+            change = (result["median"] / before["median"] - 1) * 100
+            regressions.append("{}: {:.6f} s -> {:.6f} s (+{:.1f}%)".format(
+                name, before["median"], result["median"], change))
+    return regressions
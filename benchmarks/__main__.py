@@ -0,0 +1,53 @@
+"""
+Runs the benchmarks:
+
+    python3 -m benchmarks [-r REPEAT] [-o results.json] [-c baseline.json]
+                          [-t THRESHOLD] [case ...]
+
+With --compare, exits with status 1 if any case got slower than the
+baseline by more than the threshold.
+"""
+
+import argparse
+import sys
+
+import benchmarks
+import benchmarks.cases
+
+def report(name, result):
+    if result.get("skipped"):
+        print("{:<22} skipped".format(name))
+        return
+    extras = ", ".join("{}={}".format(key, value) for key, value in sorted(result.items())
+                       if key not in ("best", "median", "ops", "opsPerSec"))
+    print("{:<22} median {:10.6f} s  best {:10.6f} s  {:>12.1f} ops/s  {}".format(
+        name, result["median"], result["best"], result["opsPerSec"], extras))
+
+def main(argv):
+    parser = argparse.ArgumentParser(prog="python3 -m benchmarks")
+    parser.add_argument("cases", nargs="*", help="cases to run (default: all)")
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    parser.add_argument("-o", "--output", help="save the results to this JSON file")
+    parser.add_argument("-c", "--compare", help="compare against this JSON file")
+    parser.add_argument("-t", "--threshold", type=float, default=0.10,
+                        help="slowdown (fraction) counted as a regression")
+    args = parser.parse_args(argv)
+
+    names = args.cases or None
+    if names:
+        unknown = [name for name in names if name not in benchmarks.getCaseNames()]
+        if unknown:
+            parser.error("unknown cases: {}".format(", ".join(unknown)))
+    results = benchmarks.runAll(names, args.repeat, report)
+    if args.output:
+        benchmarks.save(results, args.output)
+    if args.compare:
+        regressions = benchmarks.compare(benchmarks.load(args.compare), results, args.threshold)
+        for line in regressions:
+            print("REGRESSION", line)
+        if regressions:
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,291 @@
+"""
+The benchmark cases.  Boards come from a fixed-seed corpus, so every run
+measures the same work.
+"""
+
+import atexit
+import datetime
+import os
+import shutil
+import tempfile
+import tracemalloc
+
+from benchmarks import benchmark
+from brandom import RandomStream
+from bogglecubes import DICE_SETS
+from boardcode import codesFromShakes, decode
+from lexicon import Lexicon
+from bogglesolver import solve, findPath, ParallelSolver
+from pathtable import PathTable, buildPathTable
+from headlessboard import HeadlessBoggleBoard, Point
+from hitindex import RegionIndex
+from kiosk import regions
+from bogglegame import BoggleGame
+from scoring import getRules
+from history import HistoryStore
+
+LEXICON = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                       "bogwords.txt")
+CORPUS_SEED = 2024
+CORPUS_SIZE = 50
+
+_lexicon = []
+
+def getLexicon():
+    """Returns the lexicon, loading it once for all cases."""
+    if not _lexicon:
+        _lexicon.append(Lexicon.fromFile(LEXICON))
+    return _lexicon[0]
+
+def corpus(diceSet, count=CORPUS_SIZE, seed=CORPUS_SEED):
+    """Returns the board codes of count seeded shakes of a dice set."""
+    rows, cols, cubes = DICE_SETS[diceSet]
+    order, faces = RandomStream(seed).shakes(count, [len(cube) for cube in cubes], rows * cols)
+    return list(codesFromShakes(cubes, order, faces, rows * cols))
+
+
+@benchmark("lexicon.load")
+def lexiconLoad():
+    # measure the memory of one load up front; the timed runs just parse
+    tracemalloc.start()
+    lexicon = Lexicon.fromFile(LEXICON)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    extras = {"words": len(lexicon), "retainedKiB": current // 1024, "peakKiB": peak // 1024}
+    def run():
+        Lexicon.fromFile(LEXICON)
+        return 1
+    return run, extras
+
+@benchmark("lexicon.contains")
+def lexiconContains():
+    lexicon = getLexicon()
+    words = lexicon.getWords()
+    # every word, and every word with its last letter dropped (mostly misses)
+    queries = words + [word[:-1] for word in words]
+    def run():
+        for word in queries:
+            word in lexicon
+        return len(queries)
+    return run
+
+@benchmark("lexicon.prefix")
+def lexiconPrefix():
+    lexicon = getLexicon()
+    queries = [word[:n] for word in lexicon.getWords()[::4] for n in range(1, len(word) + 1)]
+    def run():
+        for prefix in queries:
+            lexicon.hasPrefix(prefix)
+        return len(queries)
+    return run
+
+@benchmark("lexicon.candidates")
+def lexiconCandidates():
+    lexicon = getLexicon()
+    boards = [decode(code) for code in corpus("classic")]
+    lexicon.candidates(boards[0])
+    def run():
+        for letters in boards:
+            lexicon.candidates(letters)
+        return len(boards)
+    return run
+
+@benchmark("lexicon.query")
+def lexiconQuery():
+    # hint queries: a pattern on every corpus board, limited to its letters
+    lexicon = getLexicon()
+    boards = [decode(code) for code in corpus("classic")]
+    patterns = ["Q?E??", "ST???", "*ING", "C*T*", "?A?E"]
+    def run():
+        for pattern in patterns:
+            list(lexicon.query(pattern, maxLength=8))
+        for letters in boards:
+            list(lexicon.query("??*", letters=letters, limit=50))
+        return len(patterns) + len(boards)
+    return run
+
+def _solveCase(diceSet):
+    def setup():
+        lexicon = getLexicon()
+        rows, cols, cubes = DICE_SETS[diceSet]
+        boards = [decode(code) for code in corpus(diceSet)]
+        solve(boards[0], rows, cols, lexicon)
+        def run():
+            for letters in boards:
+                solve(letters, rows, cols, lexicon)
+            return len(boards)
+        return run
+    return setup
+
+for _diceSet in DICE_SETS:
+    benchmark("solve." + _diceSet)(_solveCase(_diceSet))
+
+def _tableCase(diceSet):
+    def setup():
+        lexicon = getLexicon()
+        rows, cols, cubes = DICE_SETS[diceSet]
+        boards = [decode(code) for code in corpus(diceSet)]
+        handle, path = tempfile.mkstemp(suffix=".bogp")
+        os.close(handle)
+        atexit.register(os.remove, path)
+        nodes = buildPathTable(path, rows, cols)
+        table = PathTable(path)
+        atexit.register(table.close)
+        table.solve(boards[0], lexicon)
+        def run():
+            for letters in boards:
+                table.solve(letters, lexicon)
+            return len(boards)
+        return run, {"nodes": nodes, "maxLength": table.getMaxLength()}
+    return setup
+
+for _diceSet in DICE_SETS:
+    benchmark("solve.{}.table".format(_diceSet))(_tableCase(_diceSet))
+
+@benchmark("solve.super.parallel")
+def parallelSolve():
+    # splitting a board across processes only pays with several CPUs
+    if (os.cpu_count() or 1) < 2:
+        return None
+    rows, cols, cubes = DICE_SETS["super"]
+    boards = [decode(code) for code in corpus("super")]
+    solver = ParallelSolver(getLexicon())
+    atexit.register(solver.close)
+    solver.solve(boards[0], rows, cols)
+    def run():
+        for letters in boards:
+            solver.solve(letters, rows, cols)
+        return len(boards)
+    return run, {"processes": solver.getProcesses()}
+
+@benchmark("score.solutions")
+def scoreSolutions():
+    # the end-of-round work: the best possible score of every corpus board
+    lexicon = getLexicon()
+    rows, cols, cubes = DICE_SETS["super"]
+    solutions = [solve(decode(code), rows, cols, lexicon) for code in corpus("super")]
+    rules = getRules("super")
+    def run():
+        for words in solutions:
+            rules.totalScore(words)
+        return len(solutions)
+    return run, {"words": sum(len(words) for words in solutions)}
+
+@benchmark("game.clicks")
+def gameClicks():
+    lexicon = getLexicon()
+    board = HeadlessBoggleBoard(seed=CORPUS_SEED)
+    game = BoggleGame(None, board=board)
+    resetPoint = Point(board.getXInset() + 40, board.getGridBottom() + 75)
+    # for each board: spell every word on it (clicking the last letter
+    # twice to submit), misspell one, then press reset
+    plays = []
+    for code in corpus("classic", 20):
+        letters = decode(code)
+        points = []
+        for word in solve(letters, 4, 4, lexicon):
+            path = findPath(word, letters, 4, 4)
+            path.append(path[-1])
+            points.extend(board.getCellCenter(cell % 4, cell // 4) for cell in path)
+        points.extend([board.getCellCenter(0, 0), board.getCellCenter(3, 3)])
+        points.append(resetPoint)
+        plays.append((code, points))
+    def run():
+        clicks = 0
+        for code, points in plays:
+            board.setCode(code)
+            for point in points:
+                game.doOneClick(point)
+            clicks += len(points)
+        return clicks
+    return run
+
+@benchmark("click.hittest")
+def clickHitTest():
+    # the regions of a kiosk window of 16 Super Boggle boards (see kiosk.py),
+    # and a click at every cell and button of each
+    rows, cols, cubes = DICE_SETS["super"]
+    index = RegionIndex()
+    clicks = []
+    for n, (x, y) in enumerate(regions(16, 4, 50 * cols + 200, 50 * rows + 200)):
+        x += 50
+        y += 50
+        for col in range(cols):
+            for row in range(rows):
+                index.add(x + 50 * col, y + 50 * row, x + 50 * (col + 1), y + 50 * (row + 1), (n, col, row))
+                clicks.append((x + 50 * col + 25, y + 50 * row + 25))
+        top = y + 50 * rows + 50
+        index.add(x, top, x + 80, top + 50, (n, "reset"), strict=True)
+        index.add(x + 120, top, x + 200, top + 50, (n, "exit"), strict=True)
+        clicks.extend([(x + 40, top + 25), (x + 160, top + 25)])
+    def run():
+        for x, y in clicks:
+            index.find(x, y)
+        return len(clicks)
+    return run, {"regions": len(index)}
+
+HISTORY_GAMES = 200000
+
+def _historyStore(games):
+    """Returns a HistoryStore in a temporary directory, holding games games over a year."""
+    directory = tempfile.mkdtemp()
+    atexit.register(shutil.rmtree, directory, True)
+    store = HistoryStore(os.path.join(directory, "history.db"), batchSize=5000)
+    atexit.register(store.close)
+    stream = RandomStream(CORPUS_SEED)
+    codes = corpus("classic")
+    start = datetime.datetime(2027, 1, 1).timestamp()
+    for n in range(games):
+        store.record("player{}".format(stream.randomInt(1, 1000)), codes[n % len(codes)], 4, 4,
+                     ["WORD{}".format(n)], stream.randomInt(0, 100), finished=start + stream.randomInt(0, 365 * 86400))
+    store.flush()
+    return store, codes
+
+@benchmark("history.record")
+def historyRecord():
+    # the cost to a game of recording a board; the writer thread does the rest
+    store, codes = _historyStore(0)
+    words = ["CAT", "CATS", "ACT", "SCAT"]
+    def run():
+        for n in range(1000):
+            store.record("player", codes[n % len(codes)], 4, 4, words, 4)
+        store.flush()
+        return 1000
+    return run
+
+@benchmark("history.leaderboard")
+def historyLeaderboard():
+    store, codes = _historyStore(HISTORY_GAMES)
+    days = [datetime.date(2027, 1, 1) + datetime.timedelta(days=n) for n in range(0, 365, 7)]
+    def run():
+        for day in days:
+            store.topScores(day)
+        for code in codes:
+            store.topScoresForBoard(code)
+        return len(days) + len(codes)
+    return run, {"games": HISTORY_GAMES}
+
+@benchmark("board.reset.headless")
+def headlessReset():
+    board = HeadlessBoggleBoard(6, 6, seed=CORPUS_SEED)
+    def run():
+        for i in range(200):
+            board.reset()
+        return 200
+    return run
+
+@benchmark("board.reset.tk")
+def tkReset():
+    # needs a display; the case is skipped without one
+    try:
+        from graphwin import GraphWin
+        from boggleboard import BoggleBoard
+        win = GraphWin("Boggle benchmark", *BoggleBoard.windowSize(4, 4))
+    except Exception:
+        return None
+    board = BoggleBoard(win, seed=CORPUS_SEED)
+    def run():
+        for i in range(20):
+            board.reset()
+        return 20
+    return run
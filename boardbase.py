@@ -0,0 +1,509 @@
+"""
+The board logic that does not need a display: the geometry of the grid,
+its text areas and its buttons, finding what a click landed on, and the
+letters of a Boggle board with their shaking and codes.
+
+Board and BoggleBoard (see board.py and boggleboard.py) draw the board
+with Tk by overriding the drawing hooks (_point, _makeTextArea, _makeCell,
+_makeButton and _makeLetter).  Without overrides, the hooks keep
+everything in memory, which is what HeadlessBoggleBoard (see
+headlessboard.py) plays on, so the game logic is the same with or without
+a window.
+"""
+
+from brandom import RandomStream
+from bogglecubes import cubesFor, checkCubes
+from hitindex import regionsOf
+import boardcode
+
+class Point:
+    """A click location, standing in for graphics.Point."""
+
+    __slots__ = ["_x", "_y"]
+
+    def __init__(self, x, y):
+        self._x = float(x)
+        self._y = float(y)
+
+    def getX(self):
+        return self._x
+
+    def getY(self):
+        return self._y
+
+    def __repr__(self):
+        return "Point({}, {})".format(self._x, self._y)
+
+
+class TextArea:
+    """The in-memory counterpart of a graphics.Text: just its text."""
+
+    __slots__ = ["_text"]
+
+    def __init__(self, text=""):
+        self._text = text
+
+    def getText(self):
+        return self._text
+
+    def setText(self, text):
+        self._text = text
+
+
+class HeadlessLetter:
+    """The in-memory counterpart of a BoggleLetter."""
+
+    __slots__ = ['_col', '_row', '_letter', '_textColor', '_fillColor']
+
+    def __init__(self, col=-1, row=-1, letter="", color="black"):
+        self._col = col
+        self._row = row
+        self._letter = letter
+        self._textColor = color
+        self._fillColor = "white"
+
+    def getRow(self):
+        return self._row
+
+    def getCol(self):
+        return self._col
+
+    def setLetter(self, char):
+        self._letter = char
+
+    def getLetter(self):
+        return self._letter
+
+    def setTextColor(self, color):
+        self._textColor = color
+
+    def getTextColor(self):
+        return self._textColor
+
+    def setFillColor(self, color):
+        self._fillColor = color
+
+    def getFillColor(self):
+        return self._fillColor
+
+    def isAdjacent(self, other):
+        """Same rule as BoggleLetter.isAdjacent."""
+        if (other.getCol() - self._col == 0) and (other.getRow() - self._row == 0):
+            return False
+        return (abs(other.getCol() - self._col) <= 1) and (abs(other.getRow() - self._row) <= 1)
+
+    def __str__(self):
+        return "BoggleLetter({}, {}, '{}', '{}')".format(self._col, self._row,
+                                                        self._letter, self._textColor)
+
+    def __repr__(self):
+        return str(self)
+
+
+class BoardBase:
+    """
+    A rows x cols grid of size x size cells, placed xInset and yInset
+    from the corner of win (None for no window), with text areas to the
+    right, below and above it, and reset and exit buttons below.  The
+    cells and buttons are registered in the window's region index (see
+    hitindex.py), so each click is resolved with one lookup.
+
+    >>> board = BoardBase(rows=4, cols=4)
+    >>> board.getCellAt(Point(125, 75)), board.inGrid(Point(25, 75))
+    ((1, 0), False)
+    >>> board.inReset(Point(60, 310)), board.inExit(Point(200, 310)), board.inExit(Point(170, 300))
+    (True, True, False)
+    """
+
+    # _win: graphical window the board is drawn on, or None
+    # _xInset, _yInset: where the grid starts, away from the window's corner
+    # _rows, _cols: number of rows and columns in the grid of squares
+    # _size: edge size of each square
+    # _resetButton, _exitButton: the targets the buttons are registered as
+    # _regions: the region index clicks are looked up in
+    # _lastClick, _lastRegion: the last point looked up, and what was there
+
+    __slots__ = [ '_xInset', '_yInset', '_rows', '_cols', '_size', \
+                  '_win', '_exitButton', '_resetButton', \
+                  '_textArea', '_lowerWord', '_upperWord', \
+                  '_regions', '_lastClick', '_lastRegion']
+
+    def __init__(self, xInset=50, yInset=50, rows=3, cols=3, size=50, win=None):
+        self._xInset = xInset; self._yInset = yInset
+        self._rows = rows; self._cols = cols
+        self._size = size
+        self._win = win
+        self._regions = regionsOf(win)
+        self._lastClick = None
+        self._lastRegion = None
+        # a cell is registered as (board, col, row), a button as (board, name)
+        self._resetButton = (self, "RESET")
+        self._exitButton = (self, "EXIT")
+        self.drawBoard()
+
+    # getter methods for attributes
+    def getWin(self):
+        return self._win
+
+    def getXInset(self):
+        return self._xInset
+
+    def getYInset(self):
+        return self._yInset
+
+    def getRows(self):
+        return self._rows
+
+    def getCols(self):
+        return self._cols
+
+    def getSize(self):
+        return self._size
+
+    def getBoard(self):
+        return self
+
+    def getGridRight(self):
+        """Returns the x coordinate of the right edge of the grid"""
+        return self._xInset + self._size * self._cols
+
+    def getGridBottom(self):
+        """Returns the y coordinate of the bottom edge of the grid"""
+        return self._yInset + self._size * self._rows
+
+    def getCellCenter(self, col, row):
+        """Returns the Point at the center of grid cell (col, row)"""
+        return self._point(self._xInset + self._size * (col + 0.5),
+                           self._yInset + self._size * (row + 0.5))
+
+    @staticmethod
+    def windowSize(rows, cols, xInset=50, yInset=50, size=50):
+        '''
+        Returns the (width, height) of a window that fits a board with
+        the given geometry, its text areas and its buttons.
+
+        >>> BoardBase.windowSize(4, 4)
+        (400, 400)
+        >>> BoardBase.windowSize(6, 6)
+        (500, 500)
+        '''
+        # room for the text area on the right and the buttons below
+        return (xInset + size * cols + 150, yInset + size * rows + 150)
+
+    # drawing hooks: these keep the board in memory, and Board draws it
+    def _point(self, x, y):
+        """Returns a point of the window the board is drawn on."""
+        return Point(x, y)
+
+    def _makeTextArea(self, point, fontsize=18, color="black"):
+        """Returns a text area centered on point."""
+        return TextArea()
+
+    def _makeCell(self, p1, p2):
+        """Draws the empty square of a grid cell with corners p1 and p2."""
+
+    def _makeButton(self, p1, p2, text):
+        """Draws a button with corners p1 and p2, labelled text."""
+
+    def __drawTextAreas(self):
+        """Make the text areas to the right/lower/upper side of main grid"""
+        # main text area (right of grid)
+        self._textArea = self._makeTextArea(self._point(self._xInset + self._size * (self._cols + 1),
+                                                        self._yInset + 50), 14)
+        # the lower and upper text areas are centered on the grid
+        centerX = self._xInset + self._size * self._cols / 2 + 10
+        # the text area below grid
+        self._lowerWord = self._makeTextArea(self._point(centerX, self.getGridBottom() + 25))
+        # the text area above grid
+        self._upperWord = self._makeTextArea(self._point(centerX, self._yInset - 25), color="red")
+
+    def __drawGrid(self):
+        """Makes a row x col grid of empty squares"""
+        for x in range(self._cols):
+            for y in range(self._rows):
+                p1 = self._point(self._xInset + self._size * x,
+                                 self._yInset + self._size * y)
+                p2 = self._point(self._xInset + self._size * (x + 1),
+                                 self._yInset + self._size * (y + 1))
+                self._makeCell(p1, p2)
+                # register the cell, so clicks on it find its position
+                self._regions.add(p1.getX(), p1.getY(), p2.getX(), p2.getY(), (self, x, y))
+
+    def __drawButtons(self):
+        """Make the reset and exit buttons"""
+        # buttons sit in a row below the lower text area
+        top = self.getGridBottom() + 50
+        p1 = self._point(self._xInset, top); p2 = self._point(self._xInset + 80, top + 50)
+        self._makeButton(p1, p2, "RESET")
+        p3 = self._point(self._xInset + 120, top); p4 = self._point(self._xInset + 200, top + 50)
+        self._makeButton(p3, p4, "EXIT")
+        # a click on a button's outline is not in the button
+        self._regions.add(p1.getX(), p1.getY(), p2.getX(), p2.getY(), self._resetButton, strict=True)
+        self._regions.add(p3.getX(), p3.getY(), p4.getX(), p4.getY(), self._exitButton, strict=True)
+
+    def drawBoard(self):
+        """Create the board with the grid, text areas, and buttons"""
+        self.__drawGrid()
+        self.__drawTextAreas()
+        self.__drawButtons()
+
+    # convert Point to grid position (tuple)
+    def getPosition(self, point):
+        '''
+        Converts a window location (Point) to a grid position (tuple).
+        Note: Grid positions are always returned as col, row.
+        '''
+        pX = point.getX()
+        pY = point.getY()
+
+        if pY < self._yInset:
+            row = -1
+        else:
+            row = int((pY - self._yInset) / self._size)
+
+        if pX < self._xInset:
+            col = -1
+        else:
+            col = int((pX - self._xInset) / self._size)
+        return (col, row)
+
+    # find what a click landed on
+    def _regionAt(self, point):
+        '''
+        Returns the target of the region (button or cell) a Point (point)
+        is in, or None.  A click is checked against several regions in a
+        row, so the last lookup is kept.
+        '''
+        click = (point.getX(), point.getY())
+        if click != self._lastClick:
+            self._lastClick = click
+            self._lastRegion = self._regions.find(click[0], click[1])
+        return self._lastRegion
+
+    def getCellAt(self, point):
+        '''
+        Returns the grid position (col, row) of the cell a Point (point)
+        is in, or None if it is not in the grid.
+        '''
+        region = self._regionAt(point)
+        if type(region) is tuple and len(region) == 3 and region[0] is self:
+            return region[1:]
+        return None
+
+    # check for click in grid
+    def inGrid(self, point):
+        '''
+        Returns True if a Point (point) exists inside the grid of squares.
+        '''
+        return self.getCellAt(point) is not None
+
+    # clicked in exit button?
+    def inExit(self, point):
+        '''
+        Returns true if point is inside exit button (rectangle)
+        '''
+        return self._regionAt(point) is self._exitButton
+
+    # clicked in reset button?
+    def inReset(self, point):
+        '''
+        Returns true if point is inside reset button (rectangle)
+        '''
+        return self._regionAt(point) is self._resetButton
+
+    # set text to text area on right
+    def getStringFromTextArea(self):
+        '''
+        Get text from text area to right of grid.
+        '''
+        return self._textArea.getText()
+
+    # set text to text area on right
+    def setStringToTextArea(self, text):
+        '''
+        Sets text to text area to right of grid. Overwrites existing text.
+        '''
+        self._textArea.setText(text)
+
+    # add text to text area below grid
+    def getStringFromLowerText(self):
+        '''
+        Get text from text area below grid.
+        '''
+        return self._lowerWord.getText()
+
+    # add text to text area below grid
+    def setStringToLowerText(self, text):
+        '''
+        Set text to text area below grid.  Overwrites existing text.
+        '''
+        self._lowerWord.setText( text )
+
+    # add text to text area above grid
+    def getStringFromUpperText(self):
+        '''
+        Get text from text area above grid.
+        '''
+        return self._upperWord.getText()
+
+    # set text to text area above grid
+    def setStringToUpperText(self, text):
+        '''
+        Set text to text area above grid. Overwrites existing text.
+        '''
+        self._upperWord.setText(text)
+
+
+class BoggleBoardBase(BoardBase):
+    """
+    A board with a grid of Boggle letters, shaken from a dice set (the
+    one made for the grid size by default).  Boards made with the same
+    seed shake the same sequence of letters.
+
+    >>> board = BoggleBoardBase(seed=1)
+    >>> board.getBoggleLetterAtPoint(board.getCellCenter(1, 2)) is board._grid[1][2]
+    True
+    >>> BoggleBoardBase(seed=1).getCode() == board.getCode()
+    True
+    """
+
+    __slots__ = ['_grid', "_cubes", "_random"]
+
+    def __init__(self, rows=4, cols=4, cubes=None, seed=None, xInset=50, yInset=50, size=50,
+                 win=None):
+        # the insets place the grid, so several boards can share one window
+        BoardBase.__init__(self, xInset=xInset, yInset=yInset, rows=rows, cols=cols, size=size,
+                           win=win)
+
+        # each board shakes with its own random stream, so the same seed
+        # always gives the same sequence of boards
+        self._random = RandomStream(seed)
+
+        # the dice set defaults to the one made for this grid size
+        if cubes is None:
+            cubes = cubesFor(rows, cols)
+        checkCubes(cubes)
+        self._cubes = [list(cube) for cube in cubes]
+
+        # a list of columns, each a list of the letters in it
+        self._grid = [[self._makeLetter(i, j) for j in range(rows)] for i in range(cols)]
+        # fills the grid with letters using shakeCubes
+        self.shakeCubes()
+
+    def _makeLetter(self, col, row):
+        """Returns the empty letter of cell (col, row)."""
+        return HeadlessLetter(col, row)
+
+    def getCubes(self):
+        """
+        Returns the dice set this board shakes, as a list of lists of faces.
+        Do not modify it.
+        """
+        return self._cubes
+
+    def getSeed(self):
+        """
+        Returns the seed of this board's random stream.  A board made with
+        the same seed shakes the same letters.
+        """
+        return self._random.getSeed()
+
+    def getBoggleLetterAtPoint(self, point):
+        """
+        Return the BoggleLetter that contains the given point in the window,
+        or None if the click is outside all letters.
+        """
+        # if the point is in the grid returns the BoggleLetter of the cell the point was in
+        position = self.getCellAt(point)
+        if position is not None:
+            (col, row) = position
+            return self._grid[col][row]
+        # if the point is not in the grid, returns none
+        else:
+            return None
+
+    def resetColors(self):
+        """
+        "Unclicks" all boggle letters on the board without changing any
+        other attributes.  (Change letter colors back to default values.)
+        """
+        for column in self._grid:
+            for letter in column:
+                # resets the color of that letter to black and the fill color of the square to white
+                letter.setFillColor("white")
+                letter.setTextColor("black")
+
+    def reset(self):
+        """
+        Clears the boggle board by clearing letters and colors,
+        clears all text areas (right, lower, upper) on board
+        and resets the letters on board by calling shakeCubes.
+        """
+        self.resetColors()
+        self.setStringToTextArea('')
+        self.setStringToLowerText('')
+        self.setStringToUpperText('')
+        self.shakeCubes()
+
+    def shakeCubes(self):
+        """
+        Shakes the boggle board and sets letters as described by the handout.
+        """
+        # shakes the cubes with this board's own random stream
+        numCells = self._rows * self._cols
+        order, faces = self._random.shakes(1, [len(cube) for cube in self._cubes], numCells)
+        # goes through each column and then each cell within that column
+        for i in range(self._cols):
+            for j in range(self._rows):
+                # finds the cube that landed in this cell and the face it shows
+                k = (j * self._cols) + i
+                self._grid[i][j].setLetter(self._cubes[order[k]][faces[k]])
+
+    def getLetters(self):
+        """
+        Returns the faces showing on the board as a row-major list of strings.
+        """
+        return [self._grid[c][r].getLetter() for r in range(self._rows) for c in range(self._cols)]
+
+    def getCode(self):
+        """
+        Returns the compact board code (bytes) of the letters on the board.
+        See boardcode.py for the encoding.
+        """
+        return boardcode.encode(self.getLetters())
+
+    def setCode(self, code):
+        """
+        Sets the letters on the board from a board code made for a board
+        of the same size.
+        """
+        if len(code) != self._rows * self._cols:
+            raise ValueError("board code is for a different grid size")
+        letters = boardcode.decode(code)
+        for i in range(self._cols):
+            for j in range(self._rows):
+                self._grid[i][j].setLetter(letters[(j * self._cols) + i])
+
+    def loadPuzzle(self, archive, day):
+        """
+        Sets the letters on the board to the daily puzzle for date day from
+        a dailypuzzles.DailyArchive.  This is a lookup, with no solving.
+        """
+        self.setCode(archive.getCode(day))
+
+    def __str__(self):
+        """
+        Returns a string representation of this BoggleBoard
+        """
+        board = ''
+        for r in range(self._rows):
+            for c in range(self._cols):
+                boggleLetter = self._grid[c][r]
+                board += '[{}:{}] '.format(boggleLetter.getLetter(), boggleLetter.getTextColor())
+            board += '\n'
+        return board
+
+
+if __name__ == "__main__":
+    from doctest import testmod
+    testmod()
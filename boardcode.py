@@ -0,0 +1,205 @@
+"""
+Compact binary codes for Boggle boards, and a streaming file format for
+storing many of them.
+
+A board code is one byte per cell, in row-major order.  Each byte is the
+symbol of the face showing in that cell: 0 for a blank face, 1-26 for the
+letters A-Z, and one symbol for each multi-letter face such as "Qu".  The
+grid dimensions are not part of the code; they live in the header of a
+board file, or come from the board the code is loaded into.
+
+A board file is an 8 byte header (magic, version, rows, cols) followed by
+fixed size records of rows * cols bytes, so board n of a file starts at
+byte 8 + n * rows * cols and can be read straight out of an mmap.
+"""
+
+import mmap
+import struct
+
+# the faces with a symbol of their own, in symbol order
+FACES = [""] + [chr(ord("A") + i) for i in range(26)] + \
+        ["Qu", "An", "Er", "He", "In", "Th"]
+
+# face (in any case) -> symbol
+_SYMBOLS = {}
+for _i in range(len(FACES)):
+    _SYMBOLS[FACES[_i]] = _i
+    _SYMBOLS[FACES[_i].upper()] = _i
+
+MAGIC = b"BOGB"
+VERSION = 1
+HEADER = struct.Struct("<4sBBBx")
+
+def faceSymbol(face):
+    """
+    Returns the symbol (int) for face (str).
+
+    >>> faceSymbol("A"), faceSymbol("Qu"), faceSymbol("QU"), faceSymbol("")
+    (1, 27, 27, 0)
+    """
+    if face not in _SYMBOLS:
+        raise ValueError("no symbol for face: {!r}".format(face))
+    return _SYMBOLS[face]
+
+def encode(letters):
+    """
+    Returns the board code (bytes) for letters, a row-major list of the
+    faces showing in each cell.
+
+    >>> encode(["C", "A", "Qu", ""])
+    b'\\x03\\x01\\x1b\\x00'
+    """
+    return bytes([faceSymbol(face) for face in letters])
+
+def decode(code):
+    """
+    Returns the row-major list of faces for a board code.
+
+    >>> decode(encode(["C", "A", "Qu", ""]))
+    ['C', 'A', 'Qu', '']
+    """
+    return [FACES[symbol] for symbol in code]
+
+def symbolTable(cubes):
+    """
+    Returns, for each cube of a dice set, the list of symbols of its faces.
+    Used to turn bulk shakes into board codes without building strings.
+    """
+    return [[faceSymbol(face) for face in cube] for cube in cubes]
+
+def codesFromShakes(cubes, order, faces, numCells):
+    """
+    Yields the board code of each shake in the (order, faces) arrays made
+    by brandom.RandomStream.shakes for the dice set cubes.
+
+    >>> from brandom import RandomStream
+    >>> from bogglecubes import CLASSIC_CUBES
+    >>> order, faces = RandomStream(1).shakes(3, [6] * 16)
+    >>> codes = list(codesFromShakes(CLASSIC_CUBES, order, faces, 16))
+    >>> len(codes), len(codes[0])
+    (3, 16)
+    >>> decode(codes[0])[0] == CLASSIC_CUBES[order[0]][faces[0]]
+    True
+    """
+    table = symbolTable(cubes)
+    for start in range(0, len(order), numCells):
+        yield bytes([table[order[k]][faces[k]] for k in range(start, start + numCells)])
+
+
+class BoardWriter:
+    """Appends board codes of one grid size to a board file."""
+
+    __slots__ = ["_file", "_rows", "_cols", "_count"]
+
+    def __init__(self, path, rows, cols):
+        """
+        Create a new board file at path (overwriting it) for rows x cols boards.
+        """
+        self._rows = rows
+        self._cols = cols
+        self._count = 0
+        self._file = open(path, "wb")
+        self._file.write(HEADER.pack(MAGIC, VERSION, rows, cols))
+
+    def getCount(self):
+        """Returns the number of boards written so far."""
+        return self._count
+
+    def write(self, code):
+        """Appends one board code to the file."""
+        if len(code) != self._rows * self._cols:
+            raise ValueError("expected a code of {} bytes, got {}".format(
+                             self._rows * self._cols, len(code)))
+        self._file.write(code)
+        self._count += 1
+
+    def writeMany(self, codes):
+        """Appends every board code of the iterable codes to the file."""
+        for code in codes:
+            self.write(code)
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class BoardReader:
+    """
+    Reads a board file through an mmap, both as a stream and by index.
+
+    >>> import os, tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), "boards.bog")
+    >>> with BoardWriter(path, 2, 2) as writer:
+    ...     writer.write(encode(["C", "A", "T", "S"]))
+    ...     writer.write(encode(["D", "Qu", "O", "G"]))
+    >>> with BoardReader(path) as reader:
+    ...     print(len(reader), reader.getRows(), reader.getCols())
+    ...     print(decode(reader[1]))
+    ...     print([decode(code)[0] for code in reader])
+    2 2 2
+    ['D', 'Qu', 'O', 'G']
+    ['C', 'D']
+    """
+
+    __slots__ = ["_file", "_map", "_rows", "_cols", "_recordSize", "_count"]
+
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        header = self._file.read(HEADER.size)
+        if len(header) != HEADER.size:
+            self._file.close()
+            raise ValueError("{} is not a board file".format(path))
+        magic, version, self._rows, self._cols = HEADER.unpack(header)
+        if magic != MAGIC or version != VERSION:
+            self._file.close()
+            raise ValueError("{} is not a version {} board file".format(path, VERSION))
+        self._recordSize = self._rows * self._cols
+        self._file.seek(0, 2)
+        self._count = (self._file.tell() - HEADER.size) // self._recordSize
+        # an empty file can not be mapped, but has no boards to read anyway
+        self._map = None
+        if self._count > 0:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def getRows(self):
+        return self._rows
+
+    def getCols(self):
+        return self._cols
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, n):
+        """Returns the code of board n (bytes) in O(1)."""
+        if n < 0:
+            n += self._count
+        if n < 0 or n >= self._count:
+            raise IndexError("board index out of range")
+        start = HEADER.size + n * self._recordSize
+        return self._map[start:start + self._recordSize]
+
+    def __iter__(self):
+        for n in range(self._count):
+            yield self[n]
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+if __name__ == "__main__":
+    from doctest import testmod
+    testmod()
@@ -0,0 +1,341 @@
+"""
+Builds boards to order: boards that contain given words, have at least so
+many words, or never show some letters.
+
+Shaking and solving until a board happens to fit can take millions of
+tries ("at least 150 words" on a classic board, say).  BoardGenerator
+works the other way round.  It first lays out paths for the required
+words, choosing for each cell a die with a face that continues the word.
+It then fills the other cells with the remaining dice, and climbs towards
+the word count by rerolling and swapping the free dice, keeping each
+change that does not lose words.  A board's candidate words (see
+Lexicon.candidates) bound its word count, so most bad changes are
+rejected before any search.  Every die shows one of its own faces.
+
+To put such a board in play, generate it from the board's own dice:
+
+    generator = BoardGenerator(board.getCubes(), board.getRows(), board.getCols(), lexicon)
+    board.setCode(generator.generate(["QUEEN"], minWords=150))
+
+or from the command line:
+
+    python3 boardgen.py classic --contains QUEEN --min-words 150 --ban Z
+"""
+
+import argparse
+import itertools
+import sys
+import time
+
+from brandom import RandomStream
+from bogglecubes import getDiceSet
+from boardcode import encode
+from bogglesolver import MIN_LENGTH, neighbors, solveWords
+
+def spellings(word, faces):
+    """
+    Yields every way to spell word as a list of faces (upper case).
+
+    >>> list(spellings("QUIT", {"QU", "Q", "U", "I", "T"}))
+    [['QU', 'I', 'T'], ['Q', 'U', 'I', 'T']]
+    """
+    if not word:
+        yield []
+        return
+    for face in sorted(faces, key=len, reverse=True):
+        if word.startswith(face):
+            for rest in spellings(word[len(face):], faces):
+                yield [face] + rest
+
+def canSpell(words, dice):
+    """
+    Returns True if the words can all be spelled on one board of dice (a
+    list of lists of faces): a face that occurs n times in a word needs n
+    dice that can show it, and different faces need different dice.
+    Words may share cells, so a face is only counted for the word that
+    needs it most.  Two letters found on just one die, such as J and K on
+    a Big Boggle cube, rule a word out.
+
+    >>> canSpell(["JOKER"], [["J", "K"], ["O"], ["E"], ["R"], ["K"]])
+    True
+    >>> canSpell(["JOKER"], [["J", "K"], ["O"], ["E"], ["R"]])
+    False
+    """
+    upper = [[face.upper() for face in faces] for faces in dice]
+    faces = set(face for faces in upper for face in faces if face)
+
+    def match(needed, n, owner, seen):
+        # finds a die for needed[n], moving earlier faces to other dice if need be
+        for die in range(len(upper)):
+            if needed[n] in upper[die] and die not in seen:
+                seen.add(die)
+                if owner.get(die) is None or match(needed, owner[die], owner, seen):
+                    owner[die] = n
+                    return True
+        return False
+
+    # try the ways to spell the words, up to a limit
+    for ways in itertools.islice(itertools.product(*[list(spellings(word, faces)) for word in words]), 64):
+        counts = {}
+        for segments in ways:
+            for face in set(segments):
+                counts[face] = max(counts.get(face, 0), segments.count(face))
+        needed = [face for face in counts for i in range(counts[face])]
+        owner = {}
+        if all(match(needed, n, owner, set()) for n in range(len(needed))):
+            return True
+    return False
+
+
+class BoardGenerator:
+    """
+    Generates rows x cols boards from the dice cubes (a list of lists of
+    faces, as in bogglecubes.py), checked against lexicon.  Faces showing
+    any of the letters in banned are never used.  Only words of minLength
+    or more letters count towards minWords (4 for Big and Super Boggle).
+
+    >>> from lexicon import Lexicon
+    >>> from bogglecubes import CLASSIC_CUBES
+    >>> from bogglesolver import solve
+    >>> from boardcode import decode
+    >>> lex = Lexicon(["queen", "quiet", "cat", "act", "tea", "eat", "ate", "net", "ten"])
+    >>> generator = BoardGenerator(CLASSIC_CUBES, 4, 4, lex, banned="Z", seed=3)
+    >>> letters = decode(generator.generate(["QUEEN"], minWords=4))
+    >>> words = solve(letters, 4, 4, lex)
+    >>> "QUEEN" in words, len(words) >= 4, "Z" in letters
+    (True, True, False)
+    >>> generator = BoardGenerator(CLASSIC_CUBES, 4, 4, lex, seed=3, minLength=4)
+    >>> words = solve(decode(generator.generate(["QUEEN"], minWords=2)), 4, 4, lex, minLength=4)
+    >>> "QUEEN" in words, len(words) >= 2
+    (True, True)
+    """
+
+    __slots__ = ["_rows", "_cols", "_lexicon", "_minLength", "_random", "_dice", "_adjacent",
+                 "_faceDice", "_cellDie", "_dieFace", "_dieCell", "_locked", "_budget"]
+
+    # search nodes allowed for laying out the required words, per attempt
+    PLACE_BUDGET = 20000
+    # attempts at laying out the required words before giving up
+    PLACE_ATTEMPTS = 50
+    # changes without a gain before the generator starts over
+    RESTART_AFTER = 400
+
+    def __init__(self, cubes, rows, cols, lexicon, banned="", seed=None, minLength=MIN_LENGTH):
+        self._rows = rows
+        self._cols = cols
+        self._lexicon = lexicon
+        self._minLength = minLength
+        self._random = RandomStream(seed)
+        self._adjacent = neighbors(rows, cols)
+        banned = set(banned.upper())
+        # the faces each die may show; with more cells than cubes, cubes
+        # are used more than once, as RandomStream.shakes does
+        copies = -(-rows * cols // len(cubes))
+        self._dice = [[face for face in cube if not banned & set(face.upper())]
+                      for cube in cubes] * copies
+        if sum(1 for faces in self._dice if faces) < rows * cols:
+            raise ValueError("too few dice have faces that are not banned")
+        # upper case face -> the (die, face as shown) pairs that can show it
+        self._faceDice = {}
+        for die in range(len(self._dice)):
+            for face in self._dice[die]:
+                if face:
+                    self._faceDice.setdefault(face.upper(), []).append((die, face))
+
+    def generate(self, mustContain=(), minWords=0, maxSteps=20000):
+        """
+        Returns the code (see boardcode.py) of a board on which every word
+        of mustContain can be spelled and lexicon has at least minWords
+        words.  Raises ValueError if a required word can not be spelled
+        with these dice at all, and RuntimeError if the words can not be
+        laid out together or no board is found in maxSteps changes.
+        """
+        words = sorted((word.upper() for word in mustContain), key=len, reverse=True)
+        if not canSpell(words, self._dice):
+            raise ValueError("{} can not be spelled with these dice".format(", ".join(words)))
+        best = -1
+        stale = steps = failures = 0
+        while steps < maxSteps:
+            if best < 0 or stale >= self.RESTART_AFTER:
+                if not self.__layOut(words):
+                    failures += 1
+                    if failures >= self.PLACE_ATTEMPTS:
+                        raise RuntimeError("could not lay out {} together".format(", ".join(words)))
+                    continue
+                best = self.__count(-1)
+                stale = 0
+            if best >= minWords:
+                return encode(self.__letters())
+            undo = self.__change()
+            steps += 1
+            if undo is None:
+                # every cell is locked by the required words
+                stale = self.RESTART_AFTER
+                continue
+            count = self.__count(best)
+            if count >= best:
+                stale = 0 if count > best else stale + 1
+                best = count
+            else:
+                undo()
+                stale += 1
+        raise RuntimeError("no board found in {} steps".format(maxSteps))
+
+    def __letters(self):
+        return [self._dieFace[die] for die in self._cellDie]
+
+    def __layOut(self, words):
+        """Lays out paths for words, then fills the other cells.  False if it gave up."""
+        cells = self._rows * self._cols
+        self._cellDie = [None] * cells
+        self._dieFace = [None] * len(self._dice)
+        self._dieCell = [None] * len(self._dice)
+        self._budget = self.PLACE_BUDGET
+        if not self.__place(words, 0, 0, None, []):
+            return False
+        self._locked = [die is not None for die in self._cellDie]
+        free = [die for die in range(len(self._dice)) if self._dieCell[die] is None and self._dice[die]]
+        self._random.shuffle(free)
+        for cell in range(cells):
+            if self._cellDie[cell] is None:
+                self.__put(cell, free.pop(), None)
+        return True
+
+    def __put(self, cell, die, face):
+        if face is None:
+            face = self._random.choice(self._dice[die])
+        self._cellDie[cell] = die
+        self._dieCell[die] = cell
+        self._dieFace[die] = face
+
+    def __take(self, cell):
+        die = self._cellDie[cell]
+        self._cellDie[cell] = None
+        self._dieCell[die] = None
+        self._dieFace[die] = None
+        return die
+
+    def __place(self, words, n, pos, previous, path):
+        """
+        Spells words[n] from letter pos on, continuing from cell previous
+        along path, then the words after it.  Backtracks on failure.
+        """
+        if n == len(words):
+            return True
+        word = words[n]
+        if pos == len(word):
+            return self.__place(words, n + 1, 0, None, [])
+        self._budget -= 1
+        if self._budget < 0:
+            return False
+        cells = list(range(len(self._cellDie))) if previous is None else list(self._adjacent[previous])
+        self._random.shuffle(cells)
+        for cell in cells:
+            if cell in path:
+                continue
+            die = self._cellDie[cell]
+            if die is not None:
+                # share a cell an earlier word already placed
+                face = self._dieFace[die].upper()
+                if face and word.startswith(face, pos) and \
+                   self.__place(words, n, pos + len(face), cell, path + [cell]):
+                    return True
+                continue
+            for face in self._faceDice:
+                if not word.startswith(face, pos):
+                    continue
+                # dice showing the same face are interchangeable here, so try one
+                free = [choice for choice in self._faceDice[face] if self._dieCell[choice[0]] is None]
+                if not free:
+                    continue
+                die, shown = self._random.choice(free)
+                self.__put(cell, die, shown)
+                if self.__place(words, n, pos + len(face), cell, path + [cell]):
+                    return True
+                self.__take(cell)
+                if self._budget < 0:
+                    return False
+        return False
+
+    def __change(self):
+        """
+        Makes one random change to the free cells: rerolls a die, swaps two
+        dice, or swaps a die for a spare one.  Returns a function that
+        undoes it, or None if there are no free cells.
+        """
+        free = [cell for cell in range(len(self._cellDie)) if not self._locked[cell]]
+        if not free:
+            return None
+        cell = self._random.choice(free)
+        die = self._cellDie[cell]
+        face = self._dieFace[die]
+        kind = self._random.random()
+        if kind < 0.5 or len(free) < 2:
+            self._dieFace[die] = self._random.choice(self._dice[die])
+            def undo():
+                self._dieFace[die] = face
+            return undo
+        spares = [other for other in range(len(self._dice))
+                  if self._dieCell[other] is None and self._dice[other]]
+        if spares and kind < 0.75:
+            spare = self._random.choice(spares)
+            self.__take(cell)
+            self.__put(cell, spare, None)
+            def undo():
+                self.__take(cell)
+                self.__put(cell, die, face)
+            return undo
+        other = self._random.choice(free)
+        otherDie = self._cellDie[other]
+        self._cellDie[cell], self._cellDie[other] = otherDie, die
+        self._dieCell[die], self._dieCell[otherDie] = other, cell
+        def undo():
+            self._cellDie[cell], self._cellDie[other] = die, otherDie
+            self._dieCell[die], self._dieCell[otherDie] = cell, other
+        return undo
+
+    def __count(self, floor):
+        """
+        Returns the number of words of minLength or more letters on the
+        board, or any number below floor when it is sure to be below floor.
+        """
+        letters = self.__letters()
+        minLength = self._minLength
+        if self._lexicon.isVectorized():
+            words = [word for word in self._lexicon.candidates(letters) if len(word) >= minLength]
+            # the candidates bound the words found
+            if len(words) < floor:
+                return len(words)
+        else:
+            words = self._lexicon.getWords()
+        return len(solveWords(letters, self._rows, self._cols, words, minLength))
+
+
+def main(argv):
+    from lexiconregistry import LEXICONS
+    from boardcode import decode
+    from bogglesolver import solve
+    from scoring import getRules
+    parser = argparse.ArgumentParser(prog="python3 boardgen.py")
+    parser.add_argument("diceSet", nargs="?", default="classic", help="classic, big or super")
+    parser.add_argument("--contains", action="append", default=[], help="a word the board must hold")
+    parser.add_argument("--min-words", type=int, default=0, help="the fewest words the board may hold")
+    parser.add_argument("--ban", default="", help="letters that may not show")
+    parser.add_argument("--seed", default=None, help="seed for a repeatable board")
+    args = parser.parse_args(argv)
+
+    rows, cols, cubes = getDiceSet(args.diceSet)
+    # count only the words the variant accepts
+    minLength = getRules(args.diceSet).getMinLength()
+    lexicon = LEXICONS.get("bogwords.txt")
+    start = time.perf_counter()
+    generator = BoardGenerator(cubes, rows, cols, lexicon, args.ban, args.seed, minLength)
+    letters = decode(generator.generate(args.contains, args.min_words))
+    elapsed = time.perf_counter() - start
+    for r in range(rows):
+        print(" ".join("{:2}".format(face or ".") for face in letters[r * cols:(r + 1) * cols]))
+    print("{} words, found in {:.2f} s".format(len(solve(letters, rows, cols, lexicon, minLength)), elapsed))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
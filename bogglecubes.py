@@ -0,0 +1,150 @@
+"""
+Dice sets for the different Boggle variants.  Each dice set is a list of
+cubes, and each cube is a list of the strings printed on its faces.  A face
+may hold more than one letter (such as "Qu" or "Th"), and the empty string
+stands for a blank face that can never be part of a word.
+"""
+
+# the classic 4x4 Boggle cubes
+CLASSIC_CUBES = [[ "A", "A", "C", "I", "O", "T" ],
+                 [ "T", "Y", "A", "B", "I", "L" ],
+                 [ "J", "M", "O", "Qu", "A", "B"],
+                 [ "A", "C", "D", "E", "M", "P" ],
+                 [ "A", "C", "E", "L", "S", "R" ],
+                 [ "A", "D", "E", "N", "V", "Z" ],
+                 [ "A", "H", "M", "O", "R", "S" ],
+                 [ "B", "F", "I", "O", "R", "X" ],
+                 [ "D", "E", "N", "O", "S", "W" ],
+                 [ "D", "K", "N", "O", "T", "U" ],
+                 [ "E", "E", "F", "H", "I", "Y" ],
+                 [ "E", "G", "I", "N", "T", "V" ],
+                 [ "E", "G", "K", "L", "U", "Y" ],
+                 [ "E", "H", "I", "N", "P", "S" ],
+                 [ "E", "L", "P", "S", "T", "U" ],
+                 [ "G", "I", "L", "R", "U", "W" ]]
+
+# the 5x5 Big Boggle cubes
+BIG_BOGGLE_CUBES = [[ "A", "A", "A", "F", "R", "S" ],
+                    [ "A", "A", "E", "E", "E", "E" ],
+                    [ "A", "A", "F", "I", "R", "S" ],
+                    [ "A", "D", "E", "N", "N", "N" ],
+                    [ "A", "E", "E", "E", "E", "M" ],
+                    [ "A", "E", "E", "G", "M", "U" ],
+                    [ "A", "E", "G", "M", "N", "N" ],
+                    [ "A", "F", "I", "R", "S", "Y" ],
+                    [ "B", "J", "K", "Qu", "X", "Z" ],
+                    [ "C", "C", "E", "N", "S", "T" ],
+                    [ "C", "E", "I", "I", "L", "T" ],
+                    [ "C", "E", "I", "L", "P", "T" ],
+                    [ "C", "E", "I", "P", "S", "T" ],
+                    [ "D", "D", "H", "N", "O", "T" ],
+                    [ "D", "H", "H", "L", "O", "R" ],
+                    [ "D", "H", "L", "N", "O", "R" ],
+                    [ "D", "H", "L", "N", "O", "R" ],
+                    [ "E", "I", "I", "I", "T", "T" ],
+                    [ "E", "M", "O", "T", "T", "T" ],
+                    [ "E", "N", "S", "S", "S", "U" ],
+                    [ "F", "I", "P", "R", "S", "Y" ],
+                    [ "G", "O", "R", "R", "V", "W" ],
+                    [ "I", "P", "R", "R", "R", "Y" ],
+                    [ "N", "O", "O", "T", "U", "W" ],
+                    [ "O", "O", "O", "T", "T", "U" ]]
+
+# the 6x6 Super Boggle cubes, including the digraph cube and blank faces
+SUPER_BOGGLE_CUBES = [[ "A", "A", "A", "F", "R", "S" ],
+                      [ "A", "A", "E", "E", "E", "E" ],
+                      [ "A", "A", "E", "E", "O", "O" ],
+                      [ "A", "A", "F", "I", "R", "S" ],
+                      [ "A", "B", "D", "E", "I", "O" ],
+                      [ "A", "D", "E", "N", "N", "N" ],
+                      [ "A", "E", "E", "E", "E", "M" ],
+                      [ "A", "E", "E", "G", "M", "U" ],
+                      [ "A", "E", "G", "M", "N", "N" ],
+                      [ "A", "E", "I", "L", "M", "N" ],
+                      [ "A", "E", "I", "N", "O", "U" ],
+                      [ "A", "F", "I", "R", "S", "Y" ],
+                      [ "An", "Er", "He", "In", "Qu", "Th" ],
+                      [ "B", "B", "J", "K", "X", "Z" ],
+                      [ "C", "C", "E", "N", "S", "T" ],
+                      [ "C", "D", "D", "L", "N", "N" ],
+                      [ "C", "E", "I", "I", "T", "T" ],
+                      [ "C", "E", "I", "P", "S", "T" ],
+                      [ "C", "F", "G", "N", "U", "Y" ],
+                      [ "D", "D", "H", "N", "O", "T" ],
+                      [ "D", "H", "H", "L", "O", "R" ],
+                      [ "D", "H", "H", "N", "O", "W" ],
+                      [ "D", "H", "L", "N", "O", "R" ],
+                      [ "E", "H", "I", "L", "R", "S" ],
+                      [ "E", "I", "I", "L", "S", "T" ],
+                      [ "E", "I", "L", "P", "S", "T" ],
+                      [ "E", "I", "O", "", "", "" ],
+                      [ "E", "M", "T", "T", "T", "O" ],
+                      [ "E", "N", "S", "S", "S", "U" ],
+                      [ "G", "O", "R", "R", "V", "W" ],
+                      [ "H", "I", "R", "S", "T", "V" ],
+                      [ "H", "O", "P", "R", "S", "T" ],
+                      [ "I", "P", "R", "S", "Y", "Y" ],
+                      [ "J", "K", "Qu", "W", "X", "Z" ],
+                      [ "N", "O", "O", "T", "U", "W" ],
+                      [ "O", "O", "O", "T", "T", "U" ]]
+
+# dice sets by name, as (rows, cols, cubes)
+DICE_SETS = { "classic": (4, 4, CLASSIC_CUBES),
+              "big": (5, 5, BIG_BOGGLE_CUBES),
+              "super": (6, 6, SUPER_BOGGLE_CUBES) }
+
+def getDiceSet(name):
+    """
+    Returns the (rows, cols, cubes) triple for the dice set called name.
+
+    >>> rows, cols, cubes = getDiceSet("big")
+    >>> (rows, cols, len(cubes))
+    (5, 5, 25)
+    """
+    if name not in DICE_SETS:
+        raise ValueError("unknown dice set: {}".format(name))
+    return DICE_SETS[name]
+
+def cubesFor(rows, cols):
+    """
+    Returns the dice set that best fits a rows x cols grid: the set made for
+    that grid size if there is one, otherwise the smallest set with enough
+    cubes, otherwise the largest set (whose cubes are then reused).
+
+    >>> cubesFor(4, 4) is CLASSIC_CUBES
+    True
+    >>> cubesFor(5, 6) is SUPER_BOGGLE_CUBES
+    True
+    >>> cubesFor(8, 8) is SUPER_BOGGLE_CUBES
+    True
+    """
+    best = None
+    for setRows, setCols, cubes in DICE_SETS.values():
+        if (setRows, setCols) == (rows, cols):
+            return cubes
+        if len(cubes) >= rows * cols and (best is None or len(cubes) < len(best)):
+            best = cubes
+    if best is None:
+        best = max((cubes for _, _, cubes in DICE_SETS.values()), key=len)
+    return best
+
+def checkCubes(cubes):
+    """
+    Raises ValueError if cubes is not a usable dice set: it must be a
+    non-empty list of cubes, each with at least one face.
+
+    >>> checkCubes(CLASSIC_CUBES)
+    >>> checkCubes([[]])
+    Traceback (most recent call last):
+    ...
+    ValueError: cube 0 has no faces
+    """
+    if len(cubes) == 0:
+        raise ValueError("a dice set needs at least one cube")
+    for i in range(len(cubes)):
+        if len(cubes[i]) == 0:
+            raise ValueError("cube {} has no faces".format(i))
+
+if __name__ == "__main__":
+    from doctest import testmod
+    testmod()
@@ -1,140 +1,310 @@
-"""Implements the logic of the game of boggle."""
-
-from graphics import GraphWin
-from boggleboard import BoggleBoard
-from boggleletter import BoggleLetter
-from brandom import randomize
-
-class BoggleGame:
-
-    __slots__ = [ "_validWords", "_board", "_foundWords", "_selectedLetters" ]
-
-    def __init__(self, win):
-        """
-        Create a new Boggle Game and load in our lexicon.
-        """
-        # set up the set of valid words we can match
-        self._validWords = self.__readLexicon()
-
-        # initializes the attributes of BoggleGame
-        self._board = BoggleBoard(win)
-        self._foundWords = []
-        self._selectedLetters = []
-
-    def __readLexicon(self, lexiconName='bogwords.txt'):
-        """
-        A helper method to read the lexicon and return it as a set.
-        """
-        validWords = set()
-        with open(lexiconName) as f:
-          for line in f:
-            validWords.add(line.strip().upper())
-
-        return validWords
-
-    def doOneClick(self, point):
-        """
-        Implements the logic for processing one click.
-        Returns True if play should continue, and False if the game is over.
-        """
-        # These steps are one way to think about the design, although
-        # you are free to do things differently if you prefer.
-
-        # step 1: check for exit button and return False if clicked
-
-        if (self._board.inExit(point)):
-            return False
-
-        # step 2: check for reset button and reset
-        if (self._board.inReset(point)):
-            self._board.reset()
-
-        # step 3: check if click is on a cell in the grid
-
-        # checks if the click is in the grid
-        elif self._board.inGrid(point):
-            # finds the BoggleLetter of the square the click was in
-            letter = self._board.getBoggleLetterAtPoint(point)
-            # finds the index of the previous letter clicked
-            recentLetter = len(self._selectedLetters) - 1
-          # if this is the first letter in a word being constructed,
-          # add letter and display it on lower text of board
-            # checks if there are no other letters already selected
-            if self._selectedLetters == []:
-                # adds the letter to selectedLetters and to the the lower text area
-                self._selectedLetters.append(letter)
-                self._board.setStringToLowerText(letter.getLetter())
-                # makes the selected square blue
-                letter.setFillColor("Light Blue")
-                letter.setTextColor("Dark Blue")
-
-          # else if adding a letter to a non-empty word, make sure it's adjacent
-          # and update state
-            # checks if the selected letter is the same as the previous letter selected
-            elif letter == self._selectedLetters[recentLetter]:
-                # sets an empty list to hold the letters in the word
-                tempToCombine = []
-                # adds the text of each selected letter to tempToCombine
-                for let in self._selectedLetters:
-                    tempToCombine.append(let.getLetter())
-                # checks if the word is a valid word that has not already been found
-                if ('').join(tempToCombine) in self._validWords and ('').join(tempToCombine) not in self._foundWords:
-                    # finds all the words in the text area already
-                    a = self._board.getStringFromTextArea()
-                    # adds the word to foundWords
-                    self._foundWords.append(('').join(tempToCombine))
-                    # adds the word to the text area along with all the words already there
-                    self._board.setStringToTextArea(a + '\n' + ('').join(tempToCombine))
-                # resets the colors of the board
-                self._board.resetColors()
-                # empties the lower text area
-                self._board.setStringToLowerText('')
-                # empties selectedLetters
-                self._selectedLetters = []
-                
-            # checks if the letter has already been selected
-            # if so, the board, lower text area, and selectedLetters are all reset in order to start finding a new word
-            elif letter in self._selectedLetters:
-                self._board.resetColors()
-                self._board.setStringToLowerText('')
-                self._selectedLetters = []
-
-            # checks if the letter is adjacent to the previous letter
-            elif letter.isAdjacent(self._selectedLetters[recentLetter]):
-                # in this case, the letter is added to selectedLetters
-                self._selectedLetters.append(letter)
-                # makes a new string of the letters selected so far
-                selected = self._board.getStringFromLowerText() + letter.getLetter()
-                # sets the lower text area to show that string
-                self._board.setStringToLowerText(selected)
-                # changes the color of the letter just clicked to blue
-                letter.setFillColor("Light Blue")
-                letter.setTextColor("Dark Blue")
-                # finds the number of selected letters
-                numLets = len(self._selectedLetters)
-                # changes the color of the previous letter to green
-                self._selectedLetters[numLets - 2].setFillColor("Light Green")
-                self._selectedLetters[numLets - 2].setTextColor("Dark Green")
-           
-                
-          # else if clicked anywhere else, reset the state to an empty word.
-            else:
-                self._selectedLetters = []
-                self._board.resetColors()
-                self._board.setStringToLowerText('')
-        # return True to indicate we want to keep 
-        return True
-
-if __name__ == '__main__':
-
-    # When you are ready to run on different boards,
-    # insert a call to randomize() here.  BUT you will
-    # find it much easier to test your code without
-    # randomizing things!
-
-    win = GraphWin("Boggle", 400, 400)
-    game = BoggleGame(win)
-    keepGoing = True
-    while keepGoing:
-        point = win.getMouse()
-        keepGoing = game.doOneClick(point)
+"""Implements the logic of the game of boggle."""
+
+import os
+import sys
+from bogglecubes import getDiceSet
+from scoring import getRules
+from lexiconregistry import LEXICONS
+from sessionlog import SessionRecorder
+from events import BOARD, SELECT, WORD, OVER
+import instrument
+import metrics
+from metrics import REGISTRY
+
+# game metrics (see metrics.py); updating one is a single add
+_gamesCreated = REGISTRY.counter("boggle_games_created_total", "Boggle games created.")
+_resets = REGISTRY.counter("boggle_resets_total", "Board resets.")
+_lookups = REGISTRY.counter("boggle_lexicon_lookups_total", "Submitted words looked up in the lexicon.")
+_accepted = REGISTRY.counter("boggle_submissions_total", "Words submitted.", result="accepted")
+_rejected = REGISTRY.counter("boggle_submissions_total", "Words submitted.", result="rejected")
+
+class BoggleGame:
+
+    __slots__ = [ "_validWords", "_board", "_foundWords", "_selectedLetters", "_recorder",
+                  "_events", "_name", "_minLength" ]
+
+    def __init__(self, win, rows=4, cols=4, cubes=None, seed=None, board=None,
+                 lexicon=None, minLength=3):
+        """
+        Create a new Boggle Game on a rows x cols board and load in our
+        lexicon.  cubes is the dice set to shake, and defaults to the one
+        made for that board size.  Games with the same seed play the same
+        sequence of boards.  To play on a board that is already made (such
+        as a HeadlessBoggleBoard), pass it as board; win and the board
+        settings are then ignored.  lexicon is a Lexicon, or the name or
+        path of one to get from the process-wide registry (bogwords.txt by
+        default), so games share one copy of each dictionary.  Words
+        shorter than minLength letters are not accepted (Big and Super
+        Boggle want four; see scoring.py).
+        """
+        # set up the set of valid words we can match
+        if lexicon is None:
+            lexicon = self.__readLexicon()
+        elif isinstance(lexicon, str):
+            lexicon = self.__readLexicon(lexicon)
+        self._validWords = lexicon
+
+        # initializes the attributes of BoggleGame
+        if board is None:
+            # the graphical board is imported here, so the game logic can
+            # also run headless, without Tk
+            from boggleboard import BoggleBoard
+            board = BoggleBoard(win, rows, cols, cubes, seed)
+        self._board = board
+        self._foundWords = []
+        self._selectedLetters = []
+        self._recorder = None
+        self._events = None
+        self._name = None
+        self._minLength = minLength
+        _gamesCreated.inc()
+
+    def __readLexicon(self, lexiconName='bogwords.txt'):
+        """
+        A helper method to get the lexicon as a Lexicon, which works like a
+        set of upper case words.  It is read once per process and shared
+        through the registry (see lexiconregistry.py); lexiconName may be a
+        registered name or the path of a word list, which is streamed and
+        may be compressed (see wordsource.py).
+        """
+        return LEXICONS.get(lexiconName)
+
+    def getBoard(self):
+        return self._board
+
+    def getLexicon(self):
+        return self._validWords
+
+    def getFoundWords(self):
+        """Returns the list of words found so far, in the order found."""
+        return self._foundWords
+
+    def reset(self):
+        """
+        Shakes a new board and starts a new word list, as the reset button does.
+        """
+        self._board.reset()
+        self._foundWords = []
+        self._selectedLetters = []
+        _resets.inc()
+        if self._recorder is not None:
+            self._recorder.recordBoard(self._board.getCode())
+        if self._events is not None:
+            self.__publishBoard()
+
+    def startRecording(self, path):
+        """
+        Starts recording this session (the boards and every click) to a
+        session log at path, for replay.py to play back.
+        """
+        self.stopRecording()
+        board = self._board
+        self._recorder = SessionRecorder(path, board.getRows(), board.getCols(), board.getSeed(),
+                                         minLength=self._minLength)
+        self._recorder.recordBoard(board.getCode())
+
+    def stopRecording(self):
+        """Stops recording and closes the session log."""
+        if self._recorder is not None:
+            self._recorder.close()
+            self._recorder = None
+
+    def publishTo(self, bus, name):
+        """
+        Publishes this game's events (see events.py) to the EventBus bus,
+        under the game name name, starting with its board.  Pass None for
+        bus to stop.
+        """
+        self._events = bus
+        self._name = name
+        if bus is not None:
+            self.__publishBoard()
+
+    def end(self):
+        """
+        Publishes that the game is over, for games ended other than by the
+        exit button (which publishes it itself), such as by a round timer.
+        """
+        if self._events is not None:
+            self._events.publish((OVER, self._name))
+
+    def __publishBoard(self):
+        board = self._board
+        self._events.publish((BOARD, self._name, board.getCode().hex(), board.getRows(), board.getCols()))
+
+    def __selection(self):
+        """Returns the cells of the selected letters, as row-major indexes."""
+        cols = self._board.getCols()
+        return [letter.getRow() * cols + letter.getCol() for letter in self._selectedLetters]
+
+    def __publishClick(self, foundBefore, selectionBefore):
+        """Publishes what a click changed, given the word count and selection before it."""
+        if len(self._foundWords) > foundBefore:
+            self._events.publish((WORD, self._name, self._foundWords[-1]))
+        selection = self.__selection()
+        if selection != selectionBefore:
+            self._events.publish((SELECT, self._name, selection))
+
+    def doOneClick(self, point):
+        """
+        Implements the logic for processing one click.
+        Returns True if play should continue, and False if the game is over.
+        """
+        # These steps are one way to think about the design, although
+        # you are free to do things differently if you prefer.
+
+        if self._recorder is not None:
+            self._recorder.recordClick(point)
+        if self._events is not None:
+            foundBefore, selectionBefore = len(self._foundWords), self.__selection()
+
+        # step 1: check for exit button and return False if clicked
+
+        if (self._board.inExit(point)):
+            self.end()
+            return False
+
+        # step 2: check for reset button and reset
+        if (self._board.inReset(point)):
+            self.reset()
+
+        # step 3: check if click is on a cell in the grid
+
+        # checks if the click is in the grid
+        elif self._board.inGrid(point):
+            # finds the BoggleLetter of the square the click was in
+            letter = self._board.getBoggleLetterAtPoint(point)
+            # finds the index of the previous letter clicked
+            recentLetter = len(self._selectedLetters) - 1
+          # blank faces can never be part of a word, so clicking one
+          # starts over with an empty word
+            if letter.getLetter() == '':
+                self._selectedLetters = []
+                self._board.resetColors()
+                self._board.setStringToLowerText('')
+
+          # if this is the first letter in a word being constructed,
+          # add letter and display it on lower text of board
+            # checks if there are no other letters already selected
+            elif self._selectedLetters == []:
+                # adds the letter to selectedLetters and to the the lower text area
+                self._selectedLetters.append(letter)
+                self._board.setStringToLowerText(letter.getLetter())
+                # makes the selected square blue
+                letter.setFillColor("Light Blue")
+                letter.setTextColor("Dark Blue")
+
+          # else if adding a letter to a non-empty word, make sure it's adjacent
+          # and update state
+            # checks if the selected letter is the same as the previous letter selected
+            elif letter == self._selectedLetters[recentLetter]:
+                # sets an empty list to hold the letters in the word
+                tempToCombine = []
+                # adds the text of each selected letter to tempToCombine
+                # (upper cased, since faces such as "Qu" hold more than one letter)
+                for let in self._selectedLetters:
+                    tempToCombine.append(let.getLetter().upper())
+                # checks if the word is a valid word, long enough for the variant,
+                # that has not already been found
+                _lookups.inc()
+                if len(('').join(tempToCombine)) >= self._minLength and \
+                   ('').join(tempToCombine) in self._validWords and ('').join(tempToCombine) not in self._foundWords:
+                    _accepted.inc()
+                    # finds all the words in the text area already
+                    a = self._board.getStringFromTextArea()
+                    # adds the word to foundWords
+                    self._foundWords.append(('').join(tempToCombine))
+                    # adds the word to the text area along with all the words already there
+                    self._board.setStringToTextArea(a + '\n' + ('').join(tempToCombine))
+                else:
+                    _rejected.inc()
+                # resets the colors of the board
+                self._board.resetColors()
+                # empties the lower text area
+                self._board.setStringToLowerText('')
+                # empties selectedLetters
+                self._selectedLetters = []
+                
+            # checks if the letter has already been selected
+            # if so, the board, lower text area, and selectedLetters are all reset in order to start finding a new word
+            elif letter in self._selectedLetters:
+                self._board.resetColors()
+                self._board.setStringToLowerText('')
+                self._selectedLetters = []
+
+            # checks if the letter is adjacent to the previous letter
+            elif letter.isAdjacent(self._selectedLetters[recentLetter]):
+                # in this case, the letter is added to selectedLetters
+                self._selectedLetters.append(letter)
+                # makes a new string of the letters selected so far
+                selected = self._board.getStringFromLowerText() + letter.getLetter()
+                # sets the lower text area to show that string
+                self._board.setStringToLowerText(selected)
+                # changes the color of the letter just clicked to blue
+                letter.setFillColor("Light Blue")
+                letter.setTextColor("Dark Blue")
+                # finds the number of selected letters
+                numLets = len(self._selectedLetters)
+                # changes the color of the previous letter to green
+                self._selectedLetters[numLets - 2].setFillColor("Light Green")
+                self._selectedLetters[numLets - 2].setTextColor("Dark Green")
+           
+                
+          # else if clicked anywhere else, reset the state to an empty word.
+            else:
+                self._selectedLetters = []
+                self._board.resetColors()
+                self._board.setStringToLowerText('')
+        if self._events is not None:
+            self.__publishClick(foundBefore, selectionBefore)
+        # return True to indicate we want to keep 
+        return True
+
+if __name__ == '__main__':
+
+    # Every game shakes its boards with a fresh random seed.  Pass a seed
+    # after the dice set name to replay the same boards, which makes
+    # testing much easier!
+
+    # an optional dice set name picks the variant: classic, big or super
+    variant = sys.argv[1] if len(sys.argv) > 1 else "classic"
+    rows, cols, cubes = getDiceSet(variant)
+    # the variant's rules set the shortest word it accepts (see scoring.py)
+    rules = getRules(variant)
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    from graphwin import GraphWin
+    from boggleboard import BoggleBoard
+
+    # BOGGLE_INSTRUMENT=1 turns on latency instrumentation (see instrument.py)
+    # (run as a script, this module is __main__, so its class is passed in)
+    instrument.enableFromEnvironment(targets=[(BoggleGame, "doOneClick", "click")])
+    # BOGGLE_METRICS_PORT / BOGGLE_METRICS_FILE export metrics (see metrics.py)
+    metrics.exportFromEnvironment()
+    width, height = BoggleBoard.windowSize(rows, cols)
+    win = GraphWin("Boggle", width, height)
+    game = BoggleGame(win, rows, cols, cubes, seed, minLength=rules.getMinLength())
+    # BOGGLE_DAILY=<archive> starts on today's puzzle (see dailypuzzles.py)
+    from dailypuzzles import loadFromEnvironment
+    loadFromEnvironment(game.getBoard())
+    # BOGGLE_RECORD=<file> records the session for replay.py
+    if os.environ.get("BOGGLE_RECORD"):
+        game.startRecording(os.environ["BOGGLE_RECORD"])
+    # BOGGLE_SPECTATOR_PORT=<port> lets spectators watch (see spectator.py)
+    # and BOGGLE_HISTORY=<database> keeps a game history (see history.py)
+    from events import EventBus
+    from history import recordFromEnvironment
+    from spectator import serveFromEnvironment
+    bus = EventBus()
+    spectators = serveFromEnvironment(bus)
+    history = recordFromEnvironment(bus, rules)
+    if bus.hasSubscribers():
+        game.publishTo(bus, "1")
+    keepGoing = True
+    while keepGoing:
+        point = win.getMouse()
+        keepGoing = game.doOneClick(point)
+    game.stopRecording()
+    if spectators is not None:
+        spectators.close()
+    if history is not None:
+        history.close()
@@ -0,0 +1,360 @@
+"""
+Finds every word on a Boggle board, and the path of cubes that spells a
+given word.  Boards are given as a row-major list of faces, as returned by
+BoggleBoard.getLetters().  Both searches skip the words that the letter
+counts say can not fit on the board.
+
+A ParallelSolver splits the search of one big board across a pool of
+processes, which share the lexicon through shared memory.
+"""
+
+import multiprocessing
+import os
+import time
+
+from lexicon import prefixRange, letterCounts, boardCounts
+from sharedlexicon import SharedLexicon
+from metrics import REGISTRY
+
+_solveSeconds = REGISTRY.histogram("boggle_solve_seconds", "Time to solve one board.")
+
+# the fewest letters a word may have
+MIN_LENGTH = 3
+
+_neighborCache = {}
+
+def neighbors(rows, cols):
+    """
+    Returns, for each cell of a rows x cols grid (row-major), the list of
+    the cells next to it, horizontally, vertically or diagonally.
+
+    >>> neighbors(2, 3)[0]
+    [1, 3, 4]
+    >>> len(neighbors(4, 4)[5])
+    8
+    """
+    if (rows, cols) not in _neighborCache:
+        adjacent = []
+        for r in range(rows):
+            for c in range(cols):
+                cells = []
+                for nr in range(r - 1, r + 2):
+                    for nc in range(c - 1, c + 2):
+                        if 0 <= nr < rows and 0 <= nc < cols and (nr, nc) != (r, c):
+                            cells.append(nr * cols + nc)
+                adjacent.append(cells)
+        _neighborCache[(rows, cols)] = adjacent
+    return _neighborCache[(rows, cols)]
+
+def solve(letters, rows, cols, lexicon, minLength=MIN_LENGTH):
+    """
+    Returns the sorted list of every word in lexicon that can be spelled
+    on a rows x cols board showing letters.
+
+    >>> from lexicon import Lexicon
+    >>> lex = Lexicon(["cat", "cats", "act", "quit", "tact", "scat"])
+    >>> solve(["C", "A", "T", "S"], 2, 2, lex)
+    ['ACT', 'CAT', 'CATS', 'SCAT']
+    >>> solve(["Qu", "I", "", "T"], 2, 2, lex)
+    ['QUIT']
+    """
+    start = time.perf_counter()
+    if lexicon.isVectorized():
+        words = lexicon.candidates(letters)
+    else:
+        words = lexicon.getWords()
+    found = solveWords(letters, rows, cols, words, minLength)
+    _solveSeconds.observe(time.perf_counter() - start)
+    return found
+
+def solveWords(letters, rows, cols, words, minLength=MIN_LENGTH, starts=None):
+    """
+    Returns the sorted list of the words of the sorted list words that can
+    be spelled on a rows x cols board showing letters.  starts, if given,
+    limits the search to the paths that begin with one of its tuples of
+    adjacent cells, so a board can be solved in parts.
+
+    >>> words = ["ACT", "CAT", "CATS", "SCAT", "TACT"]
+    >>> solveWords(["C", "A", "T", "S"], 2, 2, words, starts=[(0,), (3, 0)])
+    ['CAT', 'CATS', 'SCAT']
+    """
+    faces = [face.upper() for face in letters]
+    adjacent = neighbors(rows, cols)
+    used = [False] * len(faces)
+    found = set()
+
+    def search(cell, prefix, lo, hi):
+        # narrow the word range to the words starting with the new prefix
+        prefix += faces[cell]
+        lo, hi = prefixRange(words, prefix, lo, hi)
+        if lo == hi:
+            return
+        if words[lo] == prefix and len(prefix) >= minLength:
+            found.add(prefix)
+        used[cell] = True
+        for other in adjacent[cell]:
+            if not used[other] and faces[other]:
+                search(other, prefix, lo, hi)
+        used[cell] = False
+
+    def begin(path):
+        # follow the cells of path before the last one, then search on from it
+        prefix, lo, hi = "", 0, len(words)
+        walked = []
+        for cell in path[:-1]:
+            if not faces[cell] or used[cell]:
+                break
+            prefix += faces[cell]
+            lo, hi = prefixRange(words, prefix, lo, hi)
+            if lo == hi:
+                break
+            if words[lo] == prefix and len(prefix) >= minLength:
+                found.add(prefix)
+            used[cell] = True
+            walked.append(cell)
+        else:
+            if faces[path[-1]] and not used[path[-1]]:
+                search(path[-1], prefix, lo, hi)
+        for cell in walked:
+            used[cell] = False
+
+    if words:
+        if starts is None:
+            for cell in range(len(faces)):
+                if faces[cell]:
+                    search(cell, "", 0, len(words))
+        else:
+            for path in starts:
+                begin(path)
+    return sorted(found)
+
+def partitions(letters, rows, cols, count):
+    """
+    Splits the search of a board into at least count parts where it can:
+    one per starting cell, or, when that gives too few parts, one per
+    starting cell and neighbor.  Returns a list of cell tuples for the
+    starts argument of solveWords.
+
+    >>> partitions(["C", "A", "T", "S"], 2, 2, 4)
+    [(0,), (1,), (2,), (3,)]
+    >>> len(partitions(["C", "A", "T", ""], 2, 2, 4))
+    6
+    """
+    cells = [cell for cell in range(len(letters)) if letters[cell]]
+    if len(cells) >= count:
+        return [(cell,) for cell in cells]
+    adjacent = neighbors(rows, cols)
+    return [(cell, other) for cell in cells for other in adjacent[cell] if letters[other]]
+
+def findPath(word, letters, rows, cols):
+    """
+    Returns the list of cells (row-major indexes) that spells word on a
+    rows x cols board showing letters, or None if word is not on the board.
+
+    >>> findPath("CAT", ["C", "A", "T", "S"], 2, 2)
+    [0, 1, 2]
+    >>> findPath("QUIT", ["Qu", "I", "T", "S"], 2, 2)
+    [0, 1, 2]
+    >>> findPath("DOG", ["C", "A", "T", "S"], 2, 2) is None
+    True
+    """
+    word = word.upper()
+    # skip the search when the board lacks the word's letters
+    available = boardCounts(letters)
+    needed = letterCounts(word)
+    for i in range(26):
+        if needed[i] > available[i]:
+            return None
+    faces = [face.upper() for face in letters]
+    adjacent = neighbors(rows, cols)
+    path = []
+
+    def search(cell, start):
+        face = faces[cell]
+        if not face or not word.startswith(face, start) or cell in path:
+            return False
+        path.append(cell)
+        if start + len(face) == len(word):
+            return True
+        for other in adjacent[cell]:
+            if search(other, start + len(face)):
+                return True
+        path.pop()
+        return False
+
+    for cell in range(len(faces)):
+        if search(cell, 0):
+            return path
+    return None
+
+def solveBoard(board, lexicon, minLength=MIN_LENGTH):
+    """Returns the sorted list of every word in lexicon on a BoggleBoard."""
+    return solve(board.getLetters(), board.getRows(), board.getCols(), lexicon, minLength)
+
+
+class AnytimeSolver:
+    """
+    Solves a board a slice of time at a time, so a caller on a game loop
+    can stop the search at a deadline, use the words found so far and
+    resume later.  The search is an explicit-stack depth-first search;
+    run() picks it up where the last call left off.
+
+    >>> from lexicon import Lexicon
+    >>> lex = Lexicon(["cat", "cats", "act", "quit", "tact", "scat"])
+    >>> solver = AnytimeSolver(["C", "A", "T", "S"], 2, 2, lex)
+    >>> solver.run(steps=1)
+    False
+    >>> solver.run()
+    True
+    >>> solver.getWords(), solver.getBest(2, score=len)
+    (['ACT', 'CAT', 'CATS', 'SCAT'], ['CATS', 'SCAT'])
+    """
+
+    __slots__ = ["_faces", "_adjacent", "_words", "_minLength", "_stack", "_found"]
+
+    # how many search steps to take between looks at the clock
+    CHECK_EVERY = 256
+
+    def __init__(self, letters, rows, cols, lexicon, minLength=MIN_LENGTH):
+        self._faces = [face.upper() for face in letters]
+        self._adjacent = neighbors(rows, cols)
+        self._words = lexicon.candidates(letters) if lexicon.isVectorized() else lexicon.getWords()
+        self._minLength = minLength
+        self._found = set()
+        # each entry is (cell, prefix before it, word range, cells used before it)
+        self._stack = []
+        if self._words:
+            for cell in range(len(self._faces) - 1, -1, -1):
+                if self._faces[cell]:
+                    self._stack.append((cell, "", 0, len(self._words), 0))
+
+    def isDone(self):
+        return not self._stack
+
+    def run(self, deadline=None, steps=None):
+        """
+        Searches until the board is solved, the time.perf_counter() value
+        deadline passes or steps search steps are taken, whichever comes
+        first.  Returns True once the board is solved.
+        """
+        faces, adjacent, words = self._faces, self._adjacent, self._words
+        minLength, stack, found = self._minLength, self._stack, self._found
+        clock = time.perf_counter
+        taken = 0
+        while stack:
+            if steps is not None and taken >= steps:
+                break
+            taken += 1
+            if deadline is not None and taken % self.CHECK_EVERY == 0 and clock() >= deadline:
+                break
+            cell, prefix, lo, hi, used = stack.pop()
+            prefix += faces[cell]
+            lo, hi = prefixRange(words, prefix, lo, hi)
+            if lo == hi:
+                continue
+            if words[lo] == prefix and len(prefix) >= minLength:
+                found.add(prefix)
+            used |= 1 << cell
+            for other in adjacent[cell]:
+                if not used & (1 << other) and faces[other]:
+                    stack.append((other, prefix, lo, hi, used))
+        return not stack
+
+    def getWords(self):
+        """Returns the sorted list of the words found so far."""
+        return sorted(self._found)
+
+    def getBest(self, count=None, score=len):
+        """
+        Returns the words found so far, best first: highest score(word),
+        then longest, then alphabetical.  count limits how many.
+        """
+        best = sorted(self._found, key=lambda word: (-score(word), -len(word), word))
+        return best if count is None else best[:count]
+
+
+# the last board a worker process solved part of, and its candidate words
+_lastBoard = [None, None]
+
+def _solvePart(lexicon, letters, rows, cols, minLength, starts):
+    """Solves the parts starts of a board, in a worker process."""
+    key = (id(lexicon), tuple(letters))
+    if _lastBoard[0] != key:
+        # every part of a board searches the same candidates, so find them once
+        words = lexicon.candidates(letters) if lexicon.isVectorized() else lexicon.getWords()
+        _lastBoard[:] = [key, words]
+    return solveWords(letters, rows, cols, _lastBoard[1], minLength, starts)
+
+
+class ParallelSolver:
+    """
+    Solves boards like solve(), splitting each board's search by starting
+    cell (or starting cell and neighbor) across a pool of processes.  The
+    parts are merged into one sorted list, so the result is the same as
+    solve() gives.  It pays off on big boards with big lexicons; the pool
+    and the shared lexicon are made once, so reuse the solver.
+
+    >>> from lexicon import Lexicon
+    >>> lex = Lexicon(["cat", "cats", "act", "quit", "tact", "scat"])
+    >>> with ParallelSolver(lex, processes=2) as solver:
+    ...     solver.solve(["C", "A", "T", "S"], 2, 2)
+    ['ACT', 'CAT', 'CATS', 'SCAT']
+    """
+
+    __slots__ = ["_lexicon", "_shared", "_processes", "_pool"]
+
+    def __init__(self, lexicon, processes=None):
+        """
+        lexicon is a Lexicon, which is copied into shared memory, or a
+        SharedLexicon.  processes defaults to the number of CPUs.
+        """
+        self._processes = processes or os.cpu_count() or 1
+        if isinstance(lexicon, SharedLexicon):
+            self._shared = None
+            self._lexicon = lexicon
+        else:
+            self._shared = self._lexicon = SharedLexicon.create(lexicon)
+        self._pool = multiprocessing.Pool(self._processes)
+
+    def getProcesses(self):
+        return self._processes
+
+    def solve(self, letters, rows, cols, minLength=MIN_LENGTH):
+        """
+        Returns the sorted list of every word in the lexicon that can be
+        spelled on a rows x cols board showing letters.
+        """
+        start = time.perf_counter()
+        # a few parts per process, so a slow part does not hold up the rest
+        parts = partitions(letters, rows, cols, 4 * self._processes)
+        count = min(len(parts), 4 * self._processes)
+        tasks = [(self._lexicon, letters, rows, cols, minLength, parts[n::count])
+                 for n in range(count)]
+        found = set()
+        for words in self._pool.starmap(_solvePart, tasks, chunksize=1):
+            found.update(words)
+        _solveSeconds.observe(time.perf_counter() - start)
+        return sorted(found)
+
+    def solveBoard(self, board, minLength=MIN_LENGTH):
+        """Returns the sorted list of every word in the lexicon on a BoggleBoard."""
+        return self.solve(board.getLetters(), board.getRows(), board.getCols(), minLength)
+
+    def close(self):
+        """Stops the worker processes and frees the shared lexicon, if this solver made it."""
+        self._pool.close()
+        self._pool.join()
+        if self._shared is not None:
+            self._shared.unlink()
+            self._shared = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+if __name__ == "__main__":
+    from doctest import testmod
+    testmod()
@@ -0,0 +1,292 @@
+"""
+The daily puzzle: one board a day, with its word list and best possible
+score worked out ahead of time.
+
+buildArchive() shakes, filters and solves the boards of a run of days and
+stores them in one archive file.  DailyArchive reads it through an mmap,
+so the puzzle for a date is found with a subtraction and a slice, without
+solving anything:
+
+    python3 dailypuzzles.py build daily.bogd today 365
+    python3 dailypuzzles.py show daily.bogd 2027-03-14
+
+An archive is a 28 byte header (magic, version, rows, cols, first day as a
+date ordinal, number of days, the size and CRC-32 of the lexicon the word
+IDs index, and the number of word IDs), then one record per day (offset
+and count of its word IDs, best score; three uint32s), then the board
+codes of every day (see boardcode.py), then the word IDs (uint32 indexes
+into the sorted lexicon) of every day's solution.
+"""
+
+import datetime
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+from bisect import bisect_left
+
+from brandom import RandomStream
+from bogglecubes import getDiceSet
+from boardcode import codesFromShakes, decode
+from bogglesolver import solve
+from scoring import getRules
+
+MAGIC = b"BOGD"
+VERSION = 1
+HEADER = struct.Struct("<4sBBBxIIIII")
+_DAY = struct.Struct("<III")
+
+# boards shaken at a time while looking for one that passes the filter
+_BATCH = 16
+
+def lexiconChecksum(lexicon):
+    """Returns the CRC-32 of the sorted words of lexicon, to tell lexicons apart."""
+    crc = 0
+    for word in lexicon.getWords():
+        crc = zlib.crc32(word.encode("ascii") + b"\n", crc)
+    return crc
+
+def dayBoards(day, diceSet, seed):
+    """
+    Yields an endless stream of (code, letters) boards for date day.  Each
+    day has its own random stream, so any one day can be rebuilt alone.
+    """
+    rows, cols, cubes = getDiceSet(diceSet)
+    stream = RandomStream("{}/{}".format(seed, day.isoformat()))
+    faceCounts = [len(cube) for cube in cubes]
+    while True:
+        order, faces = stream.shakes(_BATCH, faceCounts, rows * cols)
+        for code in codesFromShakes(cubes, order, faces, rows * cols):
+            yield code, decode(code)
+
+def buildArchive(path, start, days, lexicon, diceSet="classic", seed=0,
+                 minWords=40, maxWords=None, rules=None, maxAttempts=10000):
+    """
+    Builds the archive of the puzzles for days days from the date start.
+    Each day gets the first board of its random stream with at least
+    minWords (and at most maxWords, if given) words in lexicon.  Scores
+    are by rules, which default to those of diceSet.  Returns the number
+    of boards solved to find them.  Raises RuntimeError if a day has no
+    such board in its first maxAttempts, as when the limits can not be met
+    with this lexicon.
+
+    >>> from lexicon import Lexicon
+    >>> buildArchive("never.bogd", datetime.date(2027, 1, 1), 1, Lexicon(["cat"]), maxAttempts=20)
+    Traceback (most recent call last):
+    ...
+    RuntimeError: no board for 2027-01-01 with 40 or more words in 20 attempts
+    """
+    rows, cols, cubes = getDiceSet(diceSet)
+    if rules is None:
+        rules = getRules(diceSet)
+    words = lexicon.getWords()
+    records = []
+    codes = []
+    ids = array("I")
+    solved = 0
+    for n in range(days):
+        day = start + datetime.timedelta(days=n)
+        for attempt, (code, letters) in enumerate(dayBoards(day, diceSet, seed)):
+            if attempt >= maxAttempts:
+                raise RuntimeError("no board for {} with {} or more{} words in {} attempts".format(
+                    day, minWords, "" if maxWords is None else " (at most {})".format(maxWords),
+                    maxAttempts))
+            solved += 1
+            found = solve(letters, rows, cols, lexicon, minLength=rules.getMinLength())
+            if len(found) >= minWords and (maxWords is None or len(found) <= maxWords):
+                break
+        records.append((len(ids), len(found), rules.totalScore(found)))
+        codes.append(code)
+        ids.extend(bisect_left(words, word) for word in found)
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, rows, cols, start.toordinal(), days,
+                            len(words), lexiconChecksum(lexicon), len(ids)))
+        for record in records:
+            f.write(_DAY.pack(*record))
+        f.write(b"".join(codes))
+        # pad so the word IDs start on a 4 byte boundary
+        f.write(b"\0" * (-(rows * cols * days) % 4))
+        if sys.byteorder != "little":
+            ids.byteswap()
+        f.write(ids.tobytes())
+    return solved
+
+
+class DailyArchive:
+    """
+    Reads a daily puzzle archive.  Every lookup by date is O(1).
+
+    >>> import os, tempfile
+    >>> from lexicon import Lexicon
+    >>> lex = Lexicon(["ant", "bat", "cat", "rat", "tan", "tar", "art", "eat", "tea", "ate"])
+    >>> path = os.path.join(tempfile.mkdtemp(), "daily.bogd")
+    >>> start = datetime.date(2027, 1, 1)
+    >>> buildArchive(path, start, 3, lex, minWords=2) >= 3
+    True
+    >>> with DailyArchive(path) as archive:
+    ...     day = start + datetime.timedelta(days=2)
+    ...     print(len(archive), day in archive, archive.getFirstDate())
+    ...     words = archive.getWords(day, lex)
+    ...     print(len(words) >= 2, archive.getMaxScore(day) == len(words))
+    ...     print(solve(decode(archive.getCode(day)), 4, 4, lex) == words)
+    3 True 2027-01-01
+    True True
+    True
+
+    The solutions hold only the words the rules accept:
+
+    >>> lex = Lexicon.fromFile(os.path.join(os.path.dirname(os.path.abspath(__file__)), "bogwords.txt"))
+    >>> buildArchive(path, start, 1, lex, diceSet="big", minWords=2) >= 1
+    True
+    >>> with DailyArchive(path) as archive:
+    ...     words = archive.getWords(start, lex)
+    ...     print(len(words) >= 2, min(len(word) for word in words))
+    True 4
+    """
+
+    __slots__ = ["_file", "_map", "_rows", "_cols", "_firstDay", "_days", "_lexiconSize",
+                 "_lexiconCrc", "_codesAt", "_ids", "_checked"]
+
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        header = self._file.read(HEADER.size)
+        if len(header) != HEADER.size:
+            self._file.close()
+            raise ValueError("{} is not a daily puzzle archive".format(path))
+        magic, version, self._rows, self._cols, self._firstDay, self._days, \
+            self._lexiconSize, self._lexiconCrc, idCount = HEADER.unpack(header)
+        if magic != MAGIC or version != VERSION:
+            self._file.close()
+            raise ValueError("{} is not a version {} daily puzzle archive".format(path, VERSION))
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._codesAt = HEADER.size + _DAY.size * self._days
+        idsAt = self._codesAt + self._rows * self._cols * self._days
+        idsAt += -idsAt % 4
+        self._ids = memoryview(self._map)[idsAt:idsAt + 4 * idCount].cast("I")
+        # the lexicon last found to match the word IDs
+        self._checked = None
+
+    def getRows(self):
+        return self._rows
+
+    def getCols(self):
+        return self._cols
+
+    def getFirstDate(self):
+        return datetime.date.fromordinal(self._firstDay)
+
+    def __len__(self):
+        return self._days
+
+    def __contains__(self, day):
+        return 0 <= day.toordinal() - self._firstDay < self._days
+
+    def __index(self, day):
+        n = day.toordinal() - self._firstDay
+        if not 0 <= n < self._days:
+            raise KeyError("no puzzle for {}".format(day))
+        return n
+
+    def __record(self, day):
+        return _DAY.unpack_from(self._map, HEADER.size + _DAY.size * self.__index(day))
+
+    def getCode(self, day):
+        """Returns the board code (bytes) of the puzzle for date day."""
+        size = self._rows * self._cols
+        start = self._codesAt + size * self.__index(day)
+        return self._map[start:start + size]
+
+    def getMaxScore(self, day):
+        """Returns the best possible score of the puzzle for date day."""
+        return self.__record(day)[2]
+
+    def getWordIds(self, day):
+        """
+        Returns the solution of the puzzle for date day as a read-only
+        sequence of indexes into the sorted words of the lexicon.
+        """
+        offset, count, score = self.__record(day)
+        return self._ids[offset:offset + count]
+
+    def getWords(self, day, lexicon):
+        """
+        Returns the sorted solution of the puzzle for date day.  lexicon
+        must be the one the archive was built with; ValueError otherwise.
+        """
+        if lexicon is not self._checked:
+            if len(lexicon) != self._lexiconSize or lexiconChecksum(lexicon) != self._lexiconCrc:
+                raise ValueError("the archive was built with a different lexicon")
+            self._checked = lexicon
+        words = lexicon.getWords()
+        return [words[n] for n in self.getWordIds(day)]
+
+    def close(self):
+        self._ids.release()
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def loadFromEnvironment(board, day=None):
+    """
+    Sets the letters of board to the puzzle for date day (today by
+    default) from the archive at BOGGLE_DAILY, if set.  Returns True if
+    the puzzle was loaded.  If the archive can not be read, has no puzzle
+    for the day or is for another grid size, says so on stderr, leaves
+    the shaken board as it is and returns False.
+    """
+    path = os.environ.get("BOGGLE_DAILY")
+    if not path:
+        return False
+    if day is None:
+        day = datetime.date.today()
+    try:
+        with DailyArchive(path) as archive:
+            if (archive.getRows(), archive.getCols()) != (board.getRows(), board.getCols()):
+                problem = "has {}x{} puzzles".format(archive.getRows(), archive.getCols())
+            elif day not in archive:
+                first = archive.getFirstDate()
+                problem = "has no puzzle for {} (only {} to {})".format(
+                    day, first, first + datetime.timedelta(days=len(archive) - 1))
+            else:
+                board.loadPuzzle(archive, day)
+                return True
+    except (OSError, ValueError) as error:
+        problem = "can not be read ({})".format(error)
+    print("daily: {} {}; playing a shaken board".format(path, problem), file=sys.stderr)
+    return False
+
+def main(argv):
+    from lexiconregistry import LEXICONS
+    lexicon = LEXICONS.get("bogwords.txt")
+    if len(argv) >= 4 and argv[0] == "build":
+        start = datetime.date.today() if argv[2] == "today" else datetime.date.fromisoformat(argv[2])
+        diceSet = argv[4] if len(argv) > 4 else "classic"
+        solved = buildArchive(argv[1], start, int(argv[3]), lexicon, diceSet)
+        print("{} days from {}; {} boards solved".format(argv[3], start, solved))
+    elif len(argv) >= 2 and argv[0] == "show":
+        with DailyArchive(argv[1]) as archive:
+            day = datetime.date.fromisoformat(argv[2]) if len(argv) > 2 else datetime.date.today()
+            letters = decode(archive.getCode(day))
+            cols = archive.getCols()
+            for r in range(archive.getRows()):
+                print(" ".join("{:2}".format(face or ".") for face in letters[r * cols:(r + 1) * cols]))
+            words = archive.getWords(day, lexicon)
+            print("{} words, best score {}".format(len(words), archive.getMaxScore(day)))
+            print(" ".join(words))
+    else:
+        print("usage: python3 dailypuzzles.py build FILE START|today DAYS [classic|big|super]\n"
+              "       python3 dailypuzzles.py show FILE [DATE]")
+        return 2
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
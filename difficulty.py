@@ -0,0 +1,311 @@
+"""
+A fast estimate of how rich a board is, for ranking many boards without
+solving each one.
+
+The estimator works from cheap features of a board's code (see
+boardcode.py).  These are how common its letters are in the lexicon, how
+many vowels it has and how well connected they are, how often its
+neighboring faces and paths of three faces spell letter pairs and triples
+that words use, and how many rare faces (Qu, Z, X, J, K) and blanks it
+shows.  A least-squares fit maps the features to the log of the word
+count and of the best score.  calibrate() fits it
+against the exact solver on a sample of shaken boards, and measures its
+errors on boards held out of the fit.  Whole arrays of boards are
+estimated at once with NumPy, which the estimator needs.
+
+    python3 difficulty.py classic difficulty-classic.json 2000
+"""
+
+import json
+import sys
+import time
+
+from brandom import RandomStream
+from bogglecubes import getDiceSet
+from boardcode import FACES, codesFromShakes, decode
+from bogglesolver import neighbors, solve
+from scoring import getRules
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+_VOWELS = set("AEIOU")
+_RARE = set(["QU", "Z", "X", "J", "K"])
+
+FEATURES = ["bias", "letters", "vowels", "vowels2", "vowelLinks", "pairs", "pairs2",
+            "triples", "triples2", "rare", "blanks", "distinct"]
+
+def letterTables(lexicon):
+    """
+    Returns (unigrams, bigrams, trigrams) arrays for the faces of
+    boardcode.FACES: the share of the lexicon's letters each face's
+    letters make up, and for each ordered pair and triple of faces, the
+    log of how often their letters follow each other in a word.  A face
+    of two letters is joined by its last letter to the face before it and
+    by its first to the face after it.
+    """
+    text = numpy.frombuffer("".join(word + "@" for word in lexicon.getWords()).encode("ascii"),
+                            dtype=numpy.uint8).astype(numpy.intp) - 65
+    # "@" ends each word, and becomes -1, which no pair or triple may hold
+    letters = numpy.bincount(text[text >= 0], minlength=26)
+    pairs = (text[:-1] >= 0) & (text[1:] >= 0)
+    bigrams = numpy.zeros((26, 26))
+    numpy.add.at(bigrams, (text[:-1][pairs], text[1:][pairs]), 1)
+    triples = (text[:-2] >= 0) & (text[1:-1] >= 0) & (text[2:] >= 0)
+    trigrams = numpy.zeros((26, 26, 26))
+    numpy.add.at(trigrams, (text[:-2][triples], text[1:-1][triples], text[2:][triples]), 1)
+
+    first = numpy.array([ord(face[0].upper()) - 65 if face else 0 for face in FACES])
+    last = numpy.array([ord(face[-1].upper()) - 65 if face else 0 for face in FACES])
+    blank = numpy.array([face == "" for face in FACES])
+    unigrams = numpy.array([sum(letters[ord(ch) - 65] for ch in face.upper()) for face in FACES],
+                           dtype=numpy.float64) / max(1, letters.sum())
+    faceBigrams = numpy.log1p(bigrams[last[:, None], first[None, :]])
+    faceBigrams[blank, :] = faceBigrams[:, blank] = 0
+    faceTrigrams = numpy.log1p(trigrams[last[:, None, None], first[None, :, None], first[None, None, :]])
+    faceTrigrams[blank, :, :] = faceTrigrams[:, blank, :] = faceTrigrams[:, :, blank] = 0
+    return (unigrams, faceBigrams, faceTrigrams)
+
+def codeMatrix(codes):
+    """
+    Returns board codes (bytes, or a BoardReader) as an N x cells uint8 array.
+
+    >>> codeMatrix([bytes([1, 2, 3, 4]), bytes([5, 6, 7, 8])]).tolist()
+    [[1, 2, 3, 4], [5, 6, 7, 8]]
+    """
+    if isinstance(codes, numpy.ndarray):
+        return codes
+    codes = list(codes)
+    if not codes:
+        return numpy.zeros((0, 0), dtype=numpy.uint8)
+    return numpy.frombuffer(b"".join(bytes(code) for code in codes),
+                            dtype=numpy.uint8).reshape(len(codes), -1)
+
+
+class DifficultyEstimator:
+    """
+    Estimates the word count and best score of rows x cols boards.  Make
+    one with calibrate() or load().
+
+    >>> import os, tempfile
+    >>> from lexicon import Lexicon
+    >>> lex = Lexicon.fromFile(os.path.join(os.path.dirname(os.path.abspath(__file__)), "bogwords.txt"))
+    >>> estimator = DifficultyEstimator.calibrate(lex, "classic", samples=200)
+    >>> estimator.features([bytes(16)] * 3).shape == (3, len(FEATURES))
+    True
+    >>> dense = estimator.estimateBoard(list("SERSPATGLINESERS"))
+    >>> sparse = estimator.estimateBoard([""] * 12 + list("CATS"))
+    >>> dense[0] > 10 * sparse[0] and dense[1] > sparse[1]
+    True
+    >>> estimator.getErrors()["boards"], estimator.getErrors()["words"]["rankCorrelation"] > 0.5
+    (40, True)
+    >>> path = os.path.join(tempfile.mkdtemp(), "difficulty.json")
+    >>> estimator.save(path)
+    >>> loaded = DifficultyEstimator.load(path, lex)
+    >>> codes = [bytes(range(1, 17)), bytes(range(10, 26))]
+    >>> numpy.allclose(loaded.estimate(codes), estimator.estimate(codes))
+    True
+    """
+
+    __slots__ = ["_rows", "_cols", "_unigrams", "_bigrams", "_trigrams", "_wordWeights",
+                 "_scoreWeights", "_errors", "_sources", "_targets", "_paths", "_degrees",
+                 "_isVowel", "_isRare", "_isBlank"]
+
+    # boards estimated at a time
+    BLOCK = 4096
+
+    def __init__(self, rows, cols, lexicon, wordWeights, scoreWeights, errors=None):
+        if numpy is None:
+            raise RuntimeError("the difficulty estimator needs NumPy")
+        self._rows = rows
+        self._cols = cols
+        self._unigrams, self._bigrams, self._trigrams = letterTables(lexicon)
+        self._wordWeights = numpy.array(wordWeights, dtype=numpy.float64)
+        self._scoreWeights = numpy.array(scoreWeights, dtype=numpy.float64)
+        self._errors = errors or {}
+        adjacent = neighbors(rows, cols)
+        # the directed edges of the neighbor graph
+        self._sources = numpy.array([cell for cell in range(len(adjacent)) for other in adjacent[cell]])
+        self._targets = numpy.array([other for cell in range(len(adjacent)) for other in adjacent[cell]])
+        # the paths of three cells, as (first, middle, last) columns; a path
+        # and its reverse are counted once, against a table holding both
+        self._paths = numpy.array([(before, cell, after) for cell in range(len(adjacent))
+                                   for before in adjacent[cell] for after in adjacent[cell]
+                                   if before < after]).reshape(-1, 3).T
+        self._trigrams = (self._trigrams + self._trigrams.transpose(2, 1, 0)).astype(numpy.float32).ravel()
+        self._bigrams = self._bigrams.astype(numpy.float32)
+        self._degrees = numpy.array([len(cells) for cells in adjacent], dtype=numpy.float64)
+        self._isVowel = numpy.array([any(ch in _VOWELS for ch in face.upper()) for face in FACES])
+        self._isRare = numpy.array([face.upper() in _RARE for face in FACES])
+        self._isBlank = numpy.array([face == "" for face in FACES])
+
+    @classmethod
+    def calibrate(cls, lexicon, diceSet="classic", samples=2000, seed=0, rules=None, holdOut=0.2):
+        """
+        Fits an estimator for a dice set to samples shaken boards solved
+        exactly, counting and scoring words by rules (those of diceSet by
+        default).  The boards in the holdOut share are left out of the fit
+        and used to measure its errors (see getErrors).
+        """
+        rows, cols, cubes = getDiceSet(diceSet)
+        if rules is None:
+            rules = getRules(diceSet)
+        order, faces = RandomStream(seed).shakes(samples, [len(cube) for cube in cubes], rows * cols)
+        codes = list(codesFromShakes(cubes, order, faces, rows * cols))
+        counts = []
+        scores = []
+        for code in codes:
+            # count only the words the rules accept, as a game would
+            words = solve(decode(code), rows, cols, lexicon, minLength=rules.getMinLength())
+            counts.append(len(words))
+            scores.append(rules.totalScore(words))
+        estimator = cls(rows, cols, lexicon, [0.0] * len(FEATURES), [0.0] * len(FEATURES))
+        features = estimator.features(codes)
+        counts = numpy.array(counts, dtype=numpy.float64)
+        scores = numpy.array(scores, dtype=numpy.float64)
+
+        test = max(1, int(samples * holdOut))
+        fit = slice(test, None)
+        estimator._wordWeights = numpy.linalg.lstsq(features[fit], numpy.log1p(counts[fit]), rcond=None)[0]
+        estimator._scoreWeights = numpy.linalg.lstsq(features[fit], numpy.log1p(scores[fit]), rcond=None)[0]
+        predictedCounts, predictedScores = estimator.estimate(codes[:test])
+        estimator._errors = {"boards": test,
+                             "words": _errorStats(predictedCounts, counts[:test]),
+                             "score": _errorStats(predictedScores, scores[:test])}
+        return estimator
+
+    def getRows(self):
+        return self._rows
+
+    def getCols(self):
+        return self._cols
+
+    def getErrors(self):
+        """
+        Returns the errors measured on the held-out boards at calibration,
+        for the word count ("words") and the best score ("score"): mean
+        absolute error, root mean square error, the absolute error 90% of
+        boards were within, the mean error relative to the exact value,
+        and the rank correlation of estimates with exact values.
+        """
+        return self._errors
+
+    def features(self, codes):
+        """Returns the N x len(FEATURES) feature matrix of board codes."""
+        board = codeMatrix(codes)
+        count = len(board)
+        vowels = self._isVowel[board]
+        letters = self._unigrams[board].sum(axis=1)
+        vowelCount = vowels.sum(axis=1).astype(numpy.float64)
+        # vowels in the middle of the grid join more words than those at the edge
+        vowelLinks = (vowels * self._degrees).sum(axis=1) / self._degrees.mean()
+        pairs = self._bigrams[board[:, self._sources], board[:, self._targets]].sum(axis=1) / len(self._sources)
+        first, middle, last = self._paths
+        faces = len(FACES)
+        # a triple of symbols indexes the flat table; 33 ** 3 fits in 16 bits
+        wide = board.astype(numpy.uint16)
+        triples = self._trigrams.take((wide[:, first] * faces + wide[:, middle]) * faces + wide[:, last])
+        triples = triples.sum(axis=1, dtype=numpy.float64) / len(first)
+        rare = self._isRare[board].sum(axis=1)
+        blanks = self._isBlank[board].sum(axis=1)
+        ordered = numpy.sort(board, axis=1)
+        distinct = (ordered[:, 1:] != ordered[:, :-1]).sum(axis=1) + 1
+        return numpy.column_stack([numpy.ones(count), letters, vowelCount, vowelCount ** 2,
+                                   vowelLinks, pairs, pairs ** 2, triples, triples ** 2,
+                                   rare, blanks, distinct])
+
+    def estimate(self, codes):
+        """
+        Returns (wordCounts, bestScores), float arrays of the estimates for
+        board codes (a list of bytes, a BoardReader, or an N x cells array).
+        """
+        board = codeMatrix(codes)
+        counts = numpy.empty(len(board))
+        scores = numpy.empty(len(board))
+        # a block of boards at a time keeps the gathered arrays in cache
+        for start in range(0, len(board), self.BLOCK):
+            features = self.features(board[start:start + self.BLOCK])
+            counts[start:start + self.BLOCK] = numpy.expm1(features @ self._wordWeights)
+            scores[start:start + self.BLOCK] = numpy.expm1(features @ self._scoreWeights)
+        return (counts, scores)
+
+    def estimateBoard(self, letters):
+        """Returns the estimated (wordCount, bestScore) of a board showing letters."""
+        from boardcode import encode
+        counts, scores = self.estimate([encode(letters)])
+        return (float(counts[0]), float(scores[0]))
+
+    def save(self, path):
+        """
+        Saves the calibration as JSON.  The letter tables are not saved;
+        load() works them out again from the lexicon.
+        """
+        with open(path, "w") as f:
+            json.dump({"rows": self._rows, "cols": self._cols, "features": FEATURES,
+                       "wordWeights": self._wordWeights.tolist(),
+                       "scoreWeights": self._scoreWeights.tolist(), "errors": self._errors},
+                      f, indent=1)
+
+    @classmethod
+    def load(cls, path, lexicon):
+        """Loads a calibration saved by save(), made with lexicon."""
+        with open(path) as f:
+            data = json.load(f)
+        if data["features"] != FEATURES:
+            raise ValueError("{} was calibrated with other features; calibrate again".format(path))
+        return cls(data["rows"], data["cols"], lexicon,
+                   data["wordWeights"], data["scoreWeights"], data["errors"])
+
+    def report(self):
+        """Returns a printable summary of the calibration errors."""
+        lines = ["errors on {} held-out boards:".format(self._errors.get("boards", 0))]
+        for name in ("words", "score"):
+            stats = self._errors.get(name)
+            if stats:
+                lines.append("  {:5}  mean abs {:.1f}  rms {:.1f}  90% within {:.1f}  "
+                             "relative {:.1%}  rank correlation {:.3f}".format(
+                                 name, stats["meanAbs"], stats["rms"], stats["p90"],
+                                 stats["relative"], stats["rankCorrelation"]))
+        return "\n".join(lines)
+
+
+def _ranks(values):
+    ranks = numpy.empty(len(values))
+    ranks[numpy.argsort(values, kind="stable")] = numpy.arange(len(values))
+    return ranks
+
+def _errorStats(predicted, exact):
+    """Returns the error measures getErrors describes."""
+    errors = numpy.abs(predicted - exact)
+    correlation = numpy.corrcoef(_ranks(predicted), _ranks(exact))[0, 1] if len(exact) > 1 else 1.0
+    return {"meanAbs": float(errors.mean()),
+            "rms": float(numpy.sqrt((errors ** 2).mean())),
+            "p90": float(numpy.percentile(errors, 90)),
+            "relative": float((errors / numpy.maximum(exact, 1)).mean()),
+            "rankCorrelation": float(correlation)}
+
+
+def main(argv):
+    from lexiconregistry import LEXICONS
+    diceSet = argv[0] if argv else "classic"
+    path = argv[1] if len(argv) > 1 else "difficulty-{}.json".format(diceSet)
+    samples = int(argv[2]) if len(argv) > 2 else 2000
+    start = time.perf_counter()
+    estimator = DifficultyEstimator.calibrate(LEXICONS.get("bogwords.txt"), diceSet, samples)
+    print("calibrated on {} boards in {:.1f} s".format(samples, time.perf_counter() - start))
+    print(estimator.report())
+    estimator.save(path)
+
+    # how fast it ranks boards
+    rows, cols, cubes = getDiceSet(diceSet)
+    order, faces = RandomStream(1).shakes(100000, [len(cube) for cube in cubes], rows * cols)
+    board = codeMatrix(codesFromShakes(cubes, order, faces, rows * cols))
+    start = time.perf_counter()
+    estimator.estimate(board)
+    print("{:.0f} boards/s".format(len(board) / (time.perf_counter() - start)))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
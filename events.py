@@ -0,0 +1,89 @@
+"""
+An in-process publish/subscribe bus for game events, so spectators (see
+spectator.py) can follow games without the games knowing who watches.
+
+An event is a compact tuple whose first two items are its kind and the
+name of the game it happened in:
+
+    ("board", game, code, rows, cols)   a new board; code is the board
+                                        code (see boardcode.py) in hex
+    ("select", game, cells)             the cells of the word being spelled
+                                        so far (row-major indexes)
+    ("word", game, word[, score])       an accepted word, and the game's
+                                        score after it if it keeps one
+    ("over", game)                      the game was exited
+
+Publishing calls each subscriber in the publisher's thread, so
+subscribers must only queue the event and return.
+"""
+
+import json
+import threading
+
+BOARD = "board"
+SELECT = "select"
+WORD = "word"
+OVER = "over"
+
+def encodeEvent(event):
+    """
+    Returns event as one line of compact JSON (bytes).
+
+    >>> encodeEvent(("word", "1", "CAT", 1))
+    b'["word","1","CAT",1]\\n'
+    """
+    return json.dumps(event, separators=(",", ":")).encode("utf-8") + b"\n"
+
+def decodeEvent(line):
+    """
+    Returns the event encoded in line.
+
+    >>> decodeEvent(b'["select","1",[0,1,5]]\\n')
+    ('select', '1', [0, 1, 5])
+    """
+    return tuple(json.loads(line))
+
+
+class EventBus:
+    """
+    Delivers each published event to every subscriber.
+
+    >>> bus = EventBus()
+    >>> seen = []
+    >>> bus.subscribe(seen.append)
+    >>> bus.publish(("over", "1"))
+    >>> bus.unsubscribe(seen.append)
+    >>> bus.publish(("over", "2"))
+    >>> seen
+    [('over', '1')]
+    """
+
+    __slots__ = ["_subscribers", "_lock"]
+
+    def __init__(self):
+        # a tuple, replaced on every change, so publish() never locks
+        self._subscribers = ()
+        self._lock = threading.Lock()
+
+    def subscribe(self, subscriber):
+        """Calls subscriber(event) for every event published from now on."""
+        with self._lock:
+            self._subscribers += (subscriber,)
+
+    def unsubscribe(self, subscriber):
+        with self._lock:
+            subscribers = list(self._subscribers)
+            subscribers.remove(subscriber)
+            self._subscribers = tuple(subscribers)
+
+    def hasSubscribers(self):
+        return bool(self._subscribers)
+
+    def publish(self, event):
+        for subscriber in self._subscribers:
+            subscriber(event)
+
+
+if __name__ == "__main__":
+    from doctest import testmod
+    testmod()
@@ -0,0 +1,60 @@
+"""
+A GraphWin for boards with many items and clickable regions.
+
+graphics.GraphWin keeps its items in a list, so removing one is a linear
+list.remove, and redraw() flushes the window after every item.  This
+GraphWin keeps them in a dict (insertion ordered, O(1) to add and
+remove), redraws with a single flush, and holds a RegionIndex (see
+hitindex.py) where boards register their buttons and cells.  It is a
+drop-in replacement:
+
+    from graphwin import GraphWin
+"""
+
+import graphics
+from hitindex import RegionIndex
+
+class GraphWin(graphics.GraphWin):
+
+    def __init__(self, title="Graphics Window", width=200, height=200, autoflush=True):
+        graphics.GraphWin.__init__(self, title, width, height, autoflush)
+        # item -> None, for its ordered O(1) membership
+        self.items = dict.fromkeys(self.items)
+        self.regions = RegionIndex()
+
+    def addItem(self, item):
+        self.items[item] = None
+
+    def delItem(self, item):
+        self.items.pop(item, None)
+
+    def redraw(self):
+        # flush once at the end rather than after every item
+        autoflush = self.autoflush
+        self.autoflush = False
+        try:
+            for item in list(self.items):
+                item.undraw()
+                item.draw(self)
+        finally:
+            self.autoflush = autoflush
+        self.update()
+
+    def addRegion(self, p1, p2, target, strict=False):
+        """
+        Registers the rectangle with corners p1 and p2 (Points) as target,
+        above the regions registered before it.  Returns a key for
+        removeRegion().
+        """
+        return self.regions.add(p1.getX(), p1.getY(), p2.getX(), p2.getY(), target, strict)
+
+    def removeRegion(self, key):
+        self.regions.remove(key)
+
+    def findRegion(self, point):
+        """Returns the target of the topmost region holding point, or None."""
+        return self.regions.find(point.getX(), point.getY())
+
+    def close(self):
+        self.regions.clear()
+        graphics.GraphWin.close(self)
@@ -0,0 +1,33 @@
+"""
+A BoggleBoard that draws nothing.  It has the same geometry, letters,
+buttons and text areas as BoggleBoard, but keeps them all in memory, so
+the game logic can run without a display (benchmarks, replays, servers).
+Both boards share their logic through boardbase.py, so they find the
+same letter for every click.
+"""
+
+from boardbase import Point, HeadlessLetter, BoggleBoardBase
+
+class HeadlessBoggleBoard(BoggleBoardBase):
+    """
+    A Boggle board without a window, laid out like BoggleBoard.
+
+    >>> board = HeadlessBoggleBoard(seed=1)
+    >>> board.inGrid(Point(75, 75)), board.inReset(Point(60, 310)), board.inExit(Point(200, 310))
+    (True, True, True)
+    >>> board.getBoggleLetterAtPoint(Point(125, 75)) is board._grid[1][0]
+    True
+    >>> HeadlessBoggleBoard(seed=1).getCode() == board.getCode()
+    True
+    """
+
+    __slots__ = ()
+
+    def __init__(self, rows=4, cols=4, cubes=None, seed=None,
+                 xInset=50, yInset=50, size=50):
+        BoggleBoardBase.__init__(self, rows, cols, cubes, seed, xInset, yInset, size)
+
+
+if __name__ == "__main__":
+    from doctest import testmod
+    testmod()
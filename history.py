@@ -0,0 +1,341 @@
+"""
+Keeps the results of played boards in a local SQLite database, for game
+history and leaderboards.
+
+A HistoryStore writes from a background thread: record() only queues the
+result, and the writer stores everything queued in one transaction, with
+the database in WAL mode so leaderboards can be read while it writes.
+Boards are stored once each, as their compact code (see boardcode.py).
+Games are indexed by day and by board, score first, so a leaderboard is
+read straight off an index.
+
+A HistoryRecorder builds the results from a game's events (see events.py),
+so nothing is added to the click path:
+
+    BOGGLE_HISTORY=history.db BOGGLE_PLAYER=ann python3 bogglegameEC.py
+    python3 history.py history.db [YYYY-MM-DD]
+"""
+
+import datetime
+import getpass
+import os
+import queue
+import sqlite3
+import sys
+import threading
+import time
+
+from events import BOARD, WORD, OVER
+from metrics import REGISTRY
+from scoring import CLASSIC
+
+_recorded = REGISTRY.counter("boggle_history_games_total", "Games written to the history store.")
+_batches = REGISTRY.histogram("boggle_history_batch_seconds", "Time to write one batch of games.")
+_pending = REGISTRY.gauge("boggle_history_queue_depth", "Games waiting for the history writer.")
+_failures = REGISTRY.counter("boggle_history_write_failures_total",
+                             "Games lost because their batch could not be written.")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS boards (
+    id INTEGER PRIMARY KEY,
+    code BLOB NOT NULL UNIQUE,
+    rows INTEGER NOT NULL,
+    cols INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    player TEXT NOT NULL,
+    board INTEGER NOT NULL REFERENCES boards(id),
+    day INTEGER NOT NULL,
+    finished REAL NOT NULL,
+    score INTEGER NOT NULL,
+    words INTEGER NOT NULL,
+    rules TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS found (
+    game INTEGER NOT NULL REFERENCES games(id),
+    word TEXT NOT NULL,
+    PRIMARY KEY (game, word)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS games_by_day ON games(day, score DESC);
+CREATE INDEX IF NOT EXISTS games_by_board ON games(board, score DESC);
+CREATE INDEX IF NOT EXISTS games_by_player ON games(player, finished DESC);
+"""
+
+# the columns leaderboards and histories return, in order
+_ENTRY = "games.id, player, score, words, finished"
+
+def _byRules(rules):
+    """Returns the condition that keeps the games scored by rules (a name), if given."""
+    return "" if rules is None else " AND rules = ?"
+
+def _rulesArgs(rules):
+    return () if rules is None else (rules,)
+
+class HistoryStore:
+    """
+    Game results in the SQLite database at path.  The writer commits at
+    most batchSize games at a time.
+
+    >>> import os, tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), "history.db")
+    >>> with HistoryStore(path) as store:
+    ...     when = datetime.datetime(2027, 3, 14, 12).timestamp()
+    ...     store.record("ann", bytes([3, 1, 20, 19]), 2, 2, ["CAT", "CATS"], 2, finished=when)
+    ...     store.record("bob", bytes([3, 1, 20, 19]), 2, 2, ["ACT"], 1, finished=when)
+    ...     store.flush()
+    ...     day = datetime.date(2027, 3, 14)
+    ...     print([(entry[1], entry[2]) for entry in store.topScores(day)])
+    ...     print(store.topScores(day, rules="big"))
+    ...     print([entry[1] for entry in store.topScoresForBoard(bytes([3, 1, 20, 19]))])
+    ...     print(store.getWords(store.getGames("ann")[0][0]))
+    [('ann', 2), ('bob', 1)]
+    []
+    ['ann', 'bob']
+    ['CAT', 'CATS']
+
+    A batch that can not be written is lost, but the writer keeps going:
+
+    >>> store = HistoryStore(path)
+    >>> with sqlite3.connect(path) as other:
+    ...     _ = other.execute("DROP TABLE found")
+    >>> lost = _failures.getValue()
+    >>> store.record("ann", bytes([3, 1, 20, 19]), 2, 2, ["CAT"], 1)
+    >>> store.flush()
+    >>> _failures.getValue() - lost
+    1
+    >>> store.close()
+    """
+
+    __slots__ = ["_path", "_queue", "_batchSize", "_thread", "_readers"]
+
+    def __init__(self, path, batchSize=500):
+        self._path = path
+        self._batchSize = batchSize
+        self._queue = queue.Queue()
+        # one read connection per thread that reads
+        self._readers = threading.local()
+        connection = self.__connect()
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(SCHEMA)
+        self._thread = threading.Thread(target=self.__write, args=(connection,),
+                                        name="history-writer", daemon=True)
+        self._thread.start()
+
+    def __connect(self):
+        connection = sqlite3.connect(self._path, check_same_thread=False)
+        # WAL only needs a sync at checkpoints to stay consistent
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def record(self, player, code, rows, cols, words, score, rules="classic", finished=None):
+        """
+        Queues the result of one board: player found words (a list) for
+        score points on the board with code code (bytes), which has rows
+        x cols cells, under the scoring rules named rules.  finished is
+        the time.time() the board was done with, by default now.
+        """
+        if finished is None:
+            finished = time.time()
+        self._queue.put((player, bytes(code), rows, cols, list(words), score, rules, finished))
+        _pending.inc()
+
+    def flush(self):
+        """Waits until everything recorded so far is written."""
+        self._queue.join()
+
+    def __write(self, connection):
+        while True:
+            results = [self._queue.get()]
+            # take whatever else is waiting, up to a batch
+            while len(results) < self._batchSize:
+                try:
+                    results.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = None in results
+            results = [result for result in results if result is not None]
+            _pending.dec(len(results))
+            start = time.perf_counter()
+            try:
+                with connection:
+                    for result in results:
+                        self.__insert(connection, *result)
+            except sqlite3.Error as error:
+                # lose this batch, not the writer (and every later game with it)
+                _failures.inc(len(results))
+                print("history: cannot write {} games to {}: {}".format(len(results), self._path, error),
+                      file=sys.stderr)
+            else:
+                if results:
+                    _batches.observe(time.perf_counter() - start)
+                    _recorded.inc(len(results))
+            finally:
+                for n in range(len(results) + stop):
+                    self._queue.task_done()
+            if stop:
+                connection.close()
+                return
+
+    def __insert(self, connection, player, code, rows, cols, words, score, rules, finished):
+        connection.execute("INSERT OR IGNORE INTO boards (code, rows, cols) VALUES (?, ?, ?)",
+                           (code, rows, cols))
+        board = connection.execute("SELECT id FROM boards WHERE code = ?", (code,)).fetchone()[0]
+        day = datetime.date.fromtimestamp(finished).toordinal()
+        game = connection.execute(
+            "INSERT INTO games (player, board, day, finished, score, words, rules) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (player, board, day, finished, score, len(words), rules)).lastrowid
+        connection.executemany("INSERT OR IGNORE INTO found (game, word) VALUES (?, ?)",
+                               [(game, word) for word in words])
+
+    def __reader(self):
+        connection = getattr(self._readers, "connection", None)
+        if connection is None:
+            connection = self._readers.connection = self.__connect()
+        return connection
+
+    def topScores(self, day=None, limit=10, rules=None):
+        """
+        Returns the best games of date day (today by default), best first,
+        as (game id, player, score, words found, time finished) tuples.
+        Scores under different rules do not compare, so pass the name of
+        the rules to rank only the games scored by them.
+        """
+        if day is None:
+            day = datetime.date.today()
+        return self.__reader().execute(
+            "SELECT " + _ENTRY + " FROM games WHERE day = ?" + _byRules(rules) +
+            " ORDER BY score DESC LIMIT ?", (day.toordinal(),) + _rulesArgs(rules) + (limit,)).fetchall()
+
+    def topScoresForBoard(self, code, limit=10, rules=None):
+        """Returns the best games played on the board with code code, as topScores() does."""
+        return self.__reader().execute(
+            "SELECT " + _ENTRY + " FROM games JOIN boards ON boards.id = games.board "
+            "WHERE boards.code = ?" + _byRules(rules) + " ORDER BY score DESC LIMIT ?",
+            (bytes(code),) + _rulesArgs(rules) + (limit,)).fetchall()
+
+    def getGames(self, player, limit=20):
+        """Returns the latest games of player, latest first, as topScores() does."""
+        return self.__reader().execute(
+            "SELECT " + _ENTRY + " FROM games WHERE player = ? ORDER BY finished DESC LIMIT ?",
+            (player, limit)).fetchall()
+
+    def getBoard(self, game):
+        """Returns the (code, rows, cols) of the board of game (an id)."""
+        return self.__reader().execute(
+            "SELECT code, rows, cols FROM boards JOIN games ON games.board = boards.id "
+            "WHERE games.id = ?", (game,)).fetchone()
+
+    def getWords(self, game):
+        """Returns the sorted words found in game (an id)."""
+        return [row[0] for row in self.__reader().execute(
+            "SELECT word FROM found WHERE game = ? ORDER BY word", (game,))]
+
+    def close(self):
+        """Writes everything recorded, then stops the writer."""
+        self._queue.put(None)
+        self._thread.join()
+        connection = getattr(self._readers, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._readers.connection = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class HistoryRecorder:
+    """
+    Records the boards of games to a HistoryStore as player, from the
+    events of an EventBus.  A board is recorded when the next one comes
+    or its game is over, if any word was found on it; finishAll()
+    records the boards still being played.  Words are scored by rules,
+    unless the events carry the game's own score.
+
+    >>> from events import EventBus
+    >>> class Store:
+    ...     def record(self, *result, **options): print(result)
+    >>> bus = EventBus()
+    >>> recorder = HistoryRecorder(Store(), "ann")
+    >>> bus.subscribe(recorder.onEvent)
+    >>> bus.publish(("board", "1", "03011413", 2, 2))
+    >>> bus.publish(("word", "1", "CAT"))
+    >>> bus.publish(("word", "1", "CATS"))
+    >>> bus.publish(("over", "1"))
+    ('ann', b'\\x03\\x01\\x14\\x13', 2, 2, ['CAT', 'CATS'], 2)
+    >>> bus.publish(("board", "2", "03011413", 2, 2))
+    >>> bus.publish(("word", "2", "ACT"))
+    >>> recorder.finishAll()
+    ('ann', b'\\x03\\x01\\x14\\x13', 2, 2, ['ACT'], 1)
+    """
+
+    __slots__ = ["_store", "_player", "_rules", "_boards"]
+
+    def __init__(self, store, player, rules=CLASSIC):
+        self._store = store
+        self._player = player
+        self._rules = rules
+        # game -> [board event, words, score or None]
+        self._boards = {}
+
+    def onEvent(self, event):
+        kind, game = event[0], event[1]
+        if kind == BOARD:
+            self.__finish(game)
+            self._boards[game] = [event, [], None]
+        elif kind == WORD and game in self._boards:
+            board = self._boards[game]
+            board[1].append(event[2])
+            if len(event) > 3:
+                board[2] = event[3]
+        elif kind == OVER:
+            self.__finish(game)
+
+    def finishAll(self):
+        """Records the boards of every game still going, as if it were over."""
+        for game in list(self._boards):
+            self.__finish(game)
+
+    def close(self):
+        """Records the boards still going, then closes the store."""
+        self.finishAll()
+        self._store.close()
+
+    def __finish(self, game):
+        board = self._boards.pop(game, None)
+        if board is None or not board[1]:
+            return
+        event, words, score = board
+        if score is None:
+            score = self._rules.totalScore(words)
+        self._store.record(self._player, bytes.fromhex(event[2]), event[3], event[4], words, score,
+                           rules=self._rules.getName())
+
+
+def recordFromEnvironment(bus, rules=CLASSIC):
+    """
+    Starts recording the events of bus to the history database at
+    BOGGLE_HISTORY, if set, as the player BOGGLE_PLAYER (the login name
+    by default), scoring words by rules.  Returns the HistoryRecorder, to
+    close() when the games end, or None.
+    """
+    if not os.environ.get("BOGGLE_HISTORY"):
+        return None
+    store = HistoryStore(os.environ["BOGGLE_HISTORY"])
+    player = os.environ.get("BOGGLE_PLAYER") or getpass.getuser()
+    recorder = HistoryRecorder(store, player, rules)
+    bus.subscribe(recorder.onEvent)
+    return recorder
+
+
+if __name__ == "__main__":
+    # print a day's leaderboard, of the games scored by some rules if named
+    with HistoryStore(sys.argv[1]) as store:
+        day = datetime.date.fromisoformat(sys.argv[2]) if len(sys.argv) > 2 else datetime.date.today()
+        rules = sys.argv[3] if len(sys.argv) > 3 else None
+        for rank, (game, player, score, words, finished) in enumerate(store.topScores(day, rules=rules)):
+            print("{:3} {:20} {:5} points {:4} words".format(rank + 1, player, score, words))
@@ -0,0 +1,93 @@
+"""
+Finds what was clicked: a spatial index of the rectangular regions of a
+window (buttons, grid cells), so a click is resolved with one bucket
+lookup however many regions there are.
+
+The index is a uniform grid of buckets.  A region is listed in every
+bucket it overlaps, topmost (latest added) first, so a lookup scans only
+the few regions near the point.
+"""
+
+class RegionIndex:
+    """
+    Maps points to the topmost of a set of rectangles.  A region covers
+    x1 <= x < x2 and y1 <= y < y2, or, if strict, only its inside
+    (x1 < x < x2 and y1 < y < y2).
+
+    >>> index = RegionIndex()
+    >>> grid = index.add(50, 50, 250, 250, "grid")
+    >>> cell = index.add(50, 50, 100, 100, "cell")
+    >>> index.find(60, 60), index.find(200, 200), index.find(10, 10)
+    ('cell', 'grid', None)
+    >>> index.remove(cell)
+    >>> index.find(60, 60), len(index)
+    ('grid', 1)
+    """
+
+    __slots__ = ["_cellSize", "_buckets", "_regions", "_next"]
+
+    def __init__(self, cellSize=64):
+        self._cellSize = cellSize
+        # (bucket column, bucket row) -> regions overlapping it, topmost first
+        self._buckets = {}
+        # key -> (key, x1, y1, x2, y2, strict, target)
+        self._regions = {}
+        self._next = 0
+
+    def __len__(self):
+        return len(self._regions)
+
+    def __bucketsOf(self, x1, y1, x2, y2):
+        size = self._cellSize
+        for bx in range(int(x1 // size), int(x2 // size) + 1):
+            for by in range(int(y1 // size), int(y2 // size) + 1):
+                yield (bx, by)
+
+    def add(self, x1, y1, x2, y2, target, strict=False):
+        """Adds a region on top of the others.  Returns its key, for remove()."""
+        self._next += 1
+        region = (self._next, min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2), strict, target)
+        self._regions[self._next] = region
+        for bucket in self.__bucketsOf(*region[1:5]):
+            # keys only grow, so the newest region goes first
+            self._buckets.setdefault(bucket, []).insert(0, region)
+        return self._next
+
+    def remove(self, key):
+        region = self._regions.pop(key, None)
+        if region is None:
+            return
+        for bucket in self.__bucketsOf(*region[1:5]):
+            regions = self._buckets[bucket]
+            regions.remove(region)
+            if not regions:
+                del self._buckets[bucket]
+
+    def clear(self):
+        self._buckets.clear()
+        self._regions.clear()
+
+    def find(self, x, y):
+        """Returns the target of the topmost region holding (x, y), or None."""
+        size = self._cellSize
+        for key, x1, y1, x2, y2, strict, target in self._buckets.get((int(x // size), int(y // size)), ()):
+            if strict:
+                if x1 < x < x2 and y1 < y < y2:
+                    return target
+            elif x1 <= x < x2 and y1 <= y < y2:
+                return target
+        return None
+
+
+def regionsOf(win):
+    """
+    Returns the RegionIndex of window win (see graphwin.py), or a new,
+    unshared one for a window without an index.
+    """
+    regions = getattr(win, "regions", None)
+    return regions if isinstance(regions, RegionIndex) else RegionIndex()
+
+
+if __name__ == "__main__":
+    from doctest import testmod
+    testmod()
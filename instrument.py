@@ -0,0 +1,272 @@
+"""
+Opt-in latency instrumentation for the game.
+
+Nothing here costs anything until enable() is called: it wraps the click
+handler, lexicon lookups, the board's reset/shake/recolor methods and
+GraphicsObject._reconfig in timing wrappers, and counts every Tk flush
+(root update).  disable() puts the original methods back.
+
+Each instrumented phase keeps a histogram of its latencies (in power of two
+microsecond buckets) and the number of Tk flushes made while it ran.  A
+summary is printed (or written to a file) when the program exits, and one
+designated game session can be profiled with cProfile.
+
+From the command line, set BOGGLE_INSTRUMENT=1 to turn this on, and
+optionally BOGGLE_PROFILE=<file> (with BOGGLE_PROFILE_SESSION=<n>, default
+0) to profile the clicks of the n-th game created, and
+BOGGLE_INSTRUMENT_SUMMARY=<file> to write the summary to a file.
+"""
+
+import atexit
+import cProfile
+import os
+import sys
+import time
+
+# (module, class, method, phase) for everything enable() wraps; only
+# modules that have already been imported are instrumented
+TARGETS = [("bogglegame", "BoggleGame", "doOneClick", "click"),
+           ("bogglegameEC", "BoggleGame", "doOneClick", "click"),
+           ("lexicon", "Lexicon", "__contains__", "lookup"),
+           ("boggleboard", "BoggleBoard", "reset", "reset"),
+           ("boggleboard", "BoggleBoard", "shakeCubes", "shake"),
+           ("boggleboard", "BoggleBoard", "resetColors", "resetColors"),
+           ("graphics", "GraphicsObject", "_reconfig", "reconfig")]
+
+_BUCKETS = 32
+
+
+class PhaseStats:
+    """Latency histogram and flush count for one instrumented phase."""
+
+    __slots__ = ["_name", "_calls", "_totalNs", "_maxNs", "_flushes", "_buckets"]
+
+    def __init__(self, name):
+        self._name = name
+        self._calls = 0
+        self._totalNs = 0
+        self._maxNs = 0
+        self._flushes = 0
+        # bucket b counts calls that took less than 2**b microseconds
+        self._buckets = [0] * _BUCKETS
+
+    def record(self, elapsedNs, flushes=0):
+        """Records one call that took elapsedNs and made flushes Tk flushes."""
+        self._calls += 1
+        self._totalNs += elapsedNs
+        self._flushes += flushes
+        if elapsedNs > self._maxNs:
+            self._maxNs = elapsedNs
+        self._buckets[min((elapsedNs // 1000).bit_length(), _BUCKETS - 1)] += 1
+
+    def getName(self):
+        return self._name
+
+    def getCalls(self):
+        return self._calls
+
+    def getFlushes(self):
+        return self._flushes
+
+    def getMeanMs(self):
+        return self._totalNs / self._calls / 1e6 if self._calls else 0.0
+
+    def getMaxMs(self):
+        return self._maxNs / 1e6
+
+    def getPercentileMs(self, percent):
+        """
+        Returns an upper bound on the given percentile latency (ms), read
+        off the histogram.
+
+        >>> stats = PhaseStats("click")
+        >>> for ns in [1000, 1500, 3000, 900000]:
+        ...     stats.record(ns)
+        >>> stats.getPercentileMs(50), stats.getPercentileMs(100)
+        (0.002, 1.024)
+        """
+        target = self._calls * percent / 100
+        seen = 0
+        for b in range(_BUCKETS):
+            seen += self._buckets[b]
+            if seen >= target and seen > 0:
+                return (1 << b) / 1000
+        return 0.0
+
+    def getBuckets(self):
+        """Returns the histogram as a list of (upper bound in us, count)."""
+        return [(1 << b, self._buckets[b]) for b in range(_BUCKETS) if self._buckets[b]]
+
+    def __str__(self):
+        return "{:<12} {:>8} calls  mean {:8.3f} ms  p50 <{:8.3f} ms  p95 <{:8.3f} ms  " \
+               "max {:8.3f} ms  {:>7} flushes".format(
+                   self._name, self._calls, self.getMeanMs(), self.getPercentileMs(50),
+                   self.getPercentileMs(95), self.getMaxMs(), self._flushes)
+
+
+# all of the module state lives here, so disabled code never touches it
+_stats = {}
+_originals = []
+_flushCount = [0]
+_profile = {"path": None, "session": 0, "games": 0, "game": None, "profiler": None}
+_summaryPath = [None]
+_atexitRegistered = [False]
+
+
+def isEnabled():
+    return len(_originals) > 0
+
+def getStats():
+    """Returns a dict of phase name -> PhaseStats."""
+    return _stats
+
+def getFlushCount():
+    """Returns the number of Tk flushes counted since enable()."""
+    return _flushCount[0]
+
+def _phase(name):
+    if name not in _stats:
+        _stats[name] = PhaseStats(name)
+    return _stats[name]
+
+def _timed(func, stats):
+    """Wraps func so each call is recorded in stats."""
+    clock = time.perf_counter_ns
+    def wrapper(*args, **kwargs):
+        flushes = _flushCount[0]
+        start = clock()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            stats.record(clock() - start, _flushCount[0] - flushes)
+    wrapper.__name__ = func.__name__
+    wrapper.__doc__ = func.__doc__
+    wrapper.__wrapped__ = func
+    return wrapper
+
+def _profiledClick(func):
+    """Wraps doOneClick so the designated game's clicks run under cProfile."""
+    def wrapper(game, *args, **kwargs):
+        profiler = _profile["profiler"]
+        if profiler is None or game is not _profile["game"]:
+            return func(game, *args, **kwargs)
+        profiler.enable()
+        try:
+            return func(game, *args, **kwargs)
+        finally:
+            profiler.disable()
+    wrapper.__name__ = func.__name__
+    wrapper.__doc__ = func.__doc__
+    wrapper.__wrapped__ = func
+    return wrapper
+
+def _countingInit(func):
+    """Wraps BoggleGame.__init__ to pick out the designated profiling session."""
+    def wrapper(game, *args, **kwargs):
+        func(game, *args, **kwargs)
+        if _profile["games"] == _profile["session"]:
+            _profile["game"] = game
+            _profile["profiler"] = cProfile.Profile()
+        _profile["games"] += 1
+    wrapper.__wrapped__ = func
+    return wrapper
+
+def _patch(owner, name, replacement):
+    """Sets owner.name, remembering what disable() has to put back."""
+    _originals.append((owner, name, owner.__dict__.get(name)))
+    setattr(owner, name, replacement)
+
+def enable(profilePath=None, profileSession=0, summaryPath=None, targets=()):
+    """
+    Turns instrumentation on for every already imported module in TARGETS,
+    and for the (class, method, phase) triples in targets.  A game run as
+    a script is the module __main__, so it passes its own class:
+
+        instrument.enable(targets=[(BoggleGame, "doOneClick", "click")])
+
+    If profilePath is given, the clicks of the profileSession-th game
+    created from now on are profiled and the cProfile stats are written to
+    profilePath at exit.  The summary goes to summaryPath, or to stderr.
+    """
+    if isEnabled():
+        return
+    _profile.update(path=profilePath, session=profileSession, games=0,
+                    game=None, profiler=None)
+    _summaryPath[0] = summaryPath
+    wrapped = []
+    for moduleName, className, method, phase in TARGETS:
+        module = sys.modules.get(moduleName)
+        if module is not None and hasattr(module, className):
+            wrapped.append((getattr(module, className), method, phase))
+    for owner, method, phase in targets:
+        if not any(owner is other and method == name for other, name, known in wrapped):
+            wrapped.append((owner, method, phase))
+    for owner, method, phase in wrapped:
+        func = owner.__dict__[method]
+        if method == "doOneClick" and profilePath is not None:
+            _patch(owner, "__init__", _countingInit(owner.__dict__["__init__"]))
+            func = _profiledClick(func)
+        _patch(owner, method, _timed(func, _phase(phase)))
+    # count Tk flushes: graphics flushes through its root window, GraphWin
+    # through its own update method
+    graphics = sys.modules.get("graphics")
+    if graphics is not None:
+        def counted(update):
+            def wrapper(*args, **kwargs):
+                _flushCount[0] += 1
+                return update(*args, **kwargs)
+            return wrapper
+        root = graphics._root
+        _patch(root, "update", counted(type(root).update.__get__(root)))
+        _patch(graphics.GraphWin, "update", counted(graphics.tk.Canvas.update))
+    if not _atexitRegistered[0]:
+        atexit.register(_atExit)
+        _atexitRegistered[0] = True
+
+def disable():
+    """Puts every instrumented method back.  Recorded stats are kept."""
+    while _originals:
+        owner, name, original = _originals.pop()
+        if original is None:
+            delattr(owner, name)
+        else:
+            setattr(owner, name, original)
+
+def reset():
+    """Clears every recorded stat."""
+    _stats.clear()
+    _flushCount[0] = 0
+
+def summary():
+    """Returns the summary of all recorded phases as a string."""
+    lines = ["Boggle latency summary ({} Tk flushes)".format(_flushCount[0])]
+    for name in sorted(_stats):
+        lines.append(str(_stats[name]))
+    return "\n".join(lines)
+
+def _atExit():
+    profiler = _profile["profiler"]
+    if profiler is not None:
+        profiler.dump_stats(_profile["path"])
+    if _stats:
+        if _summaryPath[0]:
+            with open(_summaryPath[0], "w") as f:
+                f.write(summary() + "\n")
+        else:
+            print(summary(), file=sys.stderr)
+
+def enableFromEnvironment(targets=()):
+    """
+    Calls enable() with targets if BOGGLE_INSTRUMENT is set (see the
+    module docstring).
+    """
+    if os.environ.get("BOGGLE_INSTRUMENT"):
+        enable(profilePath=os.environ.get("BOGGLE_PROFILE"),
+               profileSession=int(os.environ.get("BOGGLE_PROFILE_SESSION", "0")),
+               summaryPath=os.environ.get("BOGGLE_INSTRUMENT_SUMMARY"),
+               targets=targets)
+
+
+if __name__ == "__main__":
+    from doctest import testmod
+    testmod()
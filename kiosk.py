@@ -0,0 +1,228 @@
+"""
+Hosts several games of Boggle in one process, for kiosks that show boards
+side by side.
+
+A Kiosk lays its games out in a grid of regions of one GraphWin, or gives
+each game a GraphWin of its own.  It runs the Tk event loop instead of
+waiting in getMouse: each click is handed to the game under it as it
+arrives, so idle boards cost no CPU.  All the games share one Lexicon and
+one Tk interpreter, so each board added costs only its own drawing.
+
+Timed rounds and the flash of a found word run on a Scheduler (see
+scheduler.py) on the same event loop, so neither holds up a click.
+
+    python3 kiosk.py [classic|big|super] [count] [--windows] [--round=SECONDS]
+"""
+
+import math
+import sys
+
+from bogglecubes import getDiceSet
+from bogglegame import BoggleGame
+from bogglesolver import findPath
+from lexiconregistry import LEXICONS
+from scheduler import Scheduler, RoundTimer, formatTime
+from scoring import getRules
+
+# seconds a found word's cells take to fade from green back to white
+FLASH_SECONDS = 0.6
+
+def regions(count, columns, width, height):
+    """
+    Returns the (x, y) top left corners of count regions of width x height,
+    laid out columns to a row.
+
+    >>> regions(3, 2, 400, 400)
+    [(0, 0), (400, 0), (0, 400)]
+    """
+    return [((n % columns) * width, (n // columns) * height) for n in range(count)]
+
+
+class Kiosk:
+    """
+    count games of the dice set diceSet, played at once.  lexicon is a
+    Lexicon, or the name or path of one to get from the registry, and is
+    shared by every game.  Games with the same seed play the same boards;
+    each game of a kiosk has its own stream.  The games share one window
+    of columns regions to a row (about a square by default), or, when
+    separate is True, each has a window of its own.  With roundSeconds,
+    each game is a timed round, which a reset starts over.
+    """
+
+    __slots__ = ["_games", "_wins", "_over", "_columns", "_width", "_height", "_separate",
+                 "_scheduler", "_timers", "_rules"]
+
+    def __init__(self, count, diceSet="classic", lexicon=None, seed=None, columns=None,
+                 separate=False, title="Boggle", roundSeconds=None):
+        # the graphical classes are imported here, as in bogglegame.py
+        from graphwin import GraphWin
+        from boggleboard import BoggleBoard
+
+        if lexicon is None or isinstance(lexicon, str):
+            lexicon = LEXICONS.get(lexicon or "bogwords.txt")
+        rows, cols, cubes = getDiceSet(diceSet)
+        # the variant's rules set the shortest word its games accept
+        self._rules = getRules(diceSet)
+        self._width, self._height = BoggleBoard.windowSize(rows, cols)
+        self._columns = columns or math.ceil(math.sqrt(count))
+        self._separate = separate
+        self._games = []
+        self._wins = []
+        self._over = [False] * count
+        if not separate:
+            lines = -(-count // self._columns)
+            win = GraphWin(title, self._width * min(count, self._columns), self._height * lines)
+            self._wins.append(win)
+        self._scheduler = None
+        for n, (x, y) in enumerate(regions(count, self._columns, self._width, self._height)):
+            if separate:
+                win = GraphWin("{} {}".format(title, n + 1), self._width, self._height)
+                self._wins.append(win)
+                if self._scheduler is None:
+                    self._scheduler = Scheduler(win)
+                # each window's clicks go straight to its own game
+                win.setMouseHandler(self._scheduler.input(lambda point, n=n: self.__click(n, point)))
+                win.master.protocol("WM_DELETE_WINDOW", lambda n=n: self.__end(n))
+                x = y = 0
+            gameSeed = None if seed is None else "{}/{}".format(seed, n)
+            board = BoggleBoard(self._wins[-1], rows, cols, cubes, gameSeed,
+                                xInset=x + 50, yInset=y + 50)
+            self._games.append(BoggleGame(None, board=board, lexicon=lexicon,
+                                          minLength=self._rules.getMinLength()))
+        if not separate:
+            self._scheduler = Scheduler(self._wins[0])
+            self._wins[0].setMouseHandler(self._scheduler.input(self.__dispatch))
+            self._wins[0].master.protocol("WM_DELETE_WINDOW", self.quit)
+        self._timers = []
+        if roundSeconds:
+            for n in range(count):
+                board = self._games[n].getBoard()
+                self._timers.append(RoundTimer(self._scheduler, roundSeconds,
+                                               lambda left, board=board: board.setStringToUpperText(formatTime(left)),
+                                               lambda n=n: self.__end(n, "Time's up")))
+
+    def getGames(self):
+        return self._games
+
+    def getWins(self):
+        return self._wins
+
+    def getRules(self):
+        """Returns the ScoringRules of the kiosk's variant (see scoring.py)."""
+        return self._rules
+
+    def getScheduler(self):
+        return self._scheduler
+
+    def isOver(self, n):
+        """Returns True once game n has been exited."""
+        return self._over[n]
+
+    def __dispatch(self, point):
+        """Hands a click on the shared window to the game whose region it is in."""
+        column = int(point.getX() // self._width)
+        n = int(point.getY() // self._height) * self._columns + column
+        if column < self._columns and n < len(self._games):
+            self.__click(n, point)
+
+    def __click(self, n, point):
+        if self._over[n]:
+            return
+        game = self._games[n]
+        found = len(game.getFoundWords())
+        reset = game.getBoard().inReset(point)
+        if not game.doOneClick(point):
+            self.__end(n, exited=True)
+        elif reset and self._timers:
+            self._timers[n].start()
+        elif len(game.getFoundWords()) > found:
+            self.__flash(game.getBoard(), game.getFoundWords()[-1])
+
+    def __flash(self, board, word):
+        """Lights up the cells of word, then fades them back to white."""
+        cols = board.getCols()
+        path = findPath(word, board.getLetters(), board.getRows(), cols)
+        letters = [board.getBoggleLetterAtPoint(board.getCellCenter(cell % cols, cell // cols))
+                   for cell in path]
+        # the color each letter was last given, so a letter clicked meanwhile is left alone
+        shown = dict((letter, "white") for letter in letters)
+
+        def step(fraction):
+            # from light green (144, 238, 144) to white (255, 255, 255)
+            color = "white" if fraction >= 1.0 else "#{:02x}{:02x}{:02x}".format(
+                int(144 + 111 * fraction), int(238 + 17 * fraction), int(144 + 111 * fraction))
+            for letter in letters:
+                if letter.getFillColor() == shown[letter]:
+                    letter.setFillColor(color)
+                    shown[letter] = color
+
+        self._scheduler.animate(FLASH_SECONDS, step)
+
+    def __end(self, n, message="Game over", exited=False):
+        """
+        Ends game n: closes its window, or marks its region of the shared
+        one over.  A game not exited with its button is told it is over.
+        """
+        if self._over[n]:
+            return
+        self._over[n] = True
+        if not exited:
+            self._games[n].end()
+        if self._timers:
+            self._timers[n].cancel()
+        if self._separate:
+            self._wins[n].close()
+        else:
+            board = self._games[n].getBoard()
+            board.resetColors()
+            board.setStringToUpperText(message)
+        if all(self._over):
+            self.quit()
+
+    def run(self):
+        """Runs the Tk event loop until every game is over or quit() is called."""
+        for timer in self._timers:
+            timer.start()
+        self._wins[0].mainloop()
+        # games still going when the loop was quit are over too
+        for n, game in enumerate(self._games):
+            if not self._over[n]:
+                self._over[n] = True
+                game.end()
+        for win in self._wins:
+            win.close()
+
+    def quit(self):
+        """Stops the event loop, ending run()."""
+        self._wins[0].quit()
+
+
+if __name__ == "__main__":
+    import instrument
+    import metrics
+
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    roundSeconds = None
+    for arg in sys.argv[1:]:
+        if arg.startswith("--round="):
+            roundSeconds = float(arg[len("--round="):])
+    instrument.enableFromEnvironment()
+    metrics.exportFromEnvironment()
+    kiosk = Kiosk(int(args[1]) if len(args) > 1 else 4, args[0] if args else "classic",
+                  separate="--windows" in sys.argv, roundSeconds=roundSeconds)
+    # BOGGLE_SPECTATOR_PORT=<port> lets spectators watch (see spectator.py)
+    # and BOGGLE_HISTORY=<database> keeps a game history (see history.py)
+    from events import EventBus
+    from history import recordFromEnvironment
+    from spectator import serveFromEnvironment
+    bus = EventBus()
+    spectators = serveFromEnvironment(bus)
+    history = recordFromEnvironment(bus, kiosk.getRules())
+    if bus.hasSubscribers():
+        for n, game in enumerate(kiosk.getGames()):
+            game.publishTo(bus, str(n + 1))
+    kiosk.run()
+    if spectators is not None:
+        spectators.close()
+    if history is not None:
+        history.close()
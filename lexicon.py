@@ -0,0 +1,435 @@
+"""
+The lexicon of valid Boggle words, with the indexes the solver needs: a
+sorted word list for prefix queries, and a words x 26 letter-count matrix
+that picks out the few words a given board could possibly hold.
+
+In the letter counts "QU" is a single symbol, counted in the Q column,
+since the Q cubes show "Qu" on one face.  NumPy is used for the letter
+counts when it is installed, and plain Python otherwise.
+"""
+
+import heapq
+import re
+import sys
+from bisect import bisect_left
+from itertools import islice
+
+from wordsource import UnsortedError, mergeSources, streamWords
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# sorts after every letter, so prefix + _END bounds all words with that prefix
+_END = "\uffff"
+
+def letterCounts(word):
+    """
+    Returns a list of 26 ints: how often each letter occurs in word (str,
+    upper case), counting each "QU" once, as a Q.
+
+    >>> counts = letterCounts("QUEUE")
+    >>> counts[ord("Q") - 65], counts[ord("U") - 65], counts[ord("E") - 65]
+    (1, 1, 2)
+    """
+    counts = [0] * 26
+    for ch in word.replace("QU", "Q"):
+        i = ord(ch) - 65
+        if 0 <= i < 26:
+            counts[i] += 1
+    return counts
+
+def boardCounts(letters):
+    """
+    Returns a list of 26 ints: how often each letter is available on a
+    board showing letters (a list of faces).  A "Qu" face counts as one Q;
+    every other face counts each of its letters, so a "Q" face next to a
+    "U" face keeps its U.
+
+    >>> counts = boardCounts(["Qu", "Th", "E", ""])
+    >>> counts[ord("Q") - 65], counts[ord("U") - 65], counts[ord("T") - 65]
+    (1, 0, 1)
+    >>> counts = boardCounts(["Q", "U", "E"])
+    >>> counts[ord("Q") - 65], counts[ord("U") - 65]
+    (1, 1)
+    """
+    counts = [0] * 26
+    for face in letters:
+        face = face.upper()
+        # counted face by face, as joining the faces would make a "Q" and
+        # a "U" face into one "QU"
+        for ch in ("Q" if face == "QU" else face):
+            i = ord(ch) - 65
+            if 0 <= i < 26:
+                counts[i] += 1
+    return counts
+
+def letterMask(counts):
+    """
+    Returns a bit mask with bit i set when counts[i] (a list of 26 ints,
+    as from letterCounts) is not zero.
+
+    >>> letterMask(letterCounts("CAB"))
+    7
+    """
+    mask = 0
+    for i in range(26):
+        if counts[i]:
+            mask |= 1 << i
+    return mask
+
+def letterIndex(words):
+    """
+    Returns (masks, rows): for each word, the bit mask of the letters it
+    uses and its letterCounts.
+    """
+    rows = [letterCounts(word) for word in words]
+    return ([letterMask(row) for row in rows], rows)
+
+
+class Lexicon:
+    """
+    A sorted, duplicate free set of upper case words.
+
+    >>> lex = Lexicon(["dog", "cat", "cats", "quit", "cat"])
+    >>> len(lex), "CAT" in lex, "CA" in lex
+    (4, True, False)
+    >>> lex.hasPrefix("CA"), lex.hasPrefix("CO")
+    (True, False)
+    >>> lex.candidates(["C", "A", "T", "Qu", "I", "O"])
+    ['CAT', 'QUIT']
+    """
+
+    __slots__ = ["_words", "_wordSet", "_counts"]
+
+    def __init__(self, words):
+        self._wordSet = frozenset(word.upper() for word in words)
+        self._words = sorted(self._wordSet)
+        # the letter-count index is built on first use
+        self._counts = None
+
+    @classmethod
+    def fromSortedWords(cls, words):
+        """
+        Builds a lexicon in one pass from an iterable of sorted, distinct
+        upper case words (such as wordsource.mergeSources), without the
+        extra copy and sort that the constructor makes.
+        """
+        lexicon = cls(())
+        lexicon._words = list(words)
+        lexicon._wordSet = frozenset(lexicon._words)
+        return lexicon
+
+    @classmethod
+    def fromFile(cls, *lexiconNames):
+        """
+        Reads a lexicon from one or more word-list files with one word per
+        line, which may be compressed, keeping only the playable words (see
+        wordsource.py).  Sorted files are merged as they are read; a file
+        out of order (say, with words appended by hand) is sorted instead.
+
+        >>> import os, tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), "words.txt")
+        >>> with open(path, "w") as f:
+        ...     f.write("cat\\ndog\\nant\\ncat\\n")
+        16
+        >>> Lexicon.fromFile(path).getWords()
+        ['ANT', 'CAT', 'DOG']
+        """
+        try:
+            return cls.fromSortedWords(mergeSources(lexiconNames))
+        except UnsortedError as error:
+            # reading it again and sorting holds the whole list in memory
+            print("lexicon: {}; sorting it instead".format(error), file=sys.stderr)
+            return cls(word for name in lexiconNames for word in streamWords(name))
+
+    def withChanges(self, added=(), removed=()):
+        """
+        Returns a new Lexicon with the words added and without the words
+        removed.  This lexicon is left as it is, so games holding it are
+        not affected.  The sorted list is merged rather than re-sorted,
+        and an already built letter-count index is carried over, with
+        only the added words counted.
+
+        >>> lex = Lexicon(["cat", "dog", "emu"])
+        >>> new = lex.withChanges(added=["cow", "ant"], removed=["dog"])
+        >>> new.getWords(), lex.getWords()
+        (['ANT', 'CAT', 'COW', 'EMU'], ['CAT', 'DOG', 'EMU'])
+        >>> new.candidates(["C", "O", "W", "E", "M", "U"])
+        ['COW', 'EMU']
+        """
+        removedSet = set(word.upper() for word in removed) & self._wordSet
+        addedWords = sorted(set(word.upper() for word in added) - self._wordSet)
+        kept = [n for n in range(len(self._words)) if self._words[n] not in removedSet]
+        # merge the kept and the added words, remembering where each came from
+        merged = list(heapq.merge(((self._words[n], 0, n) for n in kept),
+                                  ((addedWords[n], 1, n) for n in range(len(addedWords)))))
+        new = Lexicon(())
+        new._words = [word for word, source, n in merged]
+        new._wordSet = (self._wordSet - removedSet) | frozenset(addedWords)
+        if self._counts is not None:
+            new._counts = self.__mergeCounts(merged, Lexicon(addedWords))
+        return new
+
+    def __mergeCounts(self, merged, addedLexicon):
+        """Builds the letter-count index of a merge from the old and added indexes."""
+        addedLexicon.__buildCounts()
+        if numpy is None:
+            sources = (self._counts, addedLexicon._counts)
+            return [sources[source][n] for word, source, n in merged]
+        masks, counts = self._counts
+        addedMasks, addedCounts = addedLexicon._counts
+        # index into the old rows followed by the added rows
+        rows = numpy.array([n if source == 0 else len(masks) + n for word, source, n in merged],
+                           dtype=numpy.int64)
+        return (numpy.concatenate((masks, addedMasks))[rows],
+                numpy.concatenate((counts, addedCounts))[rows])
+
+    def __contains__(self, word):
+        return word in self._wordSet
+
+    def __len__(self):
+        return len(self._words)
+
+    def __iter__(self):
+        return iter(self._words)
+
+    def getMemoryUsage(self):
+        """
+        Returns an estimate of the bytes this lexicon holds: the word
+        strings, the sorted list, the set and the letter-count index.
+        """
+        size = sys.getsizeof(self._words) + sys.getsizeof(self._wordSet)
+        size += sum(sys.getsizeof(word) for word in self._words)
+        if self._counts is not None:
+            if numpy is not None:
+                size += self._counts[0].nbytes + self._counts[1].nbytes
+            else:
+                size += sys.getsizeof(self._counts) + \
+                        sum(sys.getsizeof(pairs) + 64 * len(pairs) for mask, pairs in self._counts)
+        return size
+
+    def getWords(self):
+        """Returns the sorted list of words.  Do not modify it."""
+        return self._words
+
+    def prefixRange(self, prefix, lo=0, hi=None):
+        """
+        Returns (lo, hi) such that getWords()[lo:hi] are the words that
+        start with prefix.  The search can be narrowed to the range found
+        for a shorter prefix.
+
+        >>> lex = Lexicon(["cat", "cats", "dog"])
+        >>> lex.prefixRange("CAT")
+        (0, 2)
+        """
+        return prefixRange(self._words, prefix, lo, hi)
+
+    def hasPrefix(self, prefix):
+        """Returns True if some word starts with prefix."""
+        lo, hi = self.prefixRange(prefix)
+        return lo < hi
+
+    def query(self, pattern="*", minLength=0, maxLength=None, letters=None, limit=None):
+        """
+        Yields the words matching a pattern, in sorted order; see query().
+
+        >>> lex = Lexicon(["queen", "quest", "stare", "start", "steer", "tears"])
+        >>> list(lex.query("Q?E??"))
+        ['QUEEN', 'QUEST']
+        >>> list(lex.query("ST???", letters=["S", "T", "A", "R", "E", "X"]))
+        ['STARE']
+        """
+        return query(self._words, pattern, minLength, maxLength, letters, limit)
+
+    def __buildCounts(self):
+        """Builds the words x 26 letter-count index."""
+        masks, rows = letterIndex(self._words)
+        if numpy is not None:
+            self._counts = (numpy.array(masks, dtype=numpy.uint32),
+                            numpy.array(rows, dtype=numpy.uint8).reshape(len(rows), 26))
+        else:
+            # for each word, its mask and its (letter, count) pairs
+            self._counts = [(masks[n], [(i, rows[n][i]) for i in range(26) if rows[n][i]])
+                            for n in range(len(rows))]
+
+    def isVectorized(self):
+        """
+        Returns True if candidates() runs as one vectorized NumPy
+        comparison.  Without NumPy it loops over every word in Python,
+        which can cost more than the search it saves.
+        """
+        return numpy is not None
+
+    def candidateIndexes(self, letters):
+        """
+        Returns the indexes (into getWords()) of the words whose letters
+        all fit in the letters available on a board showing letters.
+        """
+        if self._counts is None:
+            self.__buildCounts()
+        available = boardCounts(letters)
+        boardMask = letterMask(available)
+        if numpy is not None:
+            masks, counts = self._counts
+            # the cheap mask test drops most words, then the counts decide
+            indexes = numpy.flatnonzero((masks & numpy.uint32(~boardMask & 0x3ffffff)) == 0)
+            available = numpy.minimum(numpy.array(available), 255).astype(numpy.uint8)
+            fits = (counts[indexes] <= available).all(axis=1)
+            return indexes[fits].tolist()
+        indexes = []
+        for n in range(len(self._counts)):
+            mask, pairs = self._counts[n]
+            if mask & ~boardMask:
+                continue
+            for i, count in pairs:
+                if count > available[i]:
+                    break
+            else:
+                indexes.append(n)
+        return indexes
+
+    def candidates(self, letters):
+        """
+        Returns the sorted list of words that could possibly be found on a
+        board showing letters (a list of faces).
+        """
+        words = self._words
+        return [words[n] for n in self.candidateIndexes(letters)]
+
+
+def prefixRange(words, prefix, lo=0, hi=None):
+    """
+    Returns (lo, hi) such that words[lo:hi] are the words of the sorted
+    list words that start with prefix.
+
+    >>> prefixRange(["CAT", "CATS", "DOG"], "D")
+    (2, 3)
+    """
+    if hi is None:
+        hi = len(words)
+    lo = bisect_left(words, prefix, lo, hi)
+    hi = bisect_left(words, prefix + _END, lo, hi)
+    return (lo, hi)
+
+# the letters a query can step to next, in order
+_LETTERS = [chr(ord("A") + i) for i in range(26)]
+
+def query(words, pattern="*", minLength=0, maxLength=None, letters=None, limit=None):
+    """
+    Yields, in sorted order, the words of the sorted list words that match
+    pattern, have minLength to maxLength letters and, if letters (a list
+    of faces, or a str) is given, can be made from those letters, with
+    "QU" taking a single Q as in boardCounts.  limit caps the number of
+    words yielded.
+
+    In a pattern "?" stands for any one letter and "*" for any run of
+    letters, possibly none; other characters stand for themselves.
+
+    The sorted list is walked as a trie: each prefix is the range of words
+    that start with it, and a prefix is dropped as soon as the pattern,
+    the lengths or the letters rule it out.  A "*" with no letters to
+    prune by would visit nearly every prefix, so such patterns scan the
+    range of their leading letters with a regular expression instead.
+
+    >>> words = ["CAT", "CATS", "COAT", "QUIT", "SCAT", "TACT"]
+    >>> list(query(words, "C*T"))
+    ['CAT', 'COAT']
+    >>> list(query(words, "*AT*", minLength=4))
+    ['CATS', 'COAT', 'SCAT']
+    >>> list(query(words, letters="TCAQUI", limit=2))
+    ['CAT', 'QUIT']
+    """
+    tokens = []
+    for ch in pattern.upper():
+        # runs of "*" match the same as one
+        if ch != "*" or not tokens or tokens[-1] != "*":
+            tokens.append(ch)
+    end = len(tokens)
+    if "*" not in tokens:
+        maxLength = end if maxLength is None else min(maxLength, end)
+    available = boardCounts(letters) if letters is not None else None
+
+    def closure(states):
+        # a "*" may match nothing, so its state also stands at the next token
+        closed = set(states)
+        for i in states:
+            while i < end and tokens[i] == "*":
+                i += 1
+                closed.add(i)
+        return closed
+
+    def step(states, ch):
+        moved = set()
+        for i in states:
+            if i < end:
+                if tokens[i] == "*":
+                    moved.add(i)
+                elif tokens[i] == "?" or tokens[i] == ch:
+                    moved.add(i + 1)
+        return closure(moved)
+
+    def nextLetters(states):
+        # the letters the pattern allows next, or None for any letter
+        allowed = set()
+        for i in states:
+            if i < end:
+                if tokens[i] in "*?":
+                    return None
+                allowed.add(tokens[i])
+        return allowed
+
+    def walk(prefix, lo, hi, states):
+        if words[lo] == prefix:
+            if end in states and len(prefix) >= minLength:
+                yield prefix
+            lo += 1
+        if lo == hi or (maxLength is not None and len(prefix) >= maxLength):
+            return
+        allowed = nextLetters(states)
+        for ch in _LETTERS if allowed is None else sorted(allowed):
+            # "QU" is spelled with one Q, so a U after a Q is free
+            free = ch == "U" and prefix.endswith("Q")
+            if available is not None and not free and available[ord(ch) - 65] == 0:
+                continue
+            clo, chi = prefixRange(words, prefix + ch, lo, hi)
+            if clo == chi:
+                continue
+            nextStates = step(states, ch)
+            if not nextStates:
+                continue
+            if available is not None and not free:
+                available[ord(ch) - 65] -= 1
+            yield from walk(prefix + ch, clo, chi, nextStates)
+            if available is not None and not free:
+                available[ord(ch) - 65] += 1
+
+    def scan():
+        # the letters before the first wildcard narrow the range to scan
+        lead = ""
+        while len(lead) < end and tokens[len(lead)] not in "*?":
+            lead += tokens[len(lead)]
+        lo, hi = prefixRange(words, lead)
+        regex = re.compile("".join("[A-Z]*" if ch == "*" else "[A-Z]" if ch == "?" else re.escape(ch)
+                                   for ch in tokens))
+        for n in range(lo, hi):
+            word = words[n]
+            if minLength <= len(word) and (maxLength is None or len(word) <= maxLength) and \
+               regex.fullmatch(word):
+                yield word
+
+    if not words:
+        return
+    if "*" in tokens and available is None:
+        found = scan()
+    else:
+        found = walk("", 0, len(words), closure({0}))
+    if limit is not None:
+        found = islice(found, limit)
+    yield from found
+
+
+if __name__ == "__main__":
+    from doctest import testmod
+    testmod()
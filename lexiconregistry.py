@@ -0,0 +1,150 @@
+"""
+A process-wide registry of lexicons, so every game in a process shares one
+copy of each dictionary.
+
+Lexicons are looked up by a registered name (such as "en" for a list of
+files) or by the path of a word list.  Each is loaded on first use and
+then shared by reference.  When the lexicons held exceed a memory cap, the
+least recently used ones are dropped from the registry; games that still
+hold one keep it working, and it is freed once they are done with it.
+
+    from lexiconregistry import LEXICONS
+    LEXICONS.register("en", "bogwords.txt")
+    game = BoggleGame(win, lexicon=LEXICONS.get("en"))
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+from lexicon import Lexicon
+from metrics import REGISTRY
+
+_loaded = REGISTRY.gauge("boggle_lexicons_loaded", "Lexicons held by the registry.")
+_bytes = REGISTRY.gauge("boggle_lexicon_bytes", "Estimated bytes of the lexicons held by the registry.")
+_loads = REGISTRY.counter("boggle_lexicon_loads_total", "Lexicons loaded by the registry.")
+_evictions = REGISTRY.counter("boggle_lexicon_evictions_total", "Lexicons evicted by the registry.")
+
+class LexiconRegistry:
+    """
+    Loads lexicons lazily, shares them, and evicts the least recently used
+    ones beyond maxBytes (None for no cap).  The lexicon just asked for is
+    never evicted, even if it alone is over the cap.
+
+    >>> import os, tempfile
+    >>> folder = tempfile.mkdtemp()
+    >>> for name, words in [("a.txt", "cat\\ndog\\n"), ("b.txt", "emu\\n")]:
+    ...     with open(os.path.join(folder, name), "w") as f:
+    ...         f.write(words)
+    8
+    4
+    >>> registry = LexiconRegistry()
+    >>> registry.register("pets", os.path.join(folder, "a.txt"))
+    >>> pets = registry.get("pets")
+    >>> pets.getWords(), registry.get("pets") is pets
+    (['CAT', 'DOG'], True)
+    >>> registry.get(os.path.join(folder, "b.txt")).getWords()
+    ['EMU']
+    >>> registry.setMaxBytes(1)
+    >>> registry.getLoaded() == [os.path.abspath(os.path.join(folder, "b.txt"))]
+    True
+    """
+
+    __slots__ = ["_maxBytes", "_sources", "_lexicons", "_sizes", "_lock"]
+
+    def __init__(self, maxBytes=None):
+        self._maxBytes = maxBytes
+        # name -> tuple of word-list paths
+        self._sources = {}
+        # key -> Lexicon, least recently used first
+        self._lexicons = OrderedDict()
+        self._sizes = {}
+        self._lock = threading.RLock()
+
+    def register(self, name, *paths):
+        """
+        Registers name for the lexicon merged from the word lists paths.
+        Re-registering a name drops the lexicon loaded for it.
+        """
+        with self._lock:
+            self._sources[name] = tuple(os.path.abspath(path) for path in paths)
+            self.evict(name)
+
+    def __key(self, nameOrPath):
+        if nameOrPath in self._sources:
+            return nameOrPath
+        return os.path.abspath(nameOrPath)
+
+    def get(self, nameOrPath):
+        """
+        Returns the lexicon for a registered name or a word-list path,
+        loading it if it is not held already.
+        """
+        with self._lock:
+            key = self.__key(nameOrPath)
+            lexicon = self._lexicons.get(key)
+            if lexicon is not None:
+                self._lexicons.move_to_end(key)
+                return lexicon
+            lexicon = Lexicon.fromFile(*self._sources.get(key, (key,)))
+            self._lexicons[key] = lexicon
+            self._sizes[key] = lexicon.getMemoryUsage()
+            _loads.inc()
+            self.__trim()
+            return lexicon
+
+    def evict(self, nameOrPath):
+        """Drops the lexicon for nameOrPath from the registry, if held."""
+        with self._lock:
+            key = self.__key(nameOrPath)
+            if key in self._lexicons:
+                del self._lexicons[key]
+                del self._sizes[key]
+                _evictions.inc()
+                self.__updateGauges()
+
+    def clear(self):
+        """Drops every lexicon held."""
+        with self._lock:
+            for key in list(self._lexicons):
+                self.evict(key)
+
+    def setMaxBytes(self, maxBytes):
+        """Changes the memory cap, evicting lexicons to meet it."""
+        with self._lock:
+            self._maxBytes = maxBytes
+            self.__trim()
+
+    def getLoaded(self):
+        """Returns the keys of the lexicons held, least recently used first."""
+        return list(self._lexicons)
+
+    def getMemoryUsage(self):
+        """Returns the estimated bytes of the lexicons held."""
+        # letter-count indexes are built on first use, so measure afresh
+        with self._lock:
+            for key, lexicon in self._lexicons.items():
+                self._sizes[key] = lexicon.getMemoryUsage()
+            return sum(self._sizes.values())
+
+    def __trim(self):
+        if self._maxBytes is not None:
+            total = self.getMemoryUsage()
+            while total > self._maxBytes and len(self._lexicons) > 1:
+                key = next(iter(self._lexicons))
+                total -= self._sizes[key]
+                self.evict(key)
+        self.__updateGauges()
+
+    def __updateGauges(self):
+        _loaded.set(len(self._lexicons))
+        _bytes.set(sum(self._sizes.values()))
+
+
+# the registry shared by every game in the process
+LEXICONS = LexiconRegistry()
+
+
+if __name__ == "__main__":
+    from doctest import testmod
+    testmod()
@@ -0,0 +1,151 @@
+"""
+Keeps a lexicon in step with its word file, so long-lived processes pick up
+dictionary fixes without a restart.
+
+The service polls the file's modification time and size (no OS-specific
+file watching).  When the file changes it reads it, works out which words
+were added and removed, and swaps in a new Lexicon built incrementally from
+the current one.  Games hold on to the Lexicon they were created with, so
+a reload never changes the rules of a game in progress; new games get the
+new lexicon from getLexicon().
+"""
+
+import os
+import sys
+import threading
+
+from lexicon import Lexicon
+from wordsource import streamWords
+from metrics import REGISTRY
+
+_reloads = REGISTRY.counter("boggle_lexicon_reloads_total", "Lexicon reloads after a file change.")
+_failures = REGISTRY.counter("boggle_lexicon_reload_failures_total",
+                             "Lexicon reloads abandoned because the file could not be read.")
+
+class LexiconService:
+    """
+    Serves the current Lexicon read from path, reloading it when the file
+    changes.
+
+    >>> import os, tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), "words.txt")
+    >>> with open(path, "w") as f:
+    ...     f.write("cat\\ndog\\n")
+    8
+    >>> service = LexiconService(path)
+    >>> old = service.getLexicon()
+    >>> with open(path, "w") as f:
+    ...     f.write("cat\\ncow\\nemu\\n")
+    12
+    >>> os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 10**9))
+    >>> service.poll()
+    (['COW', 'EMU'], ['DOG'])
+    >>> service.getLexicon().getWords(), old.getWords()
+    (['CAT', 'COW', 'EMU'], ['CAT', 'DOG'])
+    >>> service.poll() is None
+    True
+
+    Words appended out of order are picked up too:
+
+    >>> with open(path, "a") as f:
+    ...     f.write("ant\\n")
+    4
+    >>> os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 10**9))
+    >>> service.poll()
+    (['ANT'], [])
+    """
+
+    __slots__ = ["_path", "_interval", "_lexicon", "_stamp", "_listeners",
+                 "_lock", "_stop", "_thread"]
+
+    def __init__(self, path, interval=2.0):
+        self._path = path
+        self._interval = interval
+        self._listeners = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._stamp = self.__stamp()
+        self._lexicon = Lexicon.fromFile(path)
+
+    def __stamp(self):
+        stat = os.stat(self._path)
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def getPath(self):
+        return self._path
+
+    def getLexicon(self):
+        """Returns the current Lexicon.  Hand this to each new game."""
+        return self._lexicon
+
+    def addListener(self, listener):
+        """
+        Calls listener(lexicon, added, removed) after every reload, with the
+        new Lexicon and the sorted lists of added and removed words.
+        """
+        self._listeners.append(listener)
+
+    def poll(self):
+        """
+        Reloads the lexicon if its file changed since the last look.
+        Returns (added, removed) word lists after a reload, or None.  If
+        the file cannot be read the current lexicon is kept, and the
+        next poll tries again.
+        """
+        with self._lock:
+            try:
+                stamp = self.__stamp()
+            except OSError:
+                # the file is being replaced; look again next time
+                return None
+            if stamp == self._stamp:
+                return None
+            current = self._lexicon
+            try:
+                # a set, so the file need not be sorted
+                words = set(streamWords(self._path))
+            except Exception as error:
+                # say, a compressed file caught half written: keep the
+                # current lexicon and try again next time
+                _failures.inc()
+                print("lexicon: cannot reload {}: {}".format(self._path, error), file=sys.stderr)
+                return None
+            added = sorted(words.difference(current.getWords()))
+            removed = sorted(word for word in current.getWords() if word not in words)
+            self._stamp = stamp
+            if added or removed:
+                # a single assignment, so readers see the old or the new lexicon
+                self._lexicon = current.withChanges(added, removed)
+                _reloads.inc()
+        if added or removed:
+            for listener in self._listeners:
+                listener(self._lexicon, added, removed)
+        return (added, removed)
+
+    def start(self):
+        """Starts polling every interval seconds on a daemon thread."""
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self.__run, name="lexicon-watch", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Stops the polling thread."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    def __run(self):
+        while not self._stop.wait(self._interval):
+            try:
+                self.poll()
+            except Exception as error:
+                # a failing listener must not stop the reloads
+                print("lexicon: reload of {} failed: {!r}".format(self._path, error), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    from doctest import testmod
+    testmod()
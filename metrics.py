@@ -0,0 +1,270 @@
+"""
+A small metrics registry with counters, gauges and latency histograms,
+exported in the Prometheus text format through a local HTTP endpoint or a
+file that is rewritten periodically.
+
+Updating a metric is a method call and an integer (or float) add, with no
+locking, so it is cheap enough for the click path.  Reads for export may
+see a count that is one update behind, which scrapes tolerate.
+
+    from metrics import REGISTRY
+    clicks = REGISTRY.counter("boggle_clicks_total", "Clicks handled.")
+    clicks.inc()
+    print(REGISTRY.render())
+"""
+
+import os
+import threading
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# default latency buckets (seconds) for histograms
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+                   0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+def _labelText(labels):
+    """
+    Returns the Prometheus label text for a tuple of (name, value) pairs.
+
+    >>> _labelText((("result", "accepted"),))
+    '{result="accepted"}'
+    """
+    if not labels:
+        return ""
+    return "{" + ",".join('{}="{}"'.format(name, str(value).replace("\\", "\\\\")
+                                           .replace('"', '\\"').replace("\n", "\\n"))
+                          for name, value in labels) + "}"
+
+
+class Counter:
+    """A value that only goes up."""
+
+    __slots__ = ["_labels", "_value"]
+    TYPE = "counter"
+
+    def __init__(self, labels=()):
+        self._labels = labels
+        self._value = 0
+
+    def inc(self, amount=1):
+        self._value += amount
+
+    def getValue(self):
+        return self._value
+
+    def _samples(self, name):
+        return ["{}{} {}".format(name, _labelText(self._labels), self._value)]
+
+
+class Gauge(Counter):
+    """A value that goes up and down, such as a queue depth."""
+
+    __slots__ = []
+    TYPE = "gauge"
+
+    def dec(self, amount=1):
+        self._value -= amount
+
+    def set(self, value):
+        self._value = value
+
+
+class Histogram:
+    """Counts observations (such as latencies in seconds) into buckets."""
+
+    __slots__ = ["_labels", "_bounds", "_counts", "_sum", "_count"]
+    TYPE = "histogram"
+
+    def __init__(self, labels=(), buckets=LATENCY_BUCKETS):
+        self._labels = labels
+        self._bounds = tuple(buckets)
+        # one count per bucket, plus one for +Inf
+        self._counts = [0] * (len(self._bounds) + 1)
+        self._sum = 0.0
+        self._count = 0
+
+    def observe(self, value):
+        self._counts[bisect_left(self._bounds, value)] += 1
+        self._sum += value
+        self._count += 1
+
+    def getCount(self):
+        return self._count
+
+    def getSum(self):
+        return self._sum
+
+    def _samples(self, name):
+        """
+        >>> h = Histogram(buckets=(0.1, 1.0))
+        >>> h.observe(0.05); h.observe(0.5); h.observe(3)
+        >>> for line in h._samples("t"): print(line)
+        t_bucket{le="0.1"} 1
+        t_bucket{le="1.0"} 2
+        t_bucket{le="+Inf"} 3
+        t_sum 3.55
+        t_count 3
+        """
+        lines = []
+        total = 0
+        bounds = [str(bound) for bound in self._bounds] + ["+Inf"]
+        for i in range(len(bounds)):
+            total += self._counts[i]
+            lines.append("{}_bucket{} {}".format(name, _labelText(self._labels + (("le", bounds[i]),)),
+                                                 total))
+        labels = _labelText(self._labels)
+        lines.append("{}_sum{} {}".format(name, labels, round(self._sum, 9)))
+        lines.append("{}_count{} {}".format(name, labels, self._count))
+        return lines
+
+
+class Registry:
+    """
+    Holds metrics by name and labels.  Asking for the same metric twice
+    returns the same object, so every module can look its metrics up.
+
+    >>> registry = Registry()
+    >>> accepted = registry.counter("words_total", "Submitted words.", result="accepted")
+    >>> rejected = registry.counter("words_total", "Submitted words.", result="rejected")
+    >>> accepted.inc(); accepted.inc(); rejected.inc()
+    >>> registry.counter("words_total", result="accepted") is accepted
+    True
+    >>> print(registry.render(), end="")
+    # HELP words_total Submitted words.
+    # TYPE words_total counter
+    words_total{result="accepted"} 2
+    words_total{result="rejected"} 1
+    """
+
+    __slots__ = ["_families", "_lock"]
+
+    def __init__(self):
+        # name -> [type, help, {labels: metric}]
+        self._families = {}
+        self._lock = threading.Lock()
+
+    def __get(self, cls, name, help, labels, **kwargs):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            family = self._families.get(name)
+            if family is None:
+                family = self._families[name] = [cls.TYPE, help, {}]
+            elif family[0] != cls.TYPE:
+                raise ValueError("{} is already a {}".format(name, family[0]))
+            if help and not family[1]:
+                family[1] = help
+            metric = family[2].get(key)
+            if metric is None:
+                metric = family[2][key] = cls(key, **kwargs)
+            return metric
+
+    def counter(self, name, help="", **labels):
+        return self.__get(Counter, name, help, labels)
+
+    def gauge(self, name, help="", **labels):
+        return self.__get(Gauge, name, help, labels)
+
+    def histogram(self, name, help="", buckets=LATENCY_BUCKETS, **labels):
+        return self.__get(Histogram, name, help, labels, buckets=buckets)
+
+    def render(self):
+        """Returns every metric in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            families = [(name, family[0], family[1], list(family[2].values()))
+                        for name, family in sorted(self._families.items())]
+        for name, kind, help, metrics in families:
+            if help:
+                lines.append("# HELP {} {}".format(name, help))
+            lines.append("# TYPE {} {}".format(name, kind))
+            for metric in metrics:
+                lines.extend(metric._samples(name))
+        return "\n".join(lines) + "\n"
+
+
+# the registry the game modules report to
+REGISTRY = Registry()
+
+
+def serve(port, registry=REGISTRY, host="127.0.0.1"):
+    """
+    Serves registry.render() at http://host:port/metrics from a daemon
+    thread, and returns the server (call shutdown() to stop it).
+    """
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] not in ("/", "/metrics"):
+                self.send_error(404)
+                return
+            body = registry.render().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    return server
+
+
+class FileExporter:
+    """
+    Rewrites a file with registry.render() every interval seconds from a
+    daemon thread, for node exporters that collect metrics from files.  The
+    file is replaced atomically, so readers never see half of it.
+    """
+
+    __slots__ = ["_path", "_interval", "_registry", "_stop", "_thread"]
+
+    def __init__(self, path, interval=15.0, registry=REGISTRY):
+        self._path = path
+        self._interval = interval
+        self._registry = registry
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self.__run, name="metrics-file", daemon=True)
+        self._thread.start()
+
+    def write(self):
+        """Writes the file now."""
+        temp = "{}.{}.tmp".format(self._path, os.getpid())
+        with open(temp, "w") as f:
+            f.write(self._registry.render())
+        os.replace(temp, self._path)
+
+    def __run(self):
+        while True:
+            self.write()
+            if self._stop.wait(self._interval):
+                return
+
+    def stop(self):
+        """Stops the thread after writing the file one last time."""
+        self._stop.set()
+        self._thread.join()
+        self.write()
+
+
+def exportFromEnvironment(registry=REGISTRY):
+    """
+    Starts the exporters asked for by BOGGLE_METRICS_PORT (an HTTP port)
+    and BOGGLE_METRICS_FILE (with BOGGLE_METRICS_INTERVAL seconds, default
+    15).  Returns the list of exporters started.
+    """
+    exporters = []
+    if os.environ.get("BOGGLE_METRICS_PORT"):
+        exporters.append(serve(int(os.environ["BOGGLE_METRICS_PORT"]), registry))
+    if os.environ.get("BOGGLE_METRICS_FILE"):
+        exporters.append(FileExporter(os.environ["BOGGLE_METRICS_FILE"],
+                                      float(os.environ.get("BOGGLE_METRICS_INTERVAL", "15")),
+                                      registry))
+    return exporters
+
+
+if __name__ == "__main__":
+    from doctest import testmod
+    testmod()
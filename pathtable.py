@@ -0,0 +1,306 @@
+"""
+Precomputed tables of the paths across a board.
+
+Which cells a word may run through depends only on the size of the grid,
+not on the letters shaken, so the paths of a grid size can be worked out
+once.  A path table holds every simple path (adjacent cells, none used
+twice) of up to maxLength cells as a tree in depth-first order: node i is
+the last cell of one path, the nodes after it up to ends[i] are the paths
+that extend it.  A solver walks the nodes in order against the letters of
+a board and skips a whole subtree, with ends[i], as soon as its prefix
+spells no word.  Paths longer than the table continue with a plain
+depth-first search, so the words found are always the same as solve().
+
+A table file is a 16 byte header (magic, version, rows, cols, maxLength,
+number of nodes), then the cell of each node (uint8), the depth of each
+node (uint8, 1 for a starting cell), padding to 4 bytes, and the end of
+each node's subtree (uint32).  PathTable reads it through an mmap:
+
+    python3 pathtable.py build paths-4x4.bogp 4 4 [maxLength]
+    python3 pathtable.py solve paths-4x4.bogp [seed]
+"""
+
+import mmap
+import struct
+import sys
+import time
+from array import array
+from bisect import bisect_left
+
+from lexicon import prefixRange
+from bogglesolver import MIN_LENGTH, neighbors
+
+MAGIC = b"BOGP"
+VERSION = 1
+HEADER = struct.Struct("<4sBBBBxxxxI")
+
+# the most nodes a table gets when its length is not given
+MAX_NODES = 1 << 19
+
+def defaultLength(rows, cols, maxNodes=MAX_NODES):
+    """
+    Returns the longest path length whose table for a rows x cols grid
+    has at most maxNodes nodes.
+
+    >>> defaultLength(4, 4), defaultLength(5, 5), defaultLength(6, 6)
+    (8, 7, 6)
+    """
+    adjacent = neighbors(rows, cols)
+    # the (last cell, cells used) of every path of the current length
+    paths = [(cell, 1 << cell) for cell in range(rows * cols)]
+    nodes = length = 0
+    while paths and nodes + len(paths) <= maxNodes and length < rows * cols:
+        nodes += len(paths)
+        length += 1
+        paths = [(other, used | 1 << other) for cell, used in paths
+                 for other in adjacent[cell] if not used & (1 << other)]
+    return length
+
+def pathTree(rows, cols, maxLength):
+    """
+    Returns the (cells, depths, ends) arrays of the tree of the paths of
+    up to maxLength cells across a rows x cols grid.
+
+    >>> cells, depths, ends = pathTree(1, 3, 2)
+    >>> list(cells), list(depths), list(ends)
+    ([0, 1, 1, 0, 2, 2, 1], [1, 2, 1, 2, 2, 1, 2], [2, 2, 5, 4, 5, 7, 7])
+    """
+    adjacent = neighbors(rows, cols)
+    cells = array("B")
+    depths = array("B")
+    ends = array("I")
+    # each entry is (node, cell, cells used, the neighbors left to try)
+    for start in range(rows * cols):
+        cells.append(start)
+        depths.append(1)
+        ends.append(0)
+        stack = [(len(cells) - 1, 1 << start, iter(adjacent[start]))]
+        while stack:
+            node, used, rest = stack[-1]
+            depth = len(stack)
+            for other in rest:
+                if not used & (1 << other):
+                    cells.append(other)
+                    depths.append(depth + 1)
+                    ends.append(0)
+                    if depth + 1 < maxLength:
+                        stack.append((len(cells) - 1, used | 1 << other, iter(adjacent[other])))
+                    else:
+                        ends[-1] = len(cells)
+                    break
+            else:
+                ends[node] = len(cells)
+                stack.pop()
+    return cells, depths, ends
+
+def buildPathTable(path, rows, cols, maxLength=None):
+    """
+    Writes the table of the paths of up to maxLength cells of a rows x
+    cols grid to path, and returns its number of nodes.  maxLength
+    defaults to defaultLength(rows, cols).
+    """
+    if rows * cols > 256:
+        raise ValueError("path tables hold grids of at most 256 cells")
+    if maxLength is None:
+        maxLength = defaultLength(rows, cols)
+    if maxLength > 255:
+        raise ValueError("path tables hold paths of at most 255 cells")
+    cells, depths, ends = pathTree(rows, cols, maxLength)
+    if sys.byteorder != "little":
+        ends.byteswap()
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, rows, cols, maxLength, len(cells)))
+        f.write(cells.tobytes())
+        f.write(depths.tobytes())
+        f.write(b"\0" * (-2 * len(cells) % 4))
+        f.write(ends.tobytes())
+    return len(cells)
+
+
+class PathTable:
+    """
+    The paths of one grid size, read from a file built by buildPathTable().
+
+    >>> import os, tempfile
+    >>> from lexicon import Lexicon
+    >>> from bogglesolver import solve
+    >>> path = os.path.join(tempfile.mkdtemp(), "paths.bogp")
+    >>> buildPathTable(path, 2, 2, 3)
+    40
+    >>> lex = Lexicon(["cat", "cats", "act", "quit", "tact", "scat"])
+    >>> with PathTable(path) as table:
+    ...     print(table.solve(["C", "A", "T", "S"], lex))
+    ...     print(table.solve(["Qu", "I", "", "T"], lex) == solve(["Qu", "I", "", "T"], 2, 2, lex))
+    ...     print(table.isPath([0, 1, 2, 3]), table.isPath([0, 1, 0]), table.isPath([0, 5]))
+    ...     print(table.spell([3, 0, 1, 2], ["C", "A", "T", "S"]))
+    ['ACT', 'CAT', 'CATS', 'SCAT']
+    True
+    True False False
+    SCAT
+    """
+
+    __slots__ = ["_file", "_map", "_rows", "_cols", "_maxLength", "_cells", "_depths", "_ends",
+                 "_adjacent"]
+
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        header = self._file.read(HEADER.size)
+        if len(header) != HEADER.size:
+            self._file.close()
+            raise ValueError("{} is not a path table".format(path))
+        magic, version, self._rows, self._cols, self._maxLength, nodes = HEADER.unpack(header)
+        if magic != MAGIC or version != VERSION:
+            self._file.close()
+            raise ValueError("{} is not a version {} path table".format(path, VERSION))
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._map)
+        start = HEADER.size
+        self._cells = view[start:start + nodes]
+        self._depths = view[start + nodes:start + 2 * nodes]
+        start += 2 * nodes + (-2 * nodes % 4)
+        self._ends = view[start:start + 4 * nodes].cast("I")
+        self._adjacent = neighbors(self._rows, self._cols)
+
+    def getRows(self):
+        return self._rows
+
+    def getCols(self):
+        return self._cols
+
+    def getMaxLength(self):
+        return self._maxLength
+
+    def __len__(self):
+        return len(self._cells)
+
+    def isPath(self, path):
+        """Returns True if the cells of path are adjacent in turn and all different."""
+        if not path:
+            return False
+        cells, ends = self._cells, self._ends
+        # the nodes from node up to end are the subtrees of the paths so far
+        node, end = 0, len(cells)
+        for n in range(min(len(path), self._maxLength)):
+            while node < end and cells[node] != path[n]:
+                node = ends[node]
+            if node == end:
+                return False
+            node, end = node + 1, ends[node]
+        # longer paths go on cell by cell
+        for n in range(self._maxLength, len(path)):
+            if path[n] in path[:n] or path[n] not in self._adjacent[path[n - 1]]:
+                return False
+        return True
+
+    def spell(self, path, letters):
+        """Returns the word path spells on a board showing letters (upper case), or None."""
+        if not self.isPath(path) or not all(letters[cell] for cell in path):
+            return None
+        return "".join(letters[cell] for cell in path).upper()
+
+    def solve(self, letters, lexicon, minLength=MIN_LENGTH):
+        """
+        Returns the sorted list of every word in lexicon on a board of this
+        table's size showing letters, as bogglesolver.solve() does.
+        """
+        words = lexicon.candidates(letters) if lexicon.isVectorized() else lexicon.getWords()
+        return self.solveWords(letters, words, minLength)
+
+    def solveWords(self, letters, words, minLength=MIN_LENGTH):
+        """Returns the sorted list of the words of the sorted list words on a board showing letters."""
+        if len(letters) != self._rows * self._cols:
+            raise ValueError("the table is for {} x {} boards".format(self._rows, self._cols))
+        found = set()
+        if not words:
+            return []
+        faces = [face.upper() for face in letters]
+        cells, depths, ends = self._cells, self._depths, self._ends
+        maxLength = self._maxLength
+        # the prefix, word range and cell reached at each depth of the walk
+        reached = [("", 0, len(words), None)] * (maxLength + 1)
+        node, nodes = 0, len(cells)
+        while node < nodes:
+            cell = cells[node]
+            face = faces[cell]
+            if not face:
+                node = ends[node]
+                continue
+            depth = depths[node]
+            prefix, lo, hi, last = reached[depth - 1]
+            prefix += face
+            # most prefixes spell nothing, which one bisection tells
+            lo = bisect_left(words, prefix, lo, hi)
+            if lo == hi or not words[lo].startswith(prefix):
+                node = ends[node]
+                continue
+            if words[lo] == prefix and len(prefix) >= minLength:
+                found.add(prefix)
+            lo, hi = prefixRange(words, prefix, lo, hi)
+            reached[depth] = (prefix, lo, hi, cell)
+            if depth == maxLength:
+                path = [entry[3] for entry in reached[1:]]
+                self.__extend(faces, words, minLength, path, prefix, lo, hi, found)
+            node += 1
+        return sorted(found)
+
+    def __extend(self, faces, words, minLength, path, prefix, lo, hi, found):
+        """Searches on past the end of the table from the cells of path."""
+        adjacent = self._adjacent
+        used = set(path)
+
+        def search(cell, prefix, lo, hi):
+            prefix += faces[cell]
+            lo, hi = prefixRange(words, prefix, lo, hi)
+            if lo == hi:
+                return
+            if words[lo] == prefix and len(prefix) >= minLength:
+                found.add(prefix)
+            used.add(cell)
+            for other in adjacent[cell]:
+                if other not in used and faces[other]:
+                    search(other, prefix, lo, hi)
+            used.discard(cell)
+
+        for other in adjacent[path[-1]]:
+            if other not in used and faces[other]:
+                search(other, prefix, lo, hi)
+
+    def close(self):
+        self._cells.release()
+        self._depths.release()
+        self._ends.release()
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def main(argv):
+    if len(argv) >= 4 and argv[0] == "build":
+        rows, cols = int(argv[2]), int(argv[3])
+        maxLength = int(argv[4]) if len(argv) > 4 else defaultLength(rows, cols)
+        start = time.perf_counter()
+        nodes = buildPathTable(argv[1], rows, cols, maxLength)
+        print("{} paths of up to {} cells in {:.2f} s".format(nodes, maxLength,
+                                                              time.perf_counter() - start))
+    elif len(argv) >= 2 and argv[0] == "solve":
+        from lexiconregistry import LEXICONS
+        from headlessboard import HeadlessBoggleBoard
+        lexicon = LEXICONS.get("bogwords.txt")
+        with PathTable(argv[1]) as table:
+            board = HeadlessBoggleBoard(table.getRows(), table.getCols(),
+                                        seed=argv[2] if len(argv) > 2 else None)
+            print(board)
+            print(" ".join(table.solve(board.getLetters(), lexicon)))
+    else:
+        print("usage: python3 pathtable.py build FILE ROWS COLS [MAXLENGTH]\n"
+              "       python3 pathtable.py solve FILE [SEED]")
+        return 2
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,98 @@
+"""
+Replays a recorded session log (see sessionlog.py) through
+BoggleGame.doOneClick, and reports throughput and per-click latency.
+
+    python3 replay.py session.log             # headless, as fast as possible
+    python3 replay.py session.log --repeat 50  # the same, 50 times over
+    python3 replay.py session.log --realtime   # in a Tk window, at recorded pace
+"""
+
+import argparse
+import sys
+import time
+
+from sessionlog import SessionLog, BOARD, CLICK
+from bogglegame import BoggleGame
+from headlessboard import HeadlessBoggleBoard, Point
+
+def replay(log, game, realtime=False, pointClass=Point, idle=None):
+    """
+    Resets game, feeds every event of log through it and returns the list
+    of click latencies (seconds).  With realtime, waits out the recorded
+    time between events, calling idle() (if given) while waiting.
+    """
+    game.reset()
+    board = game.getBoard()
+    latencies = []
+    clock = time.perf_counter
+    for kind, seconds, payload in log:
+        if realtime and seconds > 0:
+            wakeUp = clock() + seconds
+            while clock() < wakeUp:
+                if idle is not None:
+                    idle()
+                time.sleep(min(0.01, max(0.0, wakeUp - clock())))
+        if kind == BOARD:
+            board.setCode(payload)
+        elif kind == CLICK:
+            point = pointClass(payload[0], payload[1])
+            start = clock()
+            game.doOneClick(point)
+            latencies.append(clock() - start)
+    return latencies
+
+def percentile(sortedValues, percent):
+    """
+    Returns the given percentile of a sorted list.
+
+    >>> percentile([1, 2, 3, 4], 50), percentile([1, 2, 3, 4], 100)
+    (2, 4)
+    """
+    if not sortedValues:
+        return 0.0
+    index = max(0, int(round(len(sortedValues) * percent / 100.0)) - 1)
+    return sortedValues[min(index, len(sortedValues) - 1)]
+
+def report(latencies, elapsed):
+    """Returns a printable summary of a replay."""
+    ordered = sorted(latencies)
+    rate = len(ordered) / elapsed if elapsed > 0 else 0.0
+    return "{} clicks in {:.3f} s ({:.1f} clicks/s); latency p50 {:.3f} ms, " \
+           "p95 {:.3f} ms, p99 {:.3f} ms, max {:.3f} ms".format(
+               len(ordered), elapsed, rate, percentile(ordered, 50) * 1e3,
+               percentile(ordered, 95) * 1e3, percentile(ordered, 99) * 1e3,
+               (ordered[-1] if ordered else 0.0) * 1e3)
+
+def main(argv):
+    parser = argparse.ArgumentParser(prog="python3 replay.py")
+    parser.add_argument("log", help="session log recorded with BOGGLE_RECORD")
+    parser.add_argument("--realtime", action="store_true",
+                        help="replay at the recorded pace in a Tk window")
+    parser.add_argument("--repeat", type=int, default=1,
+                        help="how many times to replay the log")
+    args = parser.parse_args(argv)
+
+    log = SessionLog(args.log)
+    rows, cols = log.getRows(), log.getCols()
+    # accept the same words the recorded game did
+    minLength = log.getMinLength()
+    if args.realtime:
+        import graphics
+        import graphwin
+        from boggleboard import BoggleBoard
+        win = graphwin.GraphWin("Boggle replay", *BoggleBoard.windowSize(rows, cols))
+        game = BoggleGame(win, rows, cols, minLength=minLength)
+        pointClass, idle = graphics.Point, graphics.update
+    else:
+        game = BoggleGame(None, board=HeadlessBoggleBoard(rows, cols), minLength=minLength)
+        pointClass, idle = Point, None
+
+    latencies = []
+    start = time.perf_counter()
+    for i in range(args.repeat):
+        latencies.extend(replay(log, game, args.realtime, pointClass, idle))
+    print(report(latencies, time.perf_counter() - start))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,280 @@
+"""
+Timers and animation frames run from the Tk event loop.
+
+graphics.update(rate) paces a loop by sleeping, and nothing can be
+clicked while it sleeps.  A Scheduler instead asks Tk to call it back
+with after(), so the event loop stays free between frames.  Animations
+are functions of the time elapsed, not of the frames drawn: a frame that
+comes late simply draws a later point of the animation.  Clicks come
+first.  Wrap the click handler with Scheduler.input(), and a frame due
+within one frame budget of a click is skipped.  A frame that runs over
+its budget leaves the remaining animations for the next one.
+
+A RoundTimer counts a round down (three minutes by default), calling
+back every second and when time is up.
+
+Any object with Tk's after() and after_cancel() can drive a Scheduler:
+a GraphWin, or a HeadlessLoop for games without a display.
+"""
+
+import math
+import time
+from bisect import insort
+
+from metrics import REGISTRY
+
+_frames = REGISTRY.counter("boggle_frames_total", "Animation frames drawn.")
+_skipped = REGISTRY.counter("boggle_frames_skipped_total",
+                            "Animation frames skipped to make way for input or a late frame.")
+
+class HeadlessLoop:
+    """
+    Stands in for the Tk event loop where there is no display: callbacks
+    given to after() run when the loop's clock is advanced past them.
+
+    >>> loop = HeadlessLoop()
+    >>> timer = loop.after(1000, lambda: print("one"))
+    >>> timer = loop.after(500, lambda: print("half"))
+    >>> loop.advance(2.0)
+    half
+    one
+    """
+
+    __slots__ = ["_now", "_pending", "_next"]
+
+    def __init__(self, start=0.0):
+        self._now = start
+        # sorted (time due, order, callback) entries
+        self._pending = []
+        self._next = 0
+
+    def clock(self):
+        """Returns the loop's time, in seconds."""
+        return self._now
+
+    def after(self, ms, callback):
+        self._next += 1
+        insort(self._pending, (self._now + ms / 1000.0, self._next, callback))
+        return self._next
+
+    def after_cancel(self, timer):
+        self._pending = [entry for entry in self._pending if entry[1] != timer]
+
+    def advance(self, seconds):
+        """Moves the clock on by seconds, running the callbacks that fall due."""
+        end = self._now + seconds
+        while self._pending and self._pending[0][0] <= end:
+            due, order, callback = self._pending.pop(0)
+            self._now = max(self._now, due)
+            callback()
+        self._now = end
+
+
+class Animation:
+    """One running animation; see Scheduler.animate()."""
+
+    __slots__ = ["_start", "_duration", "_step", "_done", "_finished"]
+
+    def __init__(self, start, duration, step, done):
+        self._start = start
+        self._duration = duration
+        self._step = step
+        self._done = done
+        self._finished = False
+
+    def isFinished(self):
+        return self._finished
+
+    def cancel(self):
+        """Stops the animation where it is, without calling done."""
+        self._finished = True
+
+    def _draw(self, now):
+        """Draws the frame for time now.  Returns True once the animation is over."""
+        if self._finished:
+            return True
+        fraction = 1.0 if self._duration <= 0 else min(1.0, (now - self._start) / self._duration)
+        self._step(fraction)
+        if fraction >= 1.0:
+            self._finished = True
+            if self._done is not None:
+                self._done()
+        return self._finished
+
+
+class Scheduler:
+    """
+    Runs timers and animations at up to fps frames a second on the event
+    loop of widget (anything with Tk's after() and after_cancel()).
+    clock returns the time in seconds.
+
+    >>> loop = HeadlessLoop()
+    >>> scheduler = Scheduler(loop, fps=10, clock=loop.clock)
+    >>> steps = []
+    >>> step = lambda fraction: steps.append(round(fraction, 2))
+    >>> animation = scheduler.animate(0.4, step, done=lambda: steps.append("done"))
+    >>> timer = scheduler.callLater(0.2, lambda: steps.append("timer"))
+    >>> loop.advance(1.0)
+    >>> steps
+    [0.0, 0.25, 'timer', 0.5, 0.75, 1.0, 'done']
+
+    A click skips the frame that would have followed it:
+
+    >>> click = scheduler.input(lambda point: steps.append(point))
+    >>> steps = []
+    >>> animation = scheduler.animate(0.4, step)
+    >>> loop.advance(0.05); click("click"); loop.advance(1.0)
+    >>> steps
+    [0.0, 'click', 0.5, 0.75, 1.0]
+    """
+
+    __slots__ = ["_widget", "_budget", "_clock", "_animations", "_frame", "_lastInput"]
+
+    def __init__(self, widget, fps=60, clock=time.perf_counter):
+        self._widget = widget
+        self._budget = 1.0 / fps
+        self._clock = clock
+        self._animations = []
+        # the after() id of the next frame, while animations run
+        self._frame = None
+        self._lastInput = None
+
+    def getBudget(self):
+        """Returns the time of one frame, in seconds."""
+        return self._budget
+
+    def now(self):
+        return self._clock()
+
+    def callLater(self, delay, callback):
+        """Calls callback after delay seconds.  Returns a timer for cancel()."""
+        return self._widget.after(max(0, int(round(delay * 1000))), callback)
+
+    def cancel(self, timer):
+        self._widget.after_cancel(timer)
+
+    def animate(self, duration, step, done=None):
+        """
+        Calls step(fraction) on each frame for duration seconds, with the
+        fraction of the duration elapsed (0.0 first, 1.0 last), then calls
+        done(), if given.  Returns the Animation.
+        """
+        animation = Animation(self._clock(), duration, step, done)
+        animation._draw(animation._start)
+        self._animations.append(animation)
+        if self._frame is None:
+            self._frame = self.callLater(self._budget, self.__drawFrame)
+        return animation
+
+    def input(self, handler):
+        """
+        Returns a function that calls handler with its arguments, first
+        noting the time so the next frame makes way for the input.
+        """
+        def onInput(*args):
+            self._lastInput = self._clock()
+            return handler(*args)
+        return onInput
+
+    def __drawFrame(self):
+        self._frame = None
+        start = self._clock()
+        if self._lastInput is not None and start - self._lastInput < self._budget:
+            # input just came in; let it have this frame
+            _skipped.inc()
+        else:
+            _frames.inc()
+            animations = self._animations
+            drawn = 0
+            while drawn < len(animations) and (drawn == 0 or self._clock() - start < self._budget):
+                drawn += 1
+                if animations[drawn - 1]._draw(start):
+                    drawn -= 1
+                    del animations[drawn]
+            if drawn < len(animations):
+                _skipped.inc()
+                # the animations left out go first next time
+                animations[:] = animations[drawn:] + animations[:drawn]
+        if self._animations:
+            late = self._clock() - start
+            self._frame = self.callLater(max(0.001, self._budget - late), self.__drawFrame)
+
+
+def formatTime(seconds):
+    """
+    Returns seconds as minutes and seconds.
+
+    >>> formatTime(180), formatTime(59)
+    ('3:00', '0:59')
+    """
+    return "{}:{:02d}".format(int(seconds) // 60, int(seconds) % 60)
+
+
+class RoundTimer:
+    """
+    Counts down a round of seconds seconds on a Scheduler.  onTick(left)
+    is called with the whole seconds left when the round starts and at
+    each second after, and onEnd() when time is up.
+
+    >>> loop = HeadlessLoop()
+    >>> timer = RoundTimer(Scheduler(loop, clock=loop.clock), 3,
+    ...                    onTick=lambda left: print(formatTime(left)), onEnd=lambda: print("time"))
+    >>> timer.start()
+    0:03
+    >>> loop.advance(1.5)
+    0:02
+    >>> timer.getRemaining()
+    1.5
+    >>> loop.advance(5)
+    0:01
+    0:00
+    time
+    """
+
+    __slots__ = ["_scheduler", "_seconds", "_onTick", "_onEnd", "_endAt", "_timer"]
+
+    def __init__(self, scheduler, seconds=180, onTick=None, onEnd=None):
+        self._scheduler = scheduler
+        self._seconds = seconds
+        self._onTick = onTick
+        self._onEnd = onEnd
+        self._endAt = None
+        self._timer = None
+
+    def start(self):
+        """Starts (or restarts) the round."""
+        self.cancel()
+        self._endAt = self._scheduler.now() + self._seconds
+        self.__tick()
+
+    def cancel(self):
+        if self._timer is not None:
+            self._scheduler.cancel(self._timer)
+            self._timer = None
+
+    def isRunning(self):
+        return self._timer is not None
+
+    def getRemaining(self):
+        """Returns the seconds left in the round."""
+        if self._endAt is None:
+            return self._seconds
+        return max(0.0, self._endAt - self._scheduler.now())
+
+    def __tick(self):
+        self._timer = None
+        remaining = self.getRemaining()
+        left = math.ceil(remaining - 1e-6)
+        if self._onTick is not None:
+            self._onTick(left)
+        if left <= 0:
+            if self._onEnd is not None:
+                self._onEnd()
+            return
+        # wake up as the count goes down to the next whole second
+        self._timer = self._scheduler.callLater(remaining - (left - 1), self.__tick)
+
+
+if __name__ == "__main__":
+    from doctest import testmod
+    testmod()
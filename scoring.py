@@ -0,0 +1,126 @@
+"""
+Scoring rules for found words.
+
+A ScoringRules holds a table of points by word length and, for letter
+weighted variants, a table of points by letter.  One word is scored with
+a table lookup (plus its letters, when they are weighted); a whole list
+of words, such as every word on a board, is scored in one vectorized
+NumPy call when NumPy is installed.
+
+Rules are named like the dice sets in bogglecubes.py:
+
+    classic   the Boggle rules: 3 and 4 letters 1 point, 5 letters 2,
+              6 letters 3, 7 letters 5, 8 or more 11
+    big       Big Boggle: the same, but words need at least 4 letters
+    super     Super Boggle plays by the Big Boggle rules
+    letters   every letter scores its Scrabble tile value
+"""
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+class ScoringRules:
+    """
+    Points for words by their length and, optionally, their letters.
+    lengthPoints[n] is the score of an n letter word, and its last entry
+    also scores every longer word.  letterPoints, if given, maps each
+    letter to the points it adds.  Words shorter than minLength score 0.
+
+    >>> rules = ScoringRules([0, 0, 0, 1, 1, 2], {"Q": 10}, minLength=3)
+    >>> rules.score("CAT"), rules.score("QUEUES"), rules.score("AT")
+    (1, 12, 0)
+    >>> rules.scoreWords(["CAT", "QUEUES", "AT"])
+    [1, 12, 0]
+    >>> rules.totalScore(["CAT", "QUEUES", "AT"])
+    13
+    >>> LETTERS.scoreWords(["CAT", ""]), LETTERS.scoreWords([""])
+    ([5, 0], [0])
+    """
+
+    __slots__ = ["_name", "_lengths", "_letters", "_minLength", "_lengthArray", "_letterArray"]
+
+    def __init__(self, lengthPoints, letterPoints=None, minLength=3, name=""):
+        self._name = name
+        self._minLength = minLength
+        # points by length, with the lengths below minLength scoring nothing
+        self._lengths = [points if n >= minLength else 0 for n, points in enumerate(lengthPoints)]
+        # points by character code, or None when letters are not weighted
+        self._letters = None
+        if letterPoints:
+            self._letters = [0] * 256
+            for letter, points in letterPoints.items():
+                self._letters[ord(letter.upper())] = points
+        if numpy is not None:
+            self._lengthArray = numpy.array(self._lengths, dtype=numpy.int64)
+            self._letterArray = None if self._letters is None else \
+                                numpy.array(self._letters, dtype=numpy.int64)
+
+    def getName(self):
+        return self._name
+
+    def getMinLength(self):
+        return self._minLength
+
+    def score(self, word):
+        """Returns the points word (upper case str) scores."""
+        length = len(word)
+        points = self._lengths[min(length, len(self._lengths) - 1)]
+        if self._letters is not None and length >= self._minLength:
+            letters = self._letters
+            for ch in word:
+                points += letters[ord(ch) & 0xff]
+        return points
+
+    def scoreWords(self, words):
+        """Returns the list of the points each of words scores."""
+        if numpy is None or not words:
+            return [self.score(word) for word in words]
+        return self.__scoreArray(words).tolist()
+
+    def totalScore(self, words):
+        """Returns the points all of words score together."""
+        if numpy is None or not words:
+            return sum(self.score(word) for word in words)
+        return int(self.__scoreArray(words).sum())
+
+    def __scoreArray(self, words):
+        lengths = numpy.fromiter(map(len, words), dtype=numpy.int64, count=len(words))
+        points = self._lengthArray[numpy.minimum(lengths, len(self._lengths) - 1)]
+        if self._letterArray is not None:
+            text = numpy.frombuffer("".join(words).encode("ascii", "replace"), dtype=numpy.uint8)
+            # each word's letters sum to the difference of two running totals,
+            # which holds for empty words too
+            totals = numpy.concatenate(([0], numpy.cumsum(self._letterArray[text])))
+            ends = numpy.cumsum(lengths)
+            sums = totals[ends] - totals[ends - lengths]
+            points += numpy.where(lengths >= self._minLength, sums, 0)
+        return points
+
+
+CLASSIC = ScoringRules([0, 0, 0, 1, 1, 2, 3, 5, 11], name="classic")
+BIG = ScoringRules([0, 0, 0, 0, 1, 2, 3, 5, 11], minLength=4, name="big")
+LETTERS = ScoringRules([0], {"A": 1, "B": 3, "C": 3, "D": 2, "E": 1, "F": 4, "G": 2, "H": 4,
+                             "I": 1, "J": 8, "K": 5, "L": 1, "M": 3, "N": 1, "O": 1, "P": 3,
+                             "Q": 10, "R": 1, "S": 1, "T": 1, "U": 1, "V": 4, "W": 4, "X": 8,
+                             "Y": 4, "Z": 10}, name="letters")
+
+RULES = {"classic": CLASSIC, "big": BIG, "super": BIG, "letters": LETTERS}
+
+def getRules(name):
+    """
+    Returns the ScoringRules called name: classic, big, super or letters.
+    Raises ValueError for any other name.
+
+    >>> getRules("big").score("CATS"), getRules("letters").score("QUIT")
+    (1, 13)
+    """
+    if name not in RULES:
+        raise ValueError("unknown scoring rules: {}".format(name))
+    return RULES[name]
+
+
+if __name__ == "__main__":
+    from doctest import testmod
+    testmod()
@@ -0,0 +1,155 @@
+"""
+Compact, append-only recordings of game sessions.
+
+A session log is an 8 byte header (magic, version, rows, cols, minimum
+word length; 0 in logs recorded before it was kept) followed by records.  Each record starts with a one byte kind and the microseconds
+since the previous record (uint32):
+
+    b"S"  seed:  uint16 length, then the seed as UTF-8 text
+    b"B"  board: uint16 length, then the board code (see boardcode.py)
+    b"C"  click: int16 x, int16 y (window coordinates)
+
+A board record is written when the game starts and after every reset, so
+a replay never depends on the random stream.
+"""
+
+import struct
+import time
+
+MAGIC = b"BOGR"
+VERSION = 1
+HEADER = struct.Struct("<4sBBBB")
+_PREFIX = struct.Struct("<cI")
+_LENGTH = struct.Struct("<H")
+_CLICK = struct.Struct("<hh")
+
+SEED = b"S"
+BOARD = b"B"
+CLICK = b"C"
+
+_MAX_DELTA = 0xFFFFFFFF
+
+
+class SessionRecorder:
+    """
+    Appends the events of one game session to a log file.  Every record
+    is flushed as it is written, so a crash loses at most the event being
+    recorded.  minLength is the shortest word the game accepts.
+    """
+
+    __slots__ = ["_file", "_last"]
+
+    def __init__(self, path, rows, cols, seed=None, minLength=3):
+        self._file = open(path, "wb")
+        self._file.write(HEADER.pack(MAGIC, VERSION, rows, cols, minLength))
+        self._last = time.perf_counter_ns()
+        if seed is not None:
+            self.__record(SEED, self.__sized(str(seed).encode("utf-8")))
+
+    def __sized(self, data):
+        return _LENGTH.pack(len(data)) + data
+
+    def __record(self, kind, payload):
+        now = time.perf_counter_ns()
+        delta = min((now - self._last) // 1000, _MAX_DELTA)
+        self._last = now
+        self._file.write(_PREFIX.pack(kind, delta) + payload)
+        self._file.flush()
+
+    def recordBoard(self, code):
+        """Records the letters now on the board, as a board code."""
+        self.__record(BOARD, self.__sized(bytes(code)))
+
+    def recordClick(self, point):
+        """Records a click at point (anything with getX and getY)."""
+        self.__record(CLICK, _CLICK.pack(int(round(point.getX())), int(round(point.getY()))))
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class SessionLog:
+    """
+    Reads a session log.  Iterating yields (kind, seconds, payload) events,
+    where seconds is the time since the previous event and payload is the
+    seed (str), the board code (bytes) or the click (x, y).
+
+    >>> import os, tempfile
+    >>> from headlessboard import Point
+    >>> path = os.path.join(tempfile.mkdtemp(), "session.log")
+    >>> with SessionRecorder(path, 4, 4, seed=7, minLength=4) as recorder:
+    ...     recorder.recordBoard(bytes(range(1, 17)))
+    ...     recorder.recordClick(Point(75, 125))
+    >>> log = SessionLog(path)
+    >>> log.getRows(), log.getCols(), log.getMinLength(), log.getSeed()
+    (4, 4, 4, '7')
+    >>> [(kind, payload) for kind, seconds, payload in log][1:]
+    [(b'B', b'\\x01\\x02\\x03\\x04\\x05\\x06\\x07\\x08\\t\\n\\x0b\\x0c\\r\\x0e\\x0f\\x10'), (b'C', (75, 125))]
+    """
+
+    __slots__ = ["_data", "_rows", "_cols", "_minLength"]
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._data = f.read()
+        if len(self._data) < HEADER.size:
+            raise ValueError("{} is not a session log".format(path))
+        magic, version, self._rows, self._cols, self._minLength = HEADER.unpack_from(self._data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("{} is not a version {} session log".format(path, VERSION))
+
+    def getRows(self):
+        return self._rows
+
+    def getCols(self):
+        return self._cols
+
+    def getMinLength(self):
+        """Returns the shortest word the recorded game accepted."""
+        # older logs left the byte 0, and were all played with 3
+        return self._minLength or 3
+
+    def getSeed(self):
+        """Returns the recorded seed (str), or None."""
+        for kind, seconds, payload in self:
+            if kind == SEED:
+                return payload
+        return None
+
+    def __iter__(self):
+        data = self._data
+        offset = HEADER.size
+        # a record cut short by a crash ends the log
+        while offset + _PREFIX.size <= len(data):
+            kind, delta = _PREFIX.unpack_from(data, offset)
+            offset += _PREFIX.size
+            if kind == CLICK:
+                if offset + _CLICK.size > len(data):
+                    return
+                payload = _CLICK.unpack_from(data, offset)
+                offset += _CLICK.size
+            elif kind in (SEED, BOARD):
+                if offset + _LENGTH.size > len(data):
+                    return
+                (length,) = _LENGTH.unpack_from(data, offset)
+                offset += _LENGTH.size
+                if offset + length > len(data):
+                    return
+                payload = data[offset:offset + length]
+                offset += length
+                if kind == SEED:
+                    payload = payload.decode("utf-8")
+            else:
+                raise ValueError("unknown record kind {!r}".format(kind))
+            yield (kind, delta / 1e6, payload)
+
+
+if __name__ == "__main__":
+    from doctest import testmod
+    testmod()
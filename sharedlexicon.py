@@ -0,0 +1,285 @@
+"""
+A lexicon laid out in one block of shared memory, so worker processes can
+query the parent's lexicon instead of each reading and indexing
+bogwords.txt for itself.
+
+The parent builds the block once with SharedLexicon.create(lexicon).
+A SharedLexicon pickles as just the name of its block, so it can be
+passed straight to pool workers, which attach to the block read-only and
+query it in place, without copying it:
+
+    shared = SharedLexicon.create(LEXICONS.get("bogwords.txt"))
+    with multiprocessing.Pool() as pool:
+        pool.starmap(solve, [(letters, 4, 4, shared) for letters in boards])
+    shared.unlink()
+
+The block is unlinked by unlink(), when the owning SharedLexicon is used
+as a context manager, or when the parent exits.  If the parent is killed
+instead, the multiprocessing resource tracker unlinks it.
+
+The block is a 16 byte header (magic, version, word count, text size)
+followed by the word offsets (uint32, one more than the words), the
+words' ASCII text, the letter masks (uint32) and the words x 26 letter
+counts (uint8), the same index Lexicon builds.
+"""
+
+import atexit
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from multiprocessing import shared_memory
+
+from lexicon import letterIndex, letterMask, boardCounts, prefixRange, query
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+MAGIC = b"BOGL"
+VERSION = 1
+HEADER = struct.Struct("<4sBxxxII")
+
+# this process's SharedLexicons, by block name, so each block is attached once
+_attached = {}
+
+def _align(offset):
+    return (offset + 3) & ~3
+
+def _layout(count, textSize):
+    """Returns the offsets of the word offsets, text, masks and counts, and the total size."""
+    offsets = HEADER.size
+    text = offsets + 4 * (count + 1)
+    masks = _align(text + textSize)
+    counts = masks + 4 * count
+    return (offsets, text, masks, counts, counts + 26 * count)
+
+
+class WordView:
+    """
+    The sorted words of a SharedLexicon, read from shared memory as they
+    are indexed.  Works like a read-only list of str, so bisect and
+    lexicon.prefixRange work on it.
+    """
+
+    __slots__ = ["_offsets", "_text"]
+
+    def __init__(self, offsets, text):
+        self._offsets = offsets
+        self._text = text
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[n] for n in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        return str(self._text[self._offsets[index]:self._offsets[index + 1]], "ascii")
+
+    def __iter__(self):
+        offsets, text = self._offsets, self._text
+        for n in range(len(offsets) - 1):
+            yield str(text[offsets[n]:offsets[n + 1]], "ascii")
+
+
+class SharedLexicon:
+    """
+    A read-only lexicon in shared memory, with the query methods of
+    Lexicon, so the solver takes either.
+
+    >>> from lexicon import Lexicon
+    >>> shared = SharedLexicon.create(Lexicon(["dog", "cat", "cats", "quit"]))
+    >>> worker = SharedLexicon.attach(shared.getName())
+    >>> len(worker), "CAT" in worker, "CA" in worker
+    (4, True, False)
+    >>> worker.getWords()[0:2], worker.prefixRange("CAT")
+    (['CAT', 'CATS'], (0, 2))
+    >>> worker.candidates(["C", "A", "T", "Qu", "I", "O"])
+    ['CAT', 'QUIT']
+    >>> import pickle
+    >>> pickle.loads(pickle.dumps(shared)) is shared
+    True
+    >>> shared.unlink()
+    """
+
+    __slots__ = ["_memory", "_owner", "_words", "_masks", "_counts", "_views"]
+
+    def __init__(self, memory, owner):
+        """Use create() or attach()."""
+        self._memory = memory
+        self._owner = owner
+        buffer = memory.buf
+        magic, version, count, textSize = HEADER.unpack_from(buffer)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("{} is not a version {} shared lexicon".format(memory.name, VERSION))
+        offsetsAt, textAt, masksAt, countsAt, end = _layout(count, textSize)
+        offsets = buffer[offsetsAt:textAt].cast("I")
+        text = buffer[textAt:textAt + textSize]
+        masks = buffer[masksAt:countsAt].cast("I")
+        counts = buffer[countsAt:end]
+        # kept so close() can release them before the block is unmapped
+        self._views = [offsets, text, masks, counts]
+        self._words = WordView(offsets, text)
+        if numpy is not None:
+            self._masks = numpy.frombuffer(masks, dtype=numpy.uint32)
+            self._counts = numpy.frombuffer(counts, dtype=numpy.uint8).reshape(count, 26)
+        else:
+            self._masks = masks
+            self._counts = counts
+        _attached[memory.name] = self
+
+    @classmethod
+    def create(cls, lexicon):
+        """
+        Copies lexicon (a Lexicon, or any sorted list of distinct upper
+        case words) and its letter-count index into a new shared memory
+        block, owned by this process.
+        """
+        words = list(lexicon.getWords() if hasattr(lexicon, "getWords") else lexicon)
+        encoded = [word.encode("ascii") for word in words]
+        offsets = array("I", [0])
+        for word in encoded:
+            offsets.append(offsets[-1] + len(word))
+        masks, rows = letterIndex(words)
+        counts = bytearray()
+        for row in rows:
+            counts.extend(min(count, 255) for count in row)
+        offsetsAt, textAt, masksAt, countsAt, end = _layout(len(words), offsets[-1])
+
+        memory = shared_memory.SharedMemory(create=True, size=max(end, 1))
+        buffer = memory.buf
+        HEADER.pack_into(buffer, 0, MAGIC, VERSION, len(words), offsets[-1])
+        buffer[offsetsAt:textAt] = offsets.tobytes()
+        buffer[textAt:textAt + offsets[-1]] = b"".join(encoded)
+        buffer[masksAt:countsAt] = array("I", masks).tobytes()
+        buffer[countsAt:end] = counts
+        shared = cls(memory, os.getpid())
+        atexit.register(shared.unlink)
+        return shared
+
+    @classmethod
+    def attach(cls, name):
+        """
+        Returns the SharedLexicon in the block called name, attaching to it
+        the first time this process asks.
+        """
+        shared = _attached.get(name)
+        if shared is None:
+            if sys.version_info >= (3, 13):
+                memory = shared_memory.SharedMemory(name=name, track=False)
+            else:
+                memory = shared_memory.SharedMemory(name=name)
+            shared = cls(memory, None)
+        return shared
+
+    def __reduce__(self):
+        # workers attach by name rather than receiving a copy
+        return (SharedLexicon.attach, (self.getName(),))
+
+    def getName(self):
+        """Returns the name of the shared memory block, for attach()."""
+        return self._memory.name
+
+    def getMemoryUsage(self):
+        """Returns the size of the shared memory block in bytes."""
+        return self._memory.size
+
+    def __contains__(self, word):
+        words = self._words
+        n = bisect_left(words, word)
+        return n < len(words) and words[n] == word
+
+    def __len__(self):
+        return len(self._words)
+
+    def __iter__(self):
+        return iter(self._words)
+
+    def getWords(self):
+        """Returns the sorted words, as a read-only WordView."""
+        return self._words
+
+    def prefixRange(self, prefix, lo=0, hi=None):
+        """See Lexicon.prefixRange."""
+        return prefixRange(self._words, prefix, lo, hi)
+
+    def hasPrefix(self, prefix):
+        """Returns True if some word starts with prefix."""
+        lo, hi = self.prefixRange(prefix)
+        return lo < hi
+
+    def query(self, pattern="*", minLength=0, maxLength=None, letters=None, limit=None):
+        """See Lexicon.query."""
+        return query(self._words, pattern, minLength, maxLength, letters, limit)
+
+    def isVectorized(self):
+        """See Lexicon.isVectorized."""
+        return numpy is not None
+
+    def candidateIndexes(self, letters):
+        """See Lexicon.candidateIndexes."""
+        available = boardCounts(letters)
+        boardMask = letterMask(available)
+        if numpy is not None:
+            indexes = numpy.flatnonzero((self._masks & numpy.uint32(~boardMask & 0x3ffffff)) == 0)
+            available = numpy.minimum(numpy.array(available), 255).astype(numpy.uint8)
+            fits = (self._counts[indexes] <= available).all(axis=1)
+            return indexes[fits].tolist()
+        masks, counts = self._masks, self._counts
+        letters = [i for i in range(26) if available[i]]
+        indexes = []
+        for n in range(len(masks)):
+            if masks[n] & ~boardMask:
+                continue
+            row = 26 * n
+            for i in letters:
+                if counts[row + i] > available[i]:
+                    break
+            else:
+                indexes.append(n)
+        return indexes
+
+    def candidates(self, letters):
+        """See Lexicon.candidates."""
+        words = self._words
+        return [words[n] for n in self.candidateIndexes(letters)]
+
+    def close(self):
+        """Detaches this process from the block."""
+        if self._views is None:
+            return
+        _attached.pop(self._memory.name, None)
+        # nothing may still point into the block when it is unmapped
+        self._words = self._masks = self._counts = None
+        for view in self._views:
+            view.release()
+        self._views = None
+        self._memory.close()
+
+    def unlink(self):
+        """
+        Closes and frees the block.  Only the process that created it does
+        so; elsewhere this just closes it.
+        """
+        if self._owner != os.getpid():
+            self.close()
+            return
+        self._owner = None
+        atexit.unregister(self.unlink)
+        self.close()
+        self._memory.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.unlink()
+
+
+if __name__ == "__main__":
+    from doctest import testmod
+    testmod()
@@ -0,0 +1,286 @@
+"""
+Lets spectators watch games live over local TCP connections.
+
+A SpectatorServer subscribes to an EventBus (see events.py) and fans its
+events out to every connected spectator as lines of JSON.  It runs an
+asyncio loop in a thread of its own, so the game loop only hands an event
+over and never waits on a spectator:
+
+  - selections change on every click, so a selection still waiting to be
+    sent is replaced by the next one of the same game;
+  - every spectator has its own bounded queue.  When a slow spectator
+    falls queueSize events behind, its queue is dropped and it is sent the
+    current state of every game instead (board, words, selection), so it
+    catches up without holding anyone else back.
+
+A spectator first receives the state of every game, then the events as
+they happen.  To watch:
+
+    BOGGLE_SPECTATOR_PORT=7777 python3 bogglegame.py
+    python3 spectator.py 7777
+"""
+
+import asyncio
+import os
+import socket
+import sys
+import threading
+from collections import deque
+
+from events import BOARD, SELECT, WORD, OVER, encodeEvent
+from metrics import REGISTRY
+
+_spectators = REGISTRY.gauge("boggle_spectators", "Spectators connected.")
+_sent = REGISTRY.counter("boggle_spectator_events_total", "Events sent to spectators.")
+_resyncs = REGISTRY.counter("boggle_spectator_resyncs_total",
+                            "Times a slow spectator's queue was replaced by the game state.")
+_queued = REGISTRY.gauge("boggle_spectator_queue_depth", "Events queued for all spectators.")
+
+class _Spectator:
+    """The queue of events waiting to be sent to one connection."""
+
+    __slots__ = ["_queue", "_selections", "_maxSize", "_resync", "_ready", "_closed"]
+
+    def __init__(self, maxSize):
+        # each entry is a one item list, so a queued selection can be replaced
+        self._queue = deque()
+        # game -> the entry of its queued selection, while no later event of it is queued
+        self._selections = {}
+        self._maxSize = maxSize
+        # start with the state of every game
+        self._resync = True
+        self._ready = asyncio.Event()
+        self._ready.set()
+        self._closed = False
+
+    def offer(self, event):
+        kind, game = event[0], event[1]
+        if kind == SELECT and game in self._selections:
+            self._selections[game][0] = event
+            return
+        if len(self._queue) >= self._maxSize:
+            self.__drop()
+            self._resync = True
+            _resyncs.inc()
+        elif not self._resync:
+            entry = [event]
+            self._queue.append(entry)
+            _queued.inc()
+            if kind == SELECT:
+                self._selections[game] = entry
+            else:
+                self._selections.pop(game, None)
+        self._ready.set()
+
+    def __drop(self):
+        _queued.dec(len(self._queue))
+        self._queue.clear()
+        self._selections.clear()
+
+    def close(self):
+        self._closed = True
+        self.__drop()
+        self._ready.set()
+
+    async def take(self, state):
+        """
+        Waits for events and returns them, or the events state() returns
+        when this spectator is to catch up.  Returns None once closed.
+        """
+        await self._ready.wait()
+        self._ready.clear()
+        if self._closed:
+            return None
+        if self._resync:
+            self._resync = False
+            return state()
+        events = [entry[0] for entry in self._queue]
+        self.__drop()
+        return events
+
+
+class SpectatorServer:
+    """
+    Serves the events of bus to spectators connecting to host:port (port 0
+    picks a free port; see getPort()).
+
+    >>> from events import EventBus, decodeEvent
+    >>> bus = EventBus()
+    >>> server = SpectatorServer(bus)
+    >>> bus.publish(("board", "1", "03011413", 2, 2))
+    >>> bus.publish(("word", "1", "CAT"))
+    >>> watcher = socket.create_connection(("127.0.0.1", server.getPort()))
+    >>> lines = watcher.makefile("rb")
+    >>> [decodeEvent(lines.readline()) for n in range(2)]
+    [('board', '1', '03011413', 2, 2), ('word', '1', 'CAT')]
+    >>> bus.publish(("select", "1", [0]))
+    >>> bus.publish(("select", "1", [0, 1]))
+    >>> decodeEvent(lines.readline())[2] in ([0], [0, 1])
+    True
+    >>> watcher.close()
+    >>> server.close()
+    """
+
+    __slots__ = ["_bus", "_loop", "_thread", "_server", "_port", "_queueSize", "_lock",
+                 "_pending", "_pendingSelections", "_woken", "_games", "_spectators"]
+
+    def __init__(self, bus, port=0, host="127.0.0.1", queueSize=256):
+        self._bus = bus
+        self._queueSize = queueSize
+        self._lock = threading.Lock()
+        # events handed over by the game thread and not yet fanned out
+        self._pending = []
+        self._pendingSelections = {}
+        self._woken = False
+        # game -> the events that make up its state: its board, words, selection and end
+        self._games = {}
+        self._spectators = set()
+        self._loop = asyncio.new_event_loop()
+        started = threading.Event()
+        failure = []
+        self._thread = threading.Thread(target=self.__run, args=(host, port, started, failure),
+                                        name="spectators", daemon=True)
+        self._thread.start()
+        started.wait()
+        if failure:
+            # say, the port is taken
+            self._thread.join()
+            raise failure[0]
+        bus.subscribe(self.__publish)
+
+    def getPort(self):
+        return self._port
+
+    def getSpectatorCount(self):
+        return len(self._spectators)
+
+    def __run(self, host, port, started, failure):
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._server = self._loop.run_until_complete(asyncio.start_server(self.__serve, host, port))
+        except Exception as error:
+            # handed to the constructor, which raises it
+            failure.append(error)
+            self._loop.close()
+            started.set()
+            return
+        self._port = self._server.sockets[0].getsockname()[1]
+        started.set()
+        self._loop.run_forever()
+        self._server.close()
+        for spectator in self._spectators:
+            spectator.close()
+        # let the connections finish closing
+        tasks = asyncio.all_tasks(self._loop)
+        self._loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        self._loop.close()
+
+    def __publish(self, event):
+        """Hands event over to the server's thread.  Runs in the game's thread."""
+        with self._lock:
+            game = event[1]
+            if event[0] == SELECT and game in self._pendingSelections:
+                self._pending[self._pendingSelections[game]] = event
+                return
+            if event[0] == SELECT:
+                self._pendingSelections[game] = len(self._pending)
+            else:
+                self._pendingSelections.pop(game, None)
+            self._pending.append(event)
+            if self._woken:
+                return
+            self._woken = True
+        self._loop.call_soon_threadsafe(self.__fanOut)
+
+    def __fanOut(self):
+        with self._lock:
+            events = self._pending
+            self._pending = []
+            self._pendingSelections = {}
+            self._woken = False
+        for event in events:
+            self.__remember(event)
+            for spectator in self._spectators:
+                spectator.offer(event)
+
+    def __remember(self, event):
+        """Updates the state kept of event's game."""
+        kind, game = event[0], event[1]
+        if kind == BOARD:
+            self._games[game] = {BOARD: event, WORD: [], SELECT: None, OVER: None}
+        elif game in self._games:
+            state = self._games[game]
+            if kind == WORD:
+                state[WORD].append(event)
+            else:
+                state[kind] = event
+
+    def __state(self):
+        """Returns the events that bring a spectator up to date."""
+        events = []
+        for state in self._games.values():
+            events.append(state[BOARD])
+            events.extend(state[WORD])
+            events.extend(event for event in (state[SELECT], state[OVER]) if event is not None)
+        return events
+
+    async def __serve(self, reader, writer):
+        spectator = _Spectator(self._queueSize)
+        self._spectators.add(spectator)
+        _spectators.inc()
+        # spectators only listen; reading tells when one hangs up
+        watch = asyncio.ensure_future(self.__watch(reader, spectator))
+        try:
+            events = await spectator.take(self.__state)
+            while events is not None:
+                if events:
+                    writer.write(b"".join(encodeEvent(event) for event in events))
+                    _sent.inc(len(events))
+                    await writer.drain()
+                events = await spectator.take(self.__state)
+        except ConnectionError:
+            pass
+        finally:
+            watch.cancel()
+            spectator.close()
+            self._spectators.discard(spectator)
+            _spectators.dec()
+            writer.close()
+
+    async def __watch(self, reader, spectator):
+        try:
+            while await reader.read(1024):
+                pass
+        except ConnectionError:
+            pass
+        spectator.close()
+
+    def close(self):
+        """Disconnects every spectator and stops the server."""
+        self._bus.unsubscribe(self.__publish)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+
+def serveFromEnvironment(bus):
+    """
+    Starts a SpectatorServer for the events of bus on the port
+    BOGGLE_SPECTATOR_PORT, if set.  Returns the server, or None, also if
+    the server cannot start (the game goes on without spectators).
+    """
+    if not os.environ.get("BOGGLE_SPECTATOR_PORT"):
+        return None
+    port = int(os.environ["BOGGLE_SPECTATOR_PORT"])
+    try:
+        return SpectatorServer(bus, port)
+    except OSError as error:
+        print("spectator: cannot serve on port {}: {}".format(port, error), file=sys.stderr)
+        return None
+
+
+if __name__ == "__main__":
+    # print the events of a server on this machine as they come
+    with socket.create_connection(("127.0.0.1", int(sys.argv[1]))) as connection:
+        for line in connection.makefile("rb"):
+            sys.stdout.write(line.decode("utf-8"))
+            sys.stdout.flush()
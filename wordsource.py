@@ -0,0 +1,112 @@
+"""
+Streams words out of word-list files, which may be plain text or gzip,
+bz2 or xz compressed, and merges several sorted lists into one.
+
+Files are read in fixed size chunks, so the raw text of a dictionary is
+never held in memory all at once.  Only playable words are kept, following
+the rules in the README: at least three letters, no capitals, hyphens or
+other non-letters, and every Q followed by a U.
+"""
+
+import bz2
+import gzip
+import heapq
+import lzma
+
+CHUNK_SIZE = 1 << 16
+
+# the first bytes of each compressed format we can read
+_MAGIC = [(b"\x1f\x8b", gzip.open),
+          (b"BZh", bz2.open),
+          (b"\xfd7zXZ\x00", lzma.open)]
+
+def openWordFile(path):
+    """
+    Opens a word-list file for reading bytes, decompressing it on the fly
+    if it is gzip, bz2 or xz compressed (told apart by their magic bytes).
+    """
+    with open(path, "rb") as f:
+        head = f.read(6)
+    for magic, opener in _MAGIC:
+        if head.startswith(magic):
+            return opener(path, "rb")
+    return open(path, "rb")
+
+def isPlayable(word):
+    """
+    Returns True if word (str, as in the file) may be played: at least
+    three lower case letters, with every q followed by a u.
+
+    >>> [isPlayable(w) for w in ["quit", "qat", "ox", "Paris", "x-ray", "cat"]]
+    [True, False, False, False, False, True]
+    """
+    return len(word) >= 3 and word.isalpha() and word.islower() and \
+           word.count("q") == word.count("qu")
+
+def streamWords(path, chunkSize=CHUNK_SIZE):
+    """
+    Yields the playable words (upper case str) of a word-list file with one
+    word per line, in file order, reading chunkSize bytes at a time.
+    """
+    with openWordFile(path) as f:
+        tail = b""
+        while True:
+            chunk = f.read(chunkSize)
+            data = tail + chunk
+            if chunk:
+                # the text after the last newline may continue in the next chunk
+                cut = data.rfind(b"\n") + 1
+                data, tail = data[:cut], data[cut:]
+            # anything that is not ASCII becomes a non-letter, failing isPlayable
+            for word in data.decode("ascii", "replace").splitlines():
+                word = word.strip()
+                # isPlayable, inlined since this runs for every line
+                if len(word) >= 3 and word.isalpha() and word.islower() and \
+                   word.count("q") == word.count("qu"):
+                    yield word.upper()
+            if not chunk:
+                return
+
+class UnsortedError(ValueError):
+    """Raised when a word-list file read as sorted turns out not to be."""
+
+
+def _sortedDistinct(path, words):
+    """
+    Passes the sorted words through without repeats, raising UnsortedError
+    if they turn out to be out of order.
+    """
+    previous = ""
+    for word in words:
+        if word > previous:
+            yield word
+            previous = word
+        elif word < previous:
+            raise UnsortedError("{} is not sorted: {!r} comes after {!r}".format(path, word, previous))
+
+def mergeSources(paths, chunkSize=CHUNK_SIZE):
+    """
+    Yields the playable words of several sorted word-list files as one
+    sorted stream without duplicates.  Raises UnsortedError if a file
+    turns out not to be sorted.
+
+    >>> import os, tempfile, gzip
+    >>> folder = tempfile.mkdtemp()
+    >>> with open(os.path.join(folder, "a.txt"), "w") as f:
+    ...     f.write("cat\\ndog\\nqat\\nquit\\n")
+    17
+    >>> with gzip.open(os.path.join(folder, "b.txt.gz"), "wt") as f:
+    ...     f.write("ant\\nBob\\ncat\\nemu")
+    15
+    >>> list(mergeSources([os.path.join(folder, "a.txt"), os.path.join(folder, "b.txt.gz")]))
+    ['ANT', 'CAT', 'DOG', 'EMU', 'QUIT']
+    """
+    streams = [_sortedDistinct(path, streamWords(path, chunkSize)) for path in paths]
+    if len(streams) == 1:
+        return streams[0]
+    return _sortedDistinct("the merged word lists", heapq.merge(*streams))
+
+
+if __name__ == "__main__":
+    from doctest import testmod
+    testmod()